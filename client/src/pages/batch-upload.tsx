@@ -17,6 +17,11 @@ interface ExtractedBet {
   fileName: string;
   success: boolean;
   error?: string;
+  duplicateOf?: {
+    fileName: string;
+    seenAt: number;
+    sameBatch: boolean;
+  } | null;
   data?: {
     date: string;
     sport: string;
@@ -45,6 +50,7 @@ interface ExtractedBet {
       profit: number;
     };
     profitPercentage: number;
+    fingerprint?: string | null;
   };
 }
 
@@ -96,6 +102,7 @@ export default function BatchUpload() {
   const [extractedBets, setExtractedBets] = useState<ExtractedBet[]>([]);
   const [editableData, setEditableData] = useState<Record<number, EditableBetData>>({});
   const [isProcessing, setIsProcessing] = useState(false);
+  const [progress, setProgress] = useState({ completed: 0, total: 0 });
   const [isCreating, setIsCreating] = useState(false);
   const [isCreatingHouse, setIsCreatingHouse] = useState(false);
   const { toast} = useToast();
@@ -192,6 +199,47 @@ export default function BatchUpload() {
     });
   };
 
+  // Editable data for a successful extraction (supports bet3)
+  const buildEditableData = (bet: ExtractedBet): EditableBetData | null => {
+    if (!bet.success || !bet.data) return null;
+
+    const house1 = findBettingHouse(bet.data.bet1.house);
+    const house2 = findBettingHouse(bet.data.bet2.house);
+    const house3 = bet.data.bet3 ? findBettingHouse(bet.data.bet3.house) : null;
+
+    const editable: EditableBetData = {
+      date: bet.data.date,
+      sport: bet.data.sport,
+      league: bet.data.league,
+      teamA: bet.data.teamA,
+      teamB: bet.data.teamB,
+      profitPercentage: bet.data.profitPercentage.toString(),
+      bet1House: bet.data.bet1.house,
+      bet1HouseId: house1?.id || '',
+      bet1Type: bet.data.bet1.type,
+      bet1Odd: bet.data.bet1.odd.toString(),
+      bet1Stake: bet.data.bet1.stake.toString(),
+      bet1Profit: bet.data.bet1.profit.toString(),
+      bet2House: bet.data.bet2.house,
+      bet2HouseId: house2?.id || '',
+      bet2Type: bet.data.bet2.type,
+      bet2Odd: bet.data.bet2.odd.toString(),
+      bet2Stake: bet.data.bet2.stake.toString(),
+      bet2Profit: bet.data.bet2.profit.toString(),
+    };
+
+    // Add bet3 if it exists (triple bets)
+    if (bet.data.bet3) {
+      editable.bet3House = bet.data.bet3.house;
+      editable.bet3HouseId = house3?.id || '';
+      editable.bet3Type = bet.data.bet3.type;
+      editable.bet3Odd = bet.data.bet3.odd.toString();
+      editable.bet3Stake = bet.data.bet3.stake.toString();
+      editable.bet3Profit = bet.data.bet3.profit.toString();
+    }
+    return editable;
+  };
+
   const processAllPdfs = async () => {
     if (files.length === 0) {
       toast({
@@ -203,6 +251,7 @@ export default function BatchUpload() {
     }
 
     setIsProcessing(true);
+    setProgress({ completed: 0, total: files.length });
     setExtractedBets([]);
     setEditableData({});
 
@@ -212,72 +261,55 @@ export default function BatchUpload() {
         formData.append('files', file);
       });
 
-      const response = await fetch('/api/ocr/process-batch', {
+      // Results stream in (NDJSON) as each PDF finishes, so the first ones can be reviewed right away
+      const response = await fetch('/api/ocr/process-batch-stream', {
         method: 'POST',
         body: formData,
       });
 
-      const result = await response.json();
-
-      if (response.ok && result.success) {
-        setExtractedBets(result.results);
-        
-        // Initialize editable data for successful extractions (supports bet3)
-        const initialEditableData: Record<number, EditableBetData> = {};
-        result.results.forEach((bet: ExtractedBet, index: number) => {
-          if (bet.success && bet.data) {
-            const house1 = findBettingHouse(bet.data.bet1.house);
-            const house2 = findBettingHouse(bet.data.bet2.house);
-            const house3 = bet.data.bet3 ? findBettingHouse(bet.data.bet3.house) : null;
-            
-            initialEditableData[index] = {
-              date: bet.data.date,
-              sport: bet.data.sport,
-              league: bet.data.league,
-              teamA: bet.data.teamA,
-              teamB: bet.data.teamB,
-              profitPercentage: bet.data.profitPercentage.toString(),
-              bet1House: bet.data.bet1.house,
-              bet1HouseId: house1?.id || '',
-              bet1Type: bet.data.bet1.type,
-              bet1Odd: bet.data.bet1.odd.toString(),
-              bet1Stake: bet.data.bet1.stake.toString(),
-              bet1Profit: bet.data.bet1.profit.toString(),
-              bet2House: bet.data.bet2.house,
-              bet2HouseId: house2?.id || '',
-              bet2Type: bet.data.bet2.type,
-              bet2Odd: bet.data.bet2.odd.toString(),
-              bet2Stake: bet.data.bet2.stake.toString(),
-              bet2Profit: bet.data.bet2.profit.toString(),
-            };
-            
-            // Add bet3 if it exists (triple bets)
-            if (bet.data.bet3) {
-              initialEditableData[index].bet3House = bet.data.bet3.house;
-              initialEditableData[index].bet3HouseId = house3?.id || '';
-              initialEditableData[index].bet3Type = bet.data.bet3.type;
-              initialEditableData[index].bet3Odd = bet.data.bet3.odd.toString();
-              initialEditableData[index].bet3Stake = bet.data.bet3.stake.toString();
-              initialEditableData[index].bet3Profit = bet.data.bet3.profit.toString();
-            }
-          }
-        });
-        setEditableData(initialEditableData);
-        
-        const successCount = result.results.filter((r: ExtractedBet) => r.success).length;
-        const failCount = result.results.length - successCount;
-        
-        toast({
-          title: "Processamento concluído",
-          description: `${successCount} PDFs processados com sucesso${failCount > 0 ? `, ${failCount} com erro` : ''}`,
-        });
-      } else {
+      if (!response.ok || !response.body) {
+        const result = await response.json().catch(() => ({}));
         toast({
           title: "Erro no processamento",
           description: result.error || "Erro ao processar PDFs",
           variant: "destructive",
         });
+        return;
+      }
+
+      let received = 0;
+      let successCount = 0;
+      const handleEvent = (event: any) => {
+        if (event.type !== 'result') return;
+        const { type, index, completed, total, queueWaitMs, parseMs, ...bet } = event;
+        const extracted = bet as ExtractedBet;
+        const position = received++;
+        successCount += extracted.success ? 1 : 0;
+
+        setExtractedBets(prev => [...prev, extracted]);
+        const editable = buildEditableData(extracted);
+        if (editable) {
+          setEditableData(prev => ({ ...prev, [position]: editable }));
+        }
+        setProgress({ completed, total });
+      };
+
+      const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+      let pending = '';
+      while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        pending += value;
+        const lines = pending.split('\n');
+        pending = lines.pop()!;
+        lines.filter(line => line.trim()).forEach(line => handleEvent(JSON.parse(line)));
       }
+
+      const failCount = received - successCount;
+      toast({
+        title: "Processamento concluído",
+        description: `${successCount} PDFs processados com sucesso${failCount > 0 ? `, ${failCount} com erro` : ''}`,
+      });
     } catch (error) {
       toast({
         title: "Erro de conexão",
@@ -529,6 +561,8 @@ export default function BatchUpload() {
             body: JSON.stringify({
               surebetSet: surebetSetData,
               bets: betsArray,
+              // Registra a impressão do PDF no histórico de duplicatas só ao salvar
+              source: bet.data?.fingerprint ? { fingerprint: bet.data.fingerprint, fileName: bet.fileName } : undefined,
             }),
           });
 
@@ -678,7 +712,7 @@ export default function BatchUpload() {
             {isProcessing ? (
               <>
                 <Loader2 className="h-4 w-4 mr-2 animate-spin" />
-                Processando {files.length} PDF(s)...
+                Processando {progress.completed}/{progress.total} PDF(s)...
               </>
             ) : (
               <>
@@ -738,6 +772,13 @@ export default function BatchUpload() {
                       <CheckCircle className="h-5 w-5 text-green-600" />
                       <h2 className="text-xl font-semibold">{bet.fileName}</h2>
                       <Badge variant="default">Sucesso</Badge>
+                      {bet.duplicateOf && (
+                        <Badge variant="destructive" data-testid={`badge-duplicate-${index}`}>
+                          {bet.duplicateOf.sameBatch
+                            ? `Duplicado de ${bet.duplicateOf.fileName}`
+                            : `Já importado em ${new Date(bet.duplicateOf.seenAt).toLocaleString('pt-BR')} (${bet.duplicateOf.fileName})`}
+                        </Badge>
+                      )}
                     </div>
 
                     {/* Event Information */}
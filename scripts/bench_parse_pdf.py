@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Benchmark e verificação de precisão do parser de PDFs (server/pdf/parse_pdf.py)
+
+Roda extrair_dados_pdf sobre todos os PDFs de attached_assets/, mede latência
+total e por estágio (percentis), vazão e pico de memória, e compara cada resultado com o JSON
+esperado em scripts/parse_pdf_esperado.json. Mede também a partida a frio: um
+processo novo (python -m parse_pdf) por PDF, como o uso avulso pela linha de comando.
+
+Depois roda o corpus só pelo parser genérico (templates desligados e sem o
+fallback para o pdfplumber) em cada backend e compara com
+scripts/parse_pdf_esperado_generico.json: o caminho genérico depende do texto
+de cada backend, que os templates e o fallback escondem.
+
+A seção "casas" do esperado (mantida à mão, preservada pelo --atualizar) traz
+nomes impressos e a casa/distância que parse_pdf.resolver_casa deve devolver:
+erros de OCR que casam com o catálogo e nomes parecidos que não podem casar.
+
+Uso:
+    python3 scripts/bench_parse_pdf.py                 # benchmark + diff
+    python3 scripts/bench_parse_pdf.py --repeticoes 5  # mais amostras por PDF
+    python3 scripts/bench_parse_pdf.py --atualizar     # regrava o esperado
+    python3 scripts/bench_parse_pdf.py --backend pdfplumber,pdfium  # compara os backends
+"""
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIRETORIO_PARSER = os.path.join(RAIZ, 'server', 'pdf')
+sys.path.insert(0, DIRETORIO_PARSER)
+
+import parse_pdf  # noqa: E402
+
+CORPUS = os.path.join(RAIZ, 'attached_assets')
+ARQUIVO_ESPERADO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parse_pdf_esperado.json')
+SECAO_CASAS = 'casas'
+ARQUIVO_ESPERADO_GENERICO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parse_pdf_esperado_generico.json')
+
+
+def percentil(valores, p):
+    """
+    Percentil por interpolação linear (valores já ordenados)
+    """
+    if not valores:
+        return 0.0
+    posicao = (len(valores) - 1) * p / 100
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(valores) - 1)
+    return valores[inferior] + (valores[superior] - valores[inferior]) * (posicao - inferior)
+
+
+def resumo(nome, amostras_ms):
+    ordenadas = sorted(amostras_ms)
+    return (f"{nome:<16} p50={percentil(ordenadas, 50):8.2f}ms  p90={percentil(ordenadas, 90):8.2f}ms  "
+            f"p99={percentil(ordenadas, 99):8.2f}ms  max={ordenadas[-1] if ordenadas else 0:8.2f}ms")
+
+
+def diferencas(esperado, obtido, prefixo=''):
+    """
+    Lista os campos divergentes entre dois resultados
+    """
+    campos = []
+    for chave in sorted(set(esperado) | set(obtido)):
+        a, b = esperado.get(chave), obtido.get(chave)
+        if isinstance(a, dict) and isinstance(b, dict):
+            campos.extend(diferencas(a, b, f"{prefixo}{chave}."))
+        elif a != b:
+            campos.append(f"{prefixo}{chave}: esperado={a!r} obtido={b!r}")
+    return campos
+
+
+def partidas_a_frio(caminhos, backend, quantidade):
+    """
+    Tempo de parede de processos novos extraindo um PDF cada (import + extração + saída)
+    """
+    ambiente = dict(os.environ, PARSE_PDF_BACKEND=backend)
+    amostras = []
+    for caminho in caminhos[:quantidade]:
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, '-m', 'parse_pdf', caminho], cwd=DIRETORIO_PARSER, env=ambiente,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        amostras.append((time.perf_counter() - inicio) * 1000)
+    return amostras
+
+
+def medir_backend(caminhos, backend, repeticoes, partidas):
+    """
+    Roda o corpus com um backend e imprime o resumo; retorna os resultados por PDF
+    """
+    resultados = {}
+    tempos_total = []
+    tempos_estagios = {}
+    parse_pdf.CONTADORES_TEMPLATE.clear()
+    fallbacks = 0
+    memo = {'hits': 0, 'misses': 0}
+
+    for caminho in caminhos:
+        nome = os.path.basename(caminho)
+        for _ in range(repeticoes):
+            # Silencia o log do parser (PARSE_PDF_LOG) para não distorcer a medição
+            with contextlib.redirect_stderr(io.StringIO()):
+                resultados[nome], tempos = parse_pdf.extrair_dados_pdf_com_tempos(caminho, backend)
+            fallbacks += tempos['backend'] != backend
+            for chave in memo:
+                memo[chave] += tempos['detectarCasaMemo'][chave]
+            tempos_total.append(tempos['totalMs'])
+            for estagio, acumulado in tempos['stages'].items():
+                tempos_estagios.setdefault(estagio, []).append(acumulado['wallMs'])
+    duracao_total = sum(tempos_total) / 1000
+
+    execucoes = len(caminhos) * repeticoes
+    pico_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(f"backend: {backend}  PDFs: {len(caminhos)}  execuções: {execucoes}  fallbacks: {fallbacks}")
+    print(resumo('total', tempos_total))
+    for estagio, amostras in tempos_estagios.items():
+        print(resumo(estagio, amostras))
+    print(f"vazão: {execucoes / duracao_total:.1f} PDFs/s")
+    print(f"pico RSS: {pico_rss_mb:.1f} MB")
+    consultas = memo['hits'] + memo['misses']
+    print(f"memo de casas: {memo['hits']} acertos, {memo['misses']} falhas "
+          f"({100 * memo['hits'] / consultas if consultas else 0:.1f}% de acerto)")
+    print("templates: " + ', '.join(f"{nome}={total}" for nome, total in sorted(parse_pdf.CONTADORES_TEMPLATE.items())))
+    if partidas:
+        print(resumo('partida a frio', partidas_a_frio(caminhos, backend, partidas)))
+    return resultados
+
+
+@contextlib.contextmanager
+def so_parser_generico():
+    """
+    Desliga os templates registrados: todo PDF passa pelo parser genérico
+    """
+    templates = list(parse_pdf.TEMPLATES)
+    parse_pdf.TEMPLATES.clear()
+    try:
+        yield
+    finally:
+        parse_pdf.TEMPLATES[:] = templates
+
+
+def extrair_generico(caminhos, backend):
+    """
+    Resultados do parser genérico com o backend dado, sem o fallback para o pdfplumber
+    """
+    with so_parser_generico(), contextlib.redirect_stderr(io.StringIO()):
+        return {os.path.basename(caminho): parse_pdf._extrair_dados_pdf(caminho, backend) for caminho in caminhos}
+
+
+def atualizar_esperado(resultados, arquivo=ARQUIVO_ESPERADO):
+    resultados = dict(resultados)
+    with contextlib.suppress(OSError, ValueError):
+        with open(arquivo, encoding='utf-8') as f:
+            casas = json.load(f).get(SECAO_CASAS)
+        if casas is not None:
+            resultados[SECAO_CASAS] = casas
+    with open(arquivo, 'w', encoding='utf-8') as f:
+        json.dump(resultados, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+    print(f"Esperado atualizado: {arquivo}")
+
+
+def comparar_com_esperado(resultados, arquivo=ARQUIVO_ESPERADO, rotulo='precisão'):
+    """
+    Imprime os campos divergentes do esperado; retorna quantos PDFs divergiram
+    """
+    with open(arquivo, encoding='utf-8') as f:
+        esperado = json.load(f)
+
+    divergentes = 0
+    for nome in sorted(resultados):
+        if nome not in esperado:
+            print(f"[NOVO] {nome}: sem resultado esperado (rode com --atualizar)")
+            continue
+        campos = diferencas(esperado[nome], resultados[nome])
+        if campos:
+            divergentes += 1
+            print(f"[DIFF] {nome}")
+            for campo in campos:
+                print(f"    {campo}")
+
+    print(f"{rotulo}: {len(resultados) - divergentes}/{len(resultados)} PDFs idênticos ao esperado")
+    return divergentes
+
+
+def comparar_casas():
+    """
+    Confere resolver_casa nos nomes da seção "casas" do esperado; retorna quantos divergiram
+    """
+    with open(ARQUIVO_ESPERADO, encoding='utf-8') as f:
+        casas = json.load(f).get(SECAO_CASAS, {})
+
+    divergentes = 0
+    for impresso, (casa, distancia) in sorted(casas.items()):
+        obtido = parse_pdf.resolver_casa(impresso)
+        if obtido != (casa, distancia):
+            divergentes += 1
+            print(f"[DIFF] casa {impresso!r}: esperado={(casa, distancia)!r} obtido={obtido!r}")
+
+    print(f"casas: {len(casas) - divergentes}/{len(casas)} nomes resolvidos como o esperado")
+    return divergentes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark e precisão do parse_pdf.py')
+    parser.add_argument('--repeticoes', type=int, default=3, help='execuções por PDF (default: 3)')
+    parser.add_argument('--atualizar', action='store_true', help='regrava o JSON esperado com os resultados atuais')
+    parser.add_argument('--corpus', default=CORPUS, help='diretório com os PDFs')
+    parser.add_argument('--partidas', type=int, default=5,
+                        help='processos novos (partida a frio) medidos por backend, 0 desliga (default: 5)')
+    parser.add_argument('--backend', default=parse_pdf.BACKEND_PADRAO,
+                        help=f"backends separados por vírgula ({', '.join(parse_pdf.BACKENDS)}; default: {parse_pdf.BACKEND_PADRAO})")
+    args = parser.parse_args()
+
+    backends = [nome.strip() for nome in args.backend.split(',') if nome.strip()]
+    for nome in backends:
+        if nome not in parse_pdf.BACKENDS:
+            parser.error(f"backend desconhecido ou não instalado: {nome}")
+
+    caminhos = sorted(glob.glob(os.path.join(args.corpus, '*.pdf')))
+    if not caminhos:
+        print(f"Nenhum PDF encontrado em {args.corpus}", file=sys.stderr)
+        sys.exit(1)
+
+    divergentes = 0
+    for indice, backend in enumerate(backends):
+        if indice:
+            print()
+        resultados = medir_backend(caminhos, backend, args.repeticoes, args.partidas)
+        if args.atualizar:
+            # O esperado vem do primeiro backend da lista
+            if indice == 0:
+                atualizar_esperado(resultados)
+            continue
+        divergentes += comparar_com_esperado(resultados)
+
+    if not args.atualizar:
+        print()
+        divergentes += comparar_casas()
+
+    for indice, backend in enumerate(backends):
+        print()
+        print(f"parser genérico: {backend}")
+        resultados = extrair_generico(caminhos, backend)
+        if args.atualizar:
+            if indice == 0:
+                atualizar_esperado(resultados, ARQUIVO_ESPERADO_GENERICO)
+            continue
+        divergentes += comparar_com_esperado(resultados, ARQUIVO_ESPERADO_GENERICO, 'precisão (genérico)')
+
+    if divergentes:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
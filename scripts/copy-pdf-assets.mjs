@@ -1,3 +1,4 @@
+import { spawnSync } from "child_process";
 import { cp, mkdir, stat } from "fs/promises";
 import path from "path";
 import { fileURLToPath } from "url";
@@ -15,8 +16,31 @@ async function main() {
   }
 
   await mkdir(targetDir, { recursive: true });
-  await cp(sourceDir, targetDir, { recursive: true });
+  // O índice de casas (.idx) é gerado abaixo a partir do catálogo copiado,
+  // nunca herdado da pasta de desenvolvimento
+  await cp(sourceDir, targetDir, { recursive: true, filter: (origem) => !origem.endsWith(".idx") });
   console.log(`[copy-pdf-assets] PDFs copiados para ${targetDir}`);
+
+  // Bytecode do parser gerado no build: os workers (python3 -m parse_pdf) não
+  // compilam nada na partida, mesmo com a pasta de deploy somente leitura
+  const compilacao = spawnSync("python3", ["-m", "compileall", "-q", targetDir], { stdio: "inherit" });
+  if (compilacao.status !== 0) {
+    console.warn("[copy-pdf-assets] Não foi possível pré-compilar o parser Python; o bytecode será gerado na primeira execução");
+  }
+
+  // Índice das casas de apostas (casas_apostas.idx, fora do git) gravado pelo
+  // próprio import do módulo: os workers só o carregam, sem recompilar o catálogo
+  const ambiente = { ...process.env };
+  delete ambiente.CASAS_APOSTAS_CATALOGO;
+  delete ambiente.CASAS_APOSTAS_INDICE;
+  const indice = spawnSync(
+    "python3",
+    ["-c", "import os, sys, casas_apostas; sys.exit(not os.path.exists(casas_apostas.ARQUIVO_INDICE))"],
+    { cwd: targetDir, env: ambiente, stdio: "inherit" },
+  );
+  if (indice.status !== 0) {
+    console.warn("[copy-pdf-assets] Não foi possível gerar o índice de casas de apostas; ele será montado na primeira execução");
+  }
 }
 
 main().catch((err) => {
@@ -0,0 +1,147 @@
+import { readFileSync, writeFileSync } from 'fs';
+import { promises as fs } from 'fs';
+
+export interface PdfDuplicateIndexOptions {
+  ttlMs?: number;
+  maxEntries?: number;
+  filePath?: string;
+}
+
+export interface DuplicateMatch {
+  fileName: string;
+  seenAt: number;
+  sameBatch: boolean;
+}
+
+interface IndexEntry {
+  key: string;
+  fileName: string;
+  seenAt: number;
+}
+
+/**
+ * Índice das impressões semânticas (`fingerprint` do parser) por usuário:
+ * acusa a mesma surebet exportada em PDFs diferentes, dentro do lote ou
+ * contra as surebets já salvas. O histórico só recebe a impressão quando a
+ * surebet é gravada (`record`), então reenviar um lote que não foi salvo não
+ * marca nada como importado; as vistas no lote ficam só em memória.
+ * Consulta O(1) em Maps (ordem de inserção = idade); com `filePath` o
+ * histórico também vai para um NDJSON append-only recarregado na inicialização.
+ */
+export class PdfDuplicateIndex {
+  private readonly ttlMs: number;
+  private readonly maxEntries: number;
+  private readonly filePath: string | null;
+  private readonly entries = new Map<string, IndexEntry>();
+  private readonly batchEntries = new Map<string, IndexEntry>();
+  private fileLines = 0;
+
+  constructor(options: PdfDuplicateIndexOptions = {}) {
+    this.ttlMs = options.ttlMs ?? 7 * 24 * 60 * 60 * 1000;
+    this.maxEntries = options.maxEntries ?? 50000;
+    this.filePath = options.filePath ?? null;
+    if (this.filePath) {
+      this.load();
+    }
+  }
+
+  /**
+   * Devolve a surebet já salva ou o PDF anterior do mesmo lote com a mesma
+   * impressão, se houver; senão marca a impressão como vista no lote
+   */
+  check(userId: string, fingerprint: string, fileName: string, batchId: string): DuplicateMatch | null {
+    const key = `${userId}:${fingerprint}`;
+    const saved = this.entries.get(key);
+    if (saved && !this.isExpired(saved)) {
+      return { fileName: saved.fileName, seenAt: saved.seenAt, sameBatch: false };
+    }
+
+    const batchKey = `${batchId}:${key}`;
+    const inBatch = this.batchEntries.get(batchKey);
+    if (inBatch) {
+      return { fileName: inBatch.fileName, seenAt: inBatch.seenAt, sameBatch: true };
+    }
+    this.insert(this.batchEntries, { key: batchKey, fileName, seenAt: Date.now() });
+    return null;
+  }
+
+  /**
+   * Registra no histórico a surebet gravada a partir do PDF
+   * Duplicados não substituem a entrada original
+   */
+  record(userId: string, fingerprint: string, fileName: string): void {
+    const key = `${userId}:${fingerprint}`;
+    const existing = this.entries.get(key);
+    if (existing && !this.isExpired(existing)) {
+      return;
+    }
+    const entry: IndexEntry = { key, fileName, seenAt: Date.now() };
+    this.insert(this.entries, entry);
+    this.append(entry);
+  }
+
+  private insert(entries: Map<string, IndexEntry>, entry: IndexEntry): void {
+    entries.delete(entry.key);
+    entries.set(entry.key, entry);
+    while (entries.size > this.maxEntries) {
+      entries.delete(entries.keys().next().value as string);
+    }
+  }
+
+  private isExpired(entry: IndexEntry): boolean {
+    return Date.now() - entry.seenAt > this.ttlMs;
+  }
+
+  private load(): void {
+    let content: string;
+    try {
+      content = readFileSync(this.filePath!, 'utf8');
+    } catch {
+      return;
+    }
+
+    for (const line of content.split('\n')) {
+      if (!line) {
+        continue;
+      }
+      this.fileLines++;
+      try {
+        const entry: IndexEntry = JSON.parse(line);
+        if (!this.isExpired(entry)) {
+          this.entries.delete(entry.key);
+          this.entries.set(entry.key, entry);
+        }
+      } catch {
+        // Linha truncada por uma parada no meio da escrita
+      }
+    }
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value as string);
+    }
+
+    // Arquivo com muitas linhas vencidas/substituídas: reescreve só as válidas
+    if (this.fileLines > this.entries.size * 2) {
+      this.compact();
+    }
+  }
+
+  private compact(): void {
+    const lines = Array.from(this.entries.values(), entry => JSON.stringify(entry) + '\n');
+    try {
+      writeFileSync(this.filePath!, lines.join(''));
+      this.fileLines = lines.length;
+    } catch (error) {
+      console.warn('Failed to compact PDF duplicate index:', error instanceof Error ? error.message : error);
+    }
+  }
+
+  private append(entry: IndexEntry): void {
+    if (!this.filePath) {
+      return;
+    }
+    this.fileLines++;
+    fs.appendFile(this.filePath, JSON.stringify(entry) + '\n').catch(error => {
+      console.warn('Failed to persist PDF duplicate index entry:', error instanceof Error ? error.message : error);
+    });
+  }
+}
@@ -0,0 +1,215 @@
+import { randomUUID } from 'crypto';
+
+export type JobStatus = 'queued' | 'running' | 'done' | 'failed';
+
+export interface JobProgress {
+  label: string;
+  status: JobStatus;
+  queuedAt: number;
+  startedAt: number | null;
+  finishedAt: number | null;
+  error?: string;
+}
+
+export interface BatchProgress {
+  id: string;
+  userId: string;
+  total: number;
+  queued: number;
+  running: number;
+  done: number;
+  failed: number;
+  jobs: JobProgress[];
+}
+
+export type JobOutcome<T> =
+  | { success: true; value: T }
+  | { success: false; error: Error };
+
+export interface SchedulerTask<T> {
+  label: string;
+  run: () => Promise<T>;
+}
+
+export interface PdfJobSchedulerOptions {
+  concurrency: number;
+  maxQueued?: number;
+  batchRetentionMs?: number;
+}
+
+interface ScheduledJob {
+  userId: string;
+  progress: JobProgress;
+  run: () => Promise<unknown>;
+  settle: (outcome: JobOutcome<unknown>) => void;
+}
+
+interface BatchRecord {
+  id: string;
+  userId: string;
+  jobs: JobProgress[];
+  finishedAt: number | null;
+}
+
+export class QueueFullError extends Error {
+  constructor(readonly queued: number, readonly capacity: number) {
+    super(`PDF queue is full (${queued}/${capacity} jobs waiting)`);
+    this.name = 'QueueFullError';
+  }
+}
+
+/**
+ * Agendador de jobs de parsing de PDF compartilhado por todos os usuários.
+ * Executa no máximo `concurrency` jobs ao mesmo tempo, alterna entre as filas
+ * de cada usuário (round-robin, FIFO dentro do usuário) para que um lote grande
+ * não bloqueie os demais, e recusa novos lotes quando a fila está cheia.
+ */
+export class PdfJobScheduler {
+  readonly concurrency: number;
+  readonly maxQueued: number;
+  private readonly batchRetentionMs: number;
+  private readonly queues = new Map<string, ScheduledJob[]>();
+  private readonly batches = new Map<string, BatchRecord>();
+  private queued = 0;
+  private running = 0;
+
+  constructor(options: PdfJobSchedulerOptions) {
+    this.concurrency = Math.max(1, options.concurrency);
+    this.maxQueued = options.maxQueued ?? 200;
+    this.batchRetentionMs = options.batchRetentionMs ?? 10 * 60 * 1000;
+  }
+
+  /**
+   * Enfileira um lote de tarefas. Lança QueueFullError se não houver espaço
+   * para o lote inteiro. `done` traz os resultados na ordem das tarefas;
+   * `outcomes[i]` resolve assim que a tarefa i termina (para streaming).
+   */
+  submitBatch<T>(userId: string, tasks: SchedulerTask<T>[], batchId: string = randomUUID()): { id: string; outcomes: Promise<JobOutcome<T>>[]; done: Promise<JobOutcome<T>[]> } {
+    if (this.queued + tasks.length > this.maxQueued) {
+      throw new QueueFullError(this.queued, this.maxQueued);
+    }
+
+    this.pruneBatches();
+    if (this.batches.has(batchId)) {
+      batchId = randomUUID();
+    }
+
+    const batch: BatchRecord = { id: batchId, userId, jobs: [], finishedAt: null };
+    this.batches.set(batchId, batch);
+
+    const userQueue = this.queues.get(userId) ?? [];
+    this.queues.set(userId, userQueue);
+
+    const outcomes = tasks.map(task => new Promise<JobOutcome<T>>(resolve => {
+      const progress: JobProgress = {
+        label: task.label,
+        status: 'queued',
+        queuedAt: Date.now(),
+        startedAt: null,
+        finishedAt: null
+      };
+      batch.jobs.push(progress);
+      userQueue.push({
+        userId,
+        progress,
+        run: task.run,
+        settle: resolve as (outcome: JobOutcome<unknown>) => void
+      });
+      this.queued++;
+    }));
+
+    this.pump();
+
+    const done = Promise.all(outcomes).then(results => {
+      batch.finishedAt = Date.now();
+      return results;
+    });
+
+    return { id: batchId, outcomes, done };
+  }
+
+  /** Jobs aguardando na fila (de todos os usuários) */
+  get queuedJobs(): number {
+    return this.queued;
+  }
+
+  getBatchProgress(batchId: string): BatchProgress | null {
+    const batch = this.batches.get(batchId);
+    if (!batch) {
+      return null;
+    }
+
+    const count = (status: JobStatus) => batch.jobs.filter(job => job.status === status).length;
+    return {
+      id: batch.id,
+      userId: batch.userId,
+      total: batch.jobs.length,
+      queued: count('queued'),
+      running: count('running'),
+      done: count('done'),
+      failed: count('failed'),
+      jobs: batch.jobs
+    };
+  }
+
+  private pump(): void {
+    while (this.running < this.concurrency) {
+      const job = this.nextJob();
+      if (!job) {
+        return;
+      }
+      this.start(job);
+    }
+  }
+
+  /** Round-robin: pega o primeiro job do próximo usuário e manda o usuário para o fim da fila */
+  private nextJob(): ScheduledJob | null {
+    for (const [userId, queue] of this.queues) {
+      this.queues.delete(userId);
+      const job = queue.shift();
+      if (queue.length > 0) {
+        this.queues.set(userId, queue);
+      }
+      if (job) {
+        this.queued--;
+        return job;
+      }
+    }
+    return null;
+  }
+
+  private start(job: ScheduledJob): void {
+    this.running++;
+    job.progress.status = 'running';
+    job.progress.startedAt = Date.now();
+
+    Promise.resolve()
+      .then(job.run)
+      .then(
+        value => {
+          job.progress.status = 'done';
+          job.progress.finishedAt = Date.now();
+          job.settle({ success: true, value });
+        },
+        error => {
+          job.progress.status = 'failed';
+          job.progress.finishedAt = Date.now();
+          job.progress.error = error instanceof Error ? error.message : String(error);
+          job.settle({ success: false, error: error instanceof Error ? error : new Error(String(error)) });
+        }
+      )
+      .finally(() => {
+        this.running--;
+        this.pump();
+      });
+  }
+
+  private pruneBatches(): void {
+    const cutoff = Date.now() - this.batchRetentionMs;
+    for (const [id, batch] of this.batches) {
+      if (batch.finishedAt !== null && batch.finishedAt < cutoff) {
+        this.batches.delete(id);
+      }
+    }
+  }
+}
@@ -1,13 +1,51 @@
-import { spawn } from 'child_process';
-import { promises as fs } from 'fs';
 import path from 'path';
 import { fileURLToPath } from 'url';
 import { OCRResult } from '../shared/schema';
+import { PdfWorkerPool, type PoolResponse } from './pdf-worker-pool';
+import { PdfResultCache, computeParserVersion } from './pdf-result-cache';
+import { PdfTimingStats, type HistogramSnapshot } from './pdf-timing-stats';
 
 export class PdfPlumberService {
-  private readonly tempDir = '/tmp';
-  private readonly pythonScript = path.join(path.dirname(fileURLToPath(import.meta.url)), 'pdf', 'parse_pdf.py');
+  private readonly parserDir = path.join(path.dirname(fileURLToPath(import.meta.url)), 'pdf');
+  private readonly pythonScript = path.join(this.parserDir, 'parse_pdf.py');
   private readonly timeout = 30000; // 30 segundos timeout
+  private readonly pool = new PdfWorkerPool({
+    scriptPath: this.pythonScript,
+    size: process.env.PDF_WORKERS ? parseInt(process.env.PDF_WORKERS, 10) : undefined,
+    jobTimeoutMs: this.timeout,
+    maxJobsPerWorker: process.env.PDF_WORKER_MAX_JOBS ? parseInt(process.env.PDF_WORKER_MAX_JOBS, 10) : undefined
+  });
+
+  private readonly cache = new PdfResultCache({
+    parserVersion: computeParserVersion(this.parserDir),
+    maxEntries: process.env.PDF_CACHE_ENTRIES ? parseInt(process.env.PDF_CACHE_ENTRIES, 10) : undefined,
+    ttlMs: process.env.PDF_CACHE_TTL_MS ? parseInt(process.env.PDF_CACHE_TTL_MS, 10) : undefined,
+    diskDir: process.env.PDF_CACHE_DIR || undefined
+  });
+
+  private readonly timingStats = new PdfTimingStats();
+
+  constructor() {
+    this.pool.warmUp();
+  }
+
+  /** Histogramas de tempo por estágio (preenchidos só com PARSE_PDF_TIMINGS=1) */
+  getTimingHistograms(): Record<string, HistogramSnapshot> {
+    return this.timingStats.snapshot();
+  }
+
+  getTemplateHits(): Record<string, number> {
+    return this.timingStats.templates();
+  }
+
+  getHouseMemoStats(): { hits: number; misses: number; hitRate: number | null } {
+    return this.timingStats.houseMemoStats();
+  }
+
+  /** Quantidade de PDFs que podem ser processados em paralelo (um por worker) */
+  get concurrency(): number {
+    return this.pool.size;
+  }
 
   async processDocument(
     fileBuffer: Buffer, 
@@ -28,80 +66,32 @@ export class PdfPlumberService {
       throw new Error('Invalid PDF file: missing PDF signature');
     }
 
+    // Mesmo PDF já processado com esta versão do parser: devolve do cache
+    const cacheKey = this.cache.keyFor(fileBuffer);
+    const cached = await this.cache.get(cacheKey);
+    if (cached) {
+      console.log(`PDF result served from cache: ${filename}`);
+      return cached;
+    }
+
     console.log('Processing application/pdf with pdfplumber');
 
-    // Cria arquivo temporário
-    const tempFilePath = path.join(this.tempDir, `pdf_${Date.now()}_${Math.random().toString(36).substr(2, 9)}.pdf`);
-    
-    try {
-      await fs.writeFile(tempFilePath, fileBuffer);
-      console.log(`Temporary PDF file created: ${tempFilePath}`);
-
-      // Executa script Python
-      const result = await this.executePythonScript(tempFilePath);
-      
-      console.log('pdfplumber Raw Response:', JSON.stringify(result, null, 2));
-
-      return this.validateAndCleanResult(result);
-
-    } finally {
-      // Limpa arquivo temporário
-      try {
-        await fs.unlink(tempFilePath);
-        console.log(`Temporary file cleaned: ${tempFilePath}`);
-      } catch (error) {
-        console.warn(`Failed to clean temporary file: ${tempFilePath}`, error instanceof Error ? error.message : error);
-      }
+    // Os bytes vão direto para o worker no quadro do pedido, sem arquivo temporário nem base64
+    const { result, timings } = await this.executePythonScript(fileBuffer);
+    if (timings) {
+      console.log(`pdfplumber timings for ${filename}: total=${timings.totalMs}ms cpu=${timings.totalCpuMs}ms detectarCasaCalls=${timings.detectarCasaCalls} template=${timings.template ?? '-'} backend=${timings.backend ?? '-'}`, JSON.stringify(timings.stages));
+      this.timingStats.record(timings);
     }
+    
+    console.log('pdfplumber Raw Response:', JSON.stringify(result, null, 2));
+
+    const cleaned = this.validateAndCleanResult(result);
+    await this.cache.set(cacheKey, cleaned);
+    return cleaned;
   }
 
-  private async executePythonScript(pdfPath: string): Promise<any> {
-    return new Promise((resolve, reject) => {
-      const python = spawn('python3', [this.pythonScript, pdfPath], {
-        stdio: ['pipe', 'pipe', 'pipe'],
-        timeout: this.timeout
-      });
-
-      let stdout = '';
-      let stderr = '';
-
-      python.stdout.on('data', (data) => {
-        stdout += data.toString();
-      });
-
-      python.stderr.on('data', (data) => {
-        stderr += data.toString();
-      });
-
-      python.on('close', (code) => {
-        if (stderr) {
-          console.warn('Python script stderr:', stderr);
-        }
-
-        if (code !== 0) {
-          reject(new Error(`Python script exited with code ${code}: ${stderr}`));
-          return;
-        }
-
-        try {
-          const result = JSON.parse(stdout.trim());
-          resolve(result);
-        } catch (error) {
-          const errorMessage = error instanceof Error ? error.message : String(error);
-          reject(new Error(`Failed to parse Python script output: ${errorMessage}\nOutput: ${stdout}`));
-        }
-      });
-
-      python.on('error', (error) => {
-        reject(new Error(`Failed to spawn Python process: ${error.message}`));
-      });
-
-      // Timeout handling
-      setTimeout(() => {
-        python.kill('SIGKILL');
-        reject(new Error(`Python script timeout after ${this.timeout}ms`));
-      }, this.timeout);
-    });
+  private async executePythonScript(fileBuffer: Buffer): Promise<PoolResponse> {
+    return this.pool.run({}, fileBuffer);
   }
 
   private validateAndCleanResult(data: any): OCRResult {
@@ -114,6 +104,7 @@ export class PdfPlumberService {
       teamB: data.teamB || null,
       bet1: {
         house: data.bet1?.house || null,
+        houseMatchDistance: data.bet1?.houseMatchDistance ?? null,
         odd: data.bet1?.odd || null,
         type: data.bet1?.type || null,
         stake: data.bet1?.stake || null,
@@ -121,18 +112,21 @@ export class PdfPlumberService {
       },
       bet2: {
         house: data.bet2?.house || null,
+        houseMatchDistance: data.bet2?.houseMatchDistance ?? null,
         odd: data.bet2?.odd || null,
         type: data.bet2?.type || null,
         stake: data.bet2?.stake || null,
         profit: data.bet2?.profit || null
       },
-      profitPercentage: data.profitPercentage || null
+      profitPercentage: data.profitPercentage || null,
+      fingerprint: data.fingerprint || null
     };
 
     // Add bet3 if it exists (supports triple bets)
     if (data.bet3 && (data.bet3.house || data.bet3.type || data.bet3.odd)) {
       result.bet3 = {
         house: data.bet3.house || null,
+        houseMatchDistance: data.bet3.houseMatchDistance ?? null,
         odd: data.bet3.odd || null,
         type: data.bet3.type || null,
         stake: data.bet3.stake || null,
@@ -0,0 +1,147 @@
+import { createHash } from 'crypto';
+import { readdirSync, readFileSync } from 'fs';
+import { promises as fs } from 'fs';
+import path from 'path';
+import { OCRResult } from '../shared/schema';
+
+export interface PdfResultCacheOptions {
+  parserVersion: string;
+  maxEntries?: number;
+  ttlMs?: number;
+  diskDir?: string;
+  maxDiskEntries?: number;
+}
+
+interface CacheEntry {
+  storedAt: number;
+  result: OCRResult;
+}
+
+/**
+ * Versão do parser derivada do conteúdo dos scripts Python e do catálogo de
+ * casas (.txt): qualquer mudança na lógica de extração ou no catálogo gera uma
+ * nova versão e invalida o cache antigo.
+ */
+export function computeParserVersion(parserDir: string): string {
+  const hash = createHash('sha256');
+  const files = readdirSync(parserDir).filter(name => name.endsWith('.py') || name.endsWith('.txt')).sort();
+  for (const name of files) {
+    hash.update(name);
+    hash.update(readFileSync(path.join(parserDir, name)));
+  }
+  return hash.digest('hex').slice(0, 16);
+}
+
+/**
+ * Cache de resultados de PDFs já processados, indexado pelo SHA-256 dos bytes
+ * mais a versão do parser. Camada em memória (LRU) e camada opcional em disco
+ * (um JSON por PDF), ambas com TTL.
+ */
+export class PdfResultCache {
+  private readonly parserVersion: string;
+  private readonly maxEntries: number;
+  private readonly ttlMs: number;
+  private readonly diskDir: string | null;
+  private readonly maxDiskEntries: number;
+  private readonly memory = new Map<string, CacheEntry>();
+  private diskWrites = 0;
+
+  constructor(options: PdfResultCacheOptions) {
+    this.parserVersion = options.parserVersion;
+    this.maxEntries = options.maxEntries ?? 500;
+    this.ttlMs = options.ttlMs ?? 24 * 60 * 60 * 1000;
+    this.diskDir = options.diskDir ?? null;
+    this.maxDiskEntries = options.maxDiskEntries ?? 5000;
+  }
+
+  keyFor(fileBuffer: Buffer): string {
+    return createHash('sha256').update(this.parserVersion).update(fileBuffer).digest('hex');
+  }
+
+  async get(key: string): Promise<OCRResult | null> {
+    const cached = this.memory.get(key);
+    if (cached) {
+      if (this.isExpired(cached)) {
+        this.memory.delete(key);
+      } else {
+        // Move para o fim do Map (mais recente)
+        this.memory.delete(key);
+        this.memory.set(key, cached);
+        return structuredClone(cached.result);
+      }
+    }
+
+    if (!this.diskDir) {
+      return null;
+    }
+
+    try {
+      const entry: CacheEntry = JSON.parse(await fs.readFile(this.diskPath(key), 'utf8'));
+      if (this.isExpired(entry)) {
+        await fs.unlink(this.diskPath(key)).catch(() => {});
+        return null;
+      }
+      this.remember(key, entry);
+      return structuredClone(entry.result);
+    } catch {
+      return null;
+    }
+  }
+
+  async set(key: string, result: OCRResult): Promise<void> {
+    const entry: CacheEntry = { storedAt: Date.now(), result: structuredClone(result) };
+    this.remember(key, entry);
+
+    if (!this.diskDir) {
+      return;
+    }
+
+    try {
+      await fs.mkdir(this.diskDir, { recursive: true });
+      await fs.writeFile(this.diskPath(key), JSON.stringify(entry));
+      if (++this.diskWrites % 100 === 0) {
+        await this.pruneDisk();
+      }
+    } catch (error) {
+      console.warn('Failed to write PDF result cache entry:', error instanceof Error ? error.message : error);
+    }
+  }
+
+  private remember(key: string, entry: CacheEntry): void {
+    this.memory.delete(key);
+    this.memory.set(key, entry);
+    while (this.memory.size > this.maxEntries) {
+      const oldest = this.memory.keys().next().value as string;
+      this.memory.delete(oldest);
+    }
+  }
+
+  private isExpired(entry: CacheEntry): boolean {
+    return Date.now() - entry.storedAt > this.ttlMs;
+  }
+
+  private diskPath(key: string): string {
+    return path.join(this.diskDir!, `${key}.json`);
+  }
+
+  /** Remove entradas vencidas e, se ainda passar do limite, as mais antigas */
+  private async pruneDisk(): Promise<void> {
+    const dir = this.diskDir!;
+    const names = (await fs.readdir(dir)).filter(name => name.endsWith('.json'));
+    const entries = await Promise.all(names.map(async name => {
+      const stat = await fs.stat(path.join(dir, name)).catch(() => null);
+      return { name, mtimeMs: stat ? stat.mtimeMs : 0 };
+    }));
+    entries.sort((a, b) => a.mtimeMs - b.mtimeMs);
+
+    const cutoff = Date.now() - this.ttlMs;
+    let remaining = entries.length;
+    for (const entry of entries) {
+      if (entry.mtimeMs >= cutoff && remaining <= this.maxDiskEntries) {
+        break;
+      }
+      await fs.unlink(path.join(dir, entry.name)).catch(() => {});
+      remaining--;
+    }
+  }
+}
@@ -0,0 +1,100 @@
+// Limites superiores dos buckets (ms para tempos, unidades para contagens), em escala ~logarítmica
+const BUCKET_BOUNDS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, Infinity];
+
+export interface ParserTimings {
+  totalMs: number;
+  totalCpuMs: number;
+  detectarCasaCalls: number;
+  /** Memo LRU da detecção de casas: acertos/falhas neste PDF e entradas no processo */
+  detectarCasaMemo?: { hits: number; misses: number; entries: number };
+  template?: string;
+  /** Backend de extração que produziu o resultado ("pdfplumber" quando houve fallback) */
+  backend?: string;
+  stages: Record<string, { wallMs: number; cpuMs: number }>;
+  pages: Array<{ page: number; stages: Record<string, { wallMs: number; cpuMs: number }> }>;
+}
+
+export interface HistogramSnapshot {
+  count: number;
+  sum: number;
+  buckets: Array<{ le: number | null; count: number }>;
+}
+
+class Histogram {
+  private readonly counts = new Array<number>(BUCKET_BOUNDS.length).fill(0);
+  private count = 0;
+  private sum = 0;
+
+  observe(value: number): void {
+    this.count++;
+    this.sum += value;
+    const index = BUCKET_BOUNDS.findIndex(bound => value <= bound);
+    this.counts[index]++;
+  }
+
+  snapshot(): HistogramSnapshot {
+    return {
+      count: this.count,
+      sum: Math.round(this.sum * 1000) / 1000,
+      buckets: BUCKET_BOUNDS.map((bound, index) => ({
+        le: Number.isFinite(bound) ? bound : null,
+        count: this.counts[index]
+      }))
+    };
+  }
+}
+
+/**
+ * Agrega os `timings` devolvidos pelo parser (PARSE_PDF_TIMINGS=1) em
+ * histogramas por estágio, para achar onde os PDFs lentos gastam tempo.
+ */
+export class PdfTimingStats {
+  private readonly histograms = new Map<string, Histogram>();
+  private readonly templateHits = new Map<string, number>();
+  private readonly houseMemo = { hits: 0, misses: 0 };
+
+  record(timings: ParserTimings): void {
+    this.observe('total.wallMs', timings.totalMs);
+    this.observe('total.cpuMs', timings.totalCpuMs);
+    this.observe('detectarCasaCalls', timings.detectarCasaCalls);
+    for (const [stage, value] of Object.entries(timings.stages)) {
+      this.observe(`${stage}.wallMs`, value.wallMs);
+      this.observe(`${stage}.cpuMs`, value.cpuMs);
+    }
+    if (timings.template) {
+      this.templateHits.set(timings.template, (this.templateHits.get(timings.template) ?? 0) + 1);
+    }
+    if (timings.detectarCasaMemo) {
+      this.houseMemo.hits += timings.detectarCasaMemo.hits;
+      this.houseMemo.misses += timings.detectarCasaMemo.misses;
+    }
+  }
+
+  /** Acertos/falhas acumulados do memo de detecção de casas (todos os workers) */
+  houseMemoStats(): { hits: number; misses: number; hitRate: number | null } {
+    const total = this.houseMemo.hits + this.houseMemo.misses;
+    return { ...this.houseMemo, hitRate: total ? this.houseMemo.hits / total : null };
+  }
+
+  /** Quantos PDFs cada parser de template atendeu ("generico" = fallback) */
+  templates(): Record<string, number> {
+    return Object.fromEntries(this.templateHits);
+  }
+
+  snapshot(): Record<string, HistogramSnapshot> {
+    const result: Record<string, HistogramSnapshot> = {};
+    for (const [name, histogram] of this.histograms) {
+      result[name] = histogram.snapshot();
+    }
+    return result;
+  }
+
+  private observe(name: string, value: number): void {
+    let histogram = this.histograms.get(name);
+    if (!histogram) {
+      histogram = new Histogram();
+      this.histograms.set(name, histogram);
+    }
+    histogram.observe(value);
+  }
+}
@@ -0,0 +1,283 @@
+import { spawn, type ChildProcess } from 'child_process';
+import path from 'path';
+import os from 'os';
+import type { Readable } from 'stream';
+import { encodeFrame, FrameDecoder } from './pdf-worker-protocol';
+
+export interface PdfWorkerPoolOptions {
+  scriptPath: string;
+  size?: number;
+  jobTimeoutMs?: number;
+  maxJobsPerWorker?: number;
+}
+
+export interface PoolResponse {
+  result: any;
+  timings: any | null;
+}
+
+interface PoolJob {
+  id: number;
+  message: Record<string, unknown>;
+  data?: Buffer;
+  resolve: (response: PoolResponse) => void;
+  reject: (error: Error) => void;
+}
+
+interface PoolWorker {
+  process: ChildProcess;
+  job: PoolJob | null;
+  timer: NodeJS.Timeout | null;
+  jobsDone: number;
+  decoder: FrameDecoder;
+  logBuffer: string;
+  retiring: boolean;
+}
+
+/**
+ * PDF abortado pelo governador de recursos do parser (CPU, tempo, memória ou
+ * tamanho da 1ª página). O worker continua vivo; `limit` diz qual teto estourou.
+ */
+export class PdfLimitExceededError extends Error {
+  constructor(readonly limit: string, readonly max: number, message: string) {
+    super(message);
+    this.name = 'PdfLimitExceededError';
+  }
+}
+
+const LOG_LEVELS: Record<string, 'log' | 'warn' | 'error'> = { debug: 'log', info: 'log', aviso: 'warn', erro: 'error' };
+
+/**
+ * Pool de processos `parse_pdf.py --worker` mantidos aquecidos.
+ * Cada worker processa um PDF por vez; pedidos vão pelo stdin e respostas
+ * voltam pelo fd 3, em quadros com tamanho prefixado (pdf-worker-protocol).
+ * O stderr traz só os registros de log estruturados (PARSE_PDF_LOG).
+ * Workers que travam são mortos no timeout, workers que caem são
+ * substituídos e todos são reciclados após N jobs.
+ */
+export class PdfWorkerPool {
+  private readonly scriptPath: string;
+  readonly size: number;
+  private readonly jobTimeoutMs: number;
+  private readonly maxJobsPerWorker: number;
+  private readonly workers: PoolWorker[] = [];
+  private readonly queue: PoolJob[] = [];
+  private nextJobId = 1;
+  private shuttingDown = false;
+
+  constructor(options: PdfWorkerPoolOptions) {
+    this.scriptPath = options.scriptPath;
+    this.size = Math.max(1, options.size ?? Math.min(os.cpus().length, 4));
+    this.jobTimeoutMs = options.jobTimeoutMs ?? 30000;
+    this.maxJobsPerWorker = options.maxJobsPerWorker ?? 200;
+  }
+
+  /** Sobe todos os workers antecipadamente para evitar o custo de import no primeiro PDF */
+  warmUp(): void {
+    while (!this.shuttingDown && this.activeWorkers() < this.size) {
+      this.spawnWorker();
+    }
+  }
+
+  /** `data` segue como bytes crus no quadro do pedido (ex.: o PDF) */
+  run(message: Record<string, unknown>, data?: Buffer): Promise<PoolResponse> {
+    if (this.shuttingDown) {
+      return Promise.reject(new Error('PDF worker pool is shutting down'));
+    }
+
+    return new Promise((resolve, reject) => {
+      this.queue.push({ id: this.nextJobId++, message, data, resolve, reject });
+      this.dispatch();
+    });
+  }
+
+  async shutdown(): Promise<void> {
+    this.shuttingDown = true;
+    for (const job of this.queue.splice(0)) {
+      job.reject(new Error('PDF worker pool is shutting down'));
+    }
+    for (const worker of this.workers) {
+      this.retireWorker(worker);
+    }
+  }
+
+  private activeWorkers(): number {
+    return this.workers.filter(w => !w.retiring).length;
+  }
+
+  private dispatch(): void {
+    while (this.queue.length > 0) {
+      let worker = this.workers.find(w => !w.job && !w.retiring);
+      if (!worker) {
+        if (this.activeWorkers() >= this.size) {
+          return;
+        }
+        worker = this.spawnWorker();
+      }
+
+      const job = this.queue.shift()!;
+      this.startJob(worker, job);
+    }
+  }
+
+  private spawnWorker(): PoolWorker {
+    // Com "-m" o parse_pdf vem do bytecode em __pycache__; rodado como script o .py
+    // seria recompilado a cada worker criado
+    const child = spawn('python3', ['-m', path.basename(this.scriptPath, '.py'), '--worker', '--fd-resposta', '3'], {
+      cwd: path.dirname(this.scriptPath),
+      stdio: ['pipe', 'pipe', 'pipe', 'pipe']
+    });
+
+    const worker: PoolWorker = {
+      process: child,
+      job: null,
+      timer: null,
+      jobsDone: 0,
+      decoder: new FrameDecoder(),
+      logBuffer: '',
+      retiring: false
+    };
+
+    (child.stdio[3] as Readable).on('data', (chunk: Buffer) => {
+      let frames;
+      try {
+        frames = worker.decoder.push(chunk);
+      } catch (error) {
+        // Quadro corrompido: o stream perdeu o alinhamento, descarta o worker
+        console.error(`[pdf-worker ${child.pid}] Invalid response frame: ${error instanceof Error ? error.message : error}`);
+        this.killWorker(worker);
+        return;
+      }
+      for (const frame of frames) {
+        this.handleMessage(worker, frame.message);
+      }
+    });
+
+    child.stdin!.on('error', (error) => {
+      // EPIPE quando o processo morre; a falha é tratada no evento 'exit'
+      console.warn(`[pdf-worker ${child.pid}] stdin error: ${error.message}`);
+    });
+
+    // Saída solta de bibliotecas não interfere nas respostas (que vão pelo fd 3)
+    child.stdout!.setEncoding('utf8');
+    child.stdout!.on('data', (chunk: string) => {
+      console.warn(`[pdf-worker ${child.pid}] stdout: ${chunk.trimEnd()}`);
+    });
+
+    child.stderr!.setEncoding('utf8');
+    child.stderr!.on('data', (chunk: string) => {
+      worker.logBuffer += chunk;
+      const lines = worker.logBuffer.split('\n');
+      worker.logBuffer = lines.pop()!;
+      for (const line of lines) {
+        this.handleLogLine(worker, line);
+      }
+    });
+
+    child.on('error', (error) => {
+      console.error(`[pdf-worker ${child.pid ?? '?'}] Failed to spawn Python process: ${error.message}`);
+      this.handleExit(worker, error);
+    });
+
+    child.on('exit', (code, signal) => {
+      this.handleExit(worker, new Error(`Python worker exited with code ${code}${signal ? ` (${signal})` : ''}`));
+    });
+
+    this.workers.push(worker);
+    return worker;
+  }
+
+  private startJob(worker: PoolWorker, job: PoolJob): void {
+    worker.job = job;
+    worker.timer = setTimeout(() => {
+      // Worker travado: descarta o processo inteiro, o job falha sozinho
+      this.killWorker(worker);
+      this.finishJob(worker)?.reject(new Error(`Python script timeout after ${this.jobTimeoutMs}ms`));
+    }, this.jobTimeoutMs);
+
+    worker.process.stdin!.write(encodeFrame({ id: job.id, ...job.message }, job.data));
+  }
+
+  private finishJob(worker: PoolWorker): PoolJob | null {
+    const job = worker.job;
+    if (worker.timer) {
+      clearTimeout(worker.timer);
+      worker.timer = null;
+    }
+    worker.job = null;
+    return job;
+  }
+
+  private handleMessage(worker: PoolWorker, message: any): void {
+    if (!worker.job || message.id !== worker.job.id) {
+      return;
+    }
+
+    const job = this.finishJob(worker)!;
+    worker.jobsDone++;
+
+    if (message.ok) {
+      job.resolve({ result: message.result, timings: message.timings ?? null });
+    } else if (message.limitExceeded) {
+      const { limit, max, message: detail } = message.limitExceeded;
+      job.reject(new PdfLimitExceededError(limit, max, `PDF exceeds parser limit (${limit}): ${detail}`));
+    } else {
+      job.reject(new Error(`Python worker failed: ${message.error}`));
+    }
+
+    if (worker.jobsDone >= this.maxJobsPerWorker) {
+      this.retireWorker(worker);
+      this.warmUp();
+    }
+    this.dispatch();
+  }
+
+  /** Registros JSON do log do parser; linhas fora do formato (tracebacks) vão como aviso */
+  private handleLogLine(worker: PoolWorker, line: string): void {
+    if (!line.trim()) {
+      return;
+    }
+    let record: any = null;
+    try {
+      record = JSON.parse(line);
+    } catch {
+      // Não é um registro estruturado
+    }
+    if (record && typeof record.nivel === 'string') {
+      const { nivel, evento, ts, ...fields } = record;
+      console[LOG_LEVELS[nivel] ?? 'warn'](`[pdf-worker ${worker.process.pid}] ${nivel} ${evento}`, JSON.stringify(fields));
+    } else {
+      console.warn(`[pdf-worker ${worker.process.pid}] ${line}`);
+    }
+  }
+
+  private retireWorker(worker: PoolWorker): void {
+    worker.retiring = true;
+    worker.process.stdin!.end();
+  }
+
+  /**
+   * Mata o processo na hora. O worker fica marcado como saindo até o evento 'exit':
+   * sem isso, dispatch() entregaria o próximo job a um processo que já está morrendo
+   */
+  private killWorker(worker: PoolWorker): void {
+    worker.retiring = true;
+    worker.process.kill('SIGKILL');
+  }
+
+  private handleExit(worker: PoolWorker, error: Error): void {
+    const index = this.workers.indexOf(worker);
+    if (index < 0) {
+      return;
+    }
+    this.workers.splice(index, 1);
+
+    // Worker caiu no meio de um job: falha apenas esse job
+    this.finishJob(worker)?.reject(error);
+
+    // Substituto é criado sob demanda para evitar loop de respawn se o Python estiver quebrado
+    if (!this.shuttingDown) {
+      this.dispatch();
+    }
+  }
+}
@@ -0,0 +1,71 @@
+// Cabeçalho de cada quadro: tamanho do JSON e tamanho dos dados binários (uint32 big-endian)
+const HEADER_SIZE = 8;
+
+export interface Frame {
+  message: any;
+  data: Buffer;
+}
+
+/**
+ * Quadro do protocolo do worker (`parse_pdf.py --worker`): cabeçalho de 8
+ * bytes, JSON compacto e dados binários opcionais (os bytes do PDF no pedido).
+ */
+export function encodeFrame(message: Record<string, unknown>, data: Buffer = Buffer.alloc(0)): Buffer {
+  const body = Buffer.from(JSON.stringify(message), 'utf8');
+  const header = Buffer.allocUnsafe(HEADER_SIZE);
+  header.writeUInt32BE(body.length, 0);
+  header.writeUInt32BE(data.length, 4);
+  return Buffer.concat([header, body, data], HEADER_SIZE + body.length + data.length);
+}
+
+/**
+ * Remonta quadros a partir dos pedaços lidos do pipe. Os pedaços ficam em uma
+ * lista até completar um quadro; só então são copiados para um Buffer único,
+ * sem concatenação de strings nem busca por delimitadores.
+ */
+export class FrameDecoder {
+  private chunks: Buffer[] = [];
+  private buffered = 0;
+
+  push(chunk: Buffer): Frame[] {
+    this.chunks.push(chunk);
+    this.buffered += chunk.length;
+
+    const frames: Frame[] = [];
+    while (this.buffered >= HEADER_SIZE) {
+      const header = this.peek(HEADER_SIZE);
+      const bodySize = header.readUInt32BE(0);
+      const dataSize = header.readUInt32BE(4);
+      const frameSize = HEADER_SIZE + bodySize + dataSize;
+      if (this.buffered < frameSize) {
+        break;
+      }
+
+      const frame = this.take(frameSize);
+      frames.push({
+        message: JSON.parse(frame.toString('utf8', HEADER_SIZE, HEADER_SIZE + bodySize)),
+        data: frame.subarray(HEADER_SIZE + bodySize)
+      });
+    }
+    return frames;
+  }
+
+  private peek(size: number): Buffer {
+    if (this.chunks[0].length < size) {
+      this.chunks = [Buffer.concat(this.chunks, this.buffered)];
+    }
+    return this.chunks[0];
+  }
+
+  private take(size: number): Buffer {
+    const joined = this.peek(size);
+    const frame = joined.subarray(0, size);
+    const rest = joined.subarray(size);
+    this.chunks[0] = rest;
+    if (rest.length === 0) {
+      this.chunks.shift();
+    }
+    this.buffered -= size;
+    return frame;
+  }
+}
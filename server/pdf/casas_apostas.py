@@ -0,0 +1,394 @@
+"""
+Catálogo de casas de apostas e índice de busca pré-compilado
+
+As casas ficam em casas_apostas.txt (uma por linha). O índice é um autômato
+Aho-Corasick sobre uma palavra-chave obrigatória de cada casa, que seleciona
+as candidatas presentes na linha em uma única passada; só essas candidatas
+passam pela verificação exata (word boundaries, sufixos entre parênteses).
+
+O índice montado é serializado com marshal em casas_apostas.idx e carregado
+direto na importação. Ele guarda o hash do catálogo e deste módulo: se algum
+dos dois mudar, é recompilado e regravado sozinho.
+
+Nomes impressos com erro (OCR, digitação, espaços) são resolvidos por
+resolver_casa_aproximada, que devolve a casa canônica mais próxima e a
+distância de edição até ela.
+"""
+import hashlib
+import marshal
+import os
+import re
+
+_DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+ARQUIVO_CATALOGO = os.environ.get('CASAS_APOSTAS_CATALOGO', os.path.join(_DIRETORIO, 'casas_apostas.txt'))
+ARQUIVO_INDICE = os.environ.get('CASAS_APOSTAS_INDICE', os.path.splitext(ARQUIVO_CATALOGO)[0] + '.idx')
+
+def _construir_automato(chaves):
+    """
+    Monta um autômato Aho-Corasick sobre as chaves
+    Retorna (transicoes, falhas, saidas) indexados por estado
+    """
+    transicoes = [{}]
+    saidas = [[]]
+    for indice, chave in enumerate(chaves):
+        estado = 0
+        for char in chave:
+            proximo = transicoes[estado].get(char)
+            if proximo is None:
+                proximo = len(transicoes)
+                transicoes[estado][char] = proximo
+                transicoes.append({})
+                saidas.append([])
+            estado = proximo
+        saidas[estado].append(indice)
+
+    # Calcula links de falha em largura (BFS)
+    falhas = [0] * len(transicoes)
+    fila = list(transicoes[0].values())
+    for estado in fila:
+        for char, proximo in transicoes[estado].items():
+            fila.append(proximo)
+            falha = falhas[estado]
+            while falha and char not in transicoes[falha]:
+                falha = falhas[falha]
+            falhas[proximo] = transicoes[falha].get(char, 0)
+            saidas[proximo] = saidas[proximo] + saidas[falhas[proximo]]
+
+    return transicoes, falhas, saidas
+
+
+def _chave_obrigatoria(casa_lower):
+    """
+    Escolhe um trecho que obrigatoriamente aparece na linha quando a casa casa
+    """
+    if ' (' in casa_lower:
+        # Todas as palavras do nome base precisam estar presentes: usa a mais longa
+        nome_base = casa_lower.split(' (', 1)[0]
+        return max(nome_base.split(), key=len)
+    if '(' in casa_lower:
+        return casa_lower
+    # Sem parênteses o regex é a primeira palavra literal seguida de \s* + resto
+    return casa_lower.split(' ', 1)[0]
+
+
+def _preparar_casa(casa):
+    """
+    Pré-calcula os dados de verificação exata de uma casa
+    """
+    casa_lower = casa.lower()
+    if '(' in casa_lower:
+        if ' (' in casa_lower:
+            nome_base, sufixo = casa_lower.split(' (', 1)
+            return ('sufixo', nome_base.split(), '(' + sufixo)
+        return ('literal', casa_lower, None)
+    casa_pattern = re.escape(casa_lower).replace(r'\ ', r'\s*')
+    return ('regex', r'\b' + casa_pattern + r'\b', None)
+
+
+def _casas_do_catalogo(conteudo):
+    """
+    Casas do catálogo (bytes do .txt), ignorando linhas vazias e comentários
+    """
+    return [linha.strip() for linha in conteudo.decode('utf-8').splitlines()
+            if linha.strip() and not linha.lstrip().startswith('#')]
+
+
+def construir_indice(casas):
+    """
+    Monta todas as estruturas de busca a partir da lista de casas
+    Só usa tipos suportados pelo marshal (listas, dicts, tuplas, sets, str, int)
+    """
+    # Ordena casas por especificidade (mais específicas primeiro)
+    ordenadas = sorted(casas, key=lambda x: (-len(x), '(' not in x))
+
+    chaves = {}
+    for posicao, casa in enumerate(ordenadas):
+        chaves.setdefault(_chave_obrigatoria(casa.lower()), []).append(posicao)
+    lista_chaves = list(chaves)
+    transicoes, falhas, saidas = _construir_automato(lista_chaves)
+
+    # Prefixos (sem sufixo entre parênteses) de todas as casas, para detectar fragmentos
+    prefixos = set()
+    for casa in casas:
+        casa_limpa = casa.split('(')[0].strip().lower()
+        for fim in range(1, len(casa_limpa) + 1):
+            prefixos.add(casa_limpa[:fim])
+
+    return {
+        'casas': casas,
+        'ordenadas': ordenadas,
+        'verificacoes': [_preparar_casa(casa) for casa in ordenadas],
+        'candidatas_por_chave': [chaves[chave] for chave in lista_chaves],
+        'transicoes': transicoes,
+        'falhas': falhas,
+        'saidas': saidas,
+        'prefixos': prefixos,
+    }
+
+
+def _assinatura(conteudo_catalogo):
+    """
+    Identifica o índice: muda se o catálogo ou o código que monta o índice mudar
+    """
+    with open(os.path.abspath(__file__), 'rb') as f:
+        codigo = f.read()
+    return hashlib.sha256(codigo + b'\0' + conteudo_catalogo).hexdigest()
+
+
+def carregar_indice():
+    """
+    Carrega o índice serializado se ele corresponder ao catálogo atual; senão
+    recompila a partir do catálogo e tenta regravar (falha de escrita não é fatal)
+    """
+    with open(ARQUIVO_CATALOGO, 'rb') as f:
+        conteudo = f.read()
+    assinatura = _assinatura(conteudo)
+
+    try:
+        # loads(read()) é bem mais rápido que marshal.load(f), que lê o arquivo aos pedaços
+        with open(ARQUIVO_INDICE, 'rb') as f:
+            salvo = marshal.loads(f.read())
+        if salvo.get('assinatura') == assinatura:
+            return salvo['indice']
+    except (OSError, EOFError, ValueError, TypeError, AttributeError):
+        pass
+
+    indice = construir_indice(_casas_do_catalogo(conteudo))
+    temporario = f"{ARQUIVO_INDICE}.{os.getpid()}.tmp"
+    try:
+        with open(temporario, 'wb') as f:
+            f.write(marshal.dumps({'assinatura': assinatura, 'indice': indice}))
+        os.replace(temporario, ARQUIVO_INDICE)
+    except OSError:
+        try:
+            os.remove(temporario)
+        except OSError:
+            pass
+    return indice
+
+
+_INDICE = carregar_indice()
+CASAS_SISTEMA = _INDICE['casas']
+_CASAS_ORDENADAS = _INDICE['ordenadas']
+_VERIFICACOES = _INDICE['verificacoes']
+_CANDIDATAS_POR_CHAVE = _INDICE['candidatas_por_chave']
+_TRANSICOES = _INDICE['transicoes']
+_FALHAS = _INDICE['falhas']
+_SAIDAS = _INDICE['saidas']
+_PREFIXOS_CASAS = _INDICE['prefixos']
+_REGEX_COMPILADOS = {}
+
+
+def _candidatas(linha_lower):
+    """
+    Percorre a linha uma vez no autômato e retorna as posições (em ordem de
+    especificidade) das casas cuja palavra-chave aparece na linha
+    """
+    transicoes = _TRANSICOES
+    falhas = _FALHAS
+    saidas = _SAIDAS
+    encontradas = set()
+    estado = 0
+    for char in linha_lower:
+        while estado and char not in transicoes[estado]:
+            estado = falhas[estado]
+        estado = transicoes[estado].get(char, 0)
+        if saidas[estado]:
+            encontradas.update(saidas[estado])
+
+    posicoes = []
+    for indice_chave in encontradas:
+        posicoes.extend(_CANDIDATAS_POR_CHAVE[indice_chave])
+    posicoes.sort()
+    return posicoes
+
+
+def _verificar(posicao, linha_lower):
+    """
+    Verificação exata de uma casa candidata (mesma regra da busca linear)
+    """
+    tipo, dado, sufixo = _VERIFICACOES[posicao]
+    if tipo == 'sufixo':
+        # Permite que estejam separados (ex: "Super...Bet (BR)")
+        if not all(palavra in linha_lower for palavra in dado) or sufixo not in linha_lower:
+            return False
+        # Verifica ordem aproximada: primeira palavra antes do sufixo
+        return linha_lower.find(dado[0]) < linha_lower.find(sufixo)
+    if tipo == 'literal':
+        return dado in linha_lower
+    regex = _REGEX_COMPILADOS.get(posicao)
+    if regex is None:
+        regex = _REGEX_COMPILADOS[posicao] = re.compile(dado)
+    return regex.search(linha_lower) is not None
+
+
+def buscar_casa_conhecida(linha):
+    """
+    Retorna a casa mais específica do catálogo presente na linha, ou None
+    """
+    linha_lower = linha.lower()
+    for posicao in _candidatas(linha_lower):
+        if _verificar(posicao, linha_lower):
+            return _CASAS_ORDENADAS[posicao]
+    return None
+
+
+def eh_inicio_de_casa(palavra):
+    """
+    Verifica se a palavra é o início do nome de alguma casa (ex: "Cloud" -> CloudBet)
+    """
+    return palavra.lower() in _PREFIXOS_CASAS
+
+
+# === BUSCA APROXIMADA (nome impresso com erro de OCR/digitação) ===
+# Índice de deleções simétricas (SymSpell): o nome normalizado de cada casa do
+# catálogo, sem o sufixo entre parênteses ("(BR)", "(Saba)"), é indexado por ele
+# mesmo e pelas variantes com até distancia_maxima caracteres removidos (1 nos
+# nomes médios e curtos, 2 nos longos), sempre seguidas do sufixo: o sufixo
+# nunca é editado e só casa com o mesmo sufixo (ou com a falta dele). Uma
+# consulta gera as variantes dela e só as casas que compartilham alguma passam
+# pelo cálculo da distância. Montado na primeira busca que falha no exato.
+_NOMES_NORMALIZADOS = None
+_DELECOES = None
+
+REGEX_SUFIXO_CASA = re.compile(r'^(.*?)(\([^()]*\))?$')
+
+
+def normalizar_nome_casa(nome):
+    """
+    Chave de comparação: minúsculas e sem espaços ("Super Bet (BR)" -> "superbet(br)")
+    """
+    return ''.join(nome.lower().split())
+
+
+def separar_sufixo(chave):
+    """
+    Nome normalizado e sufixo entre parênteses ("bet365(au)" -> ("bet365", "(au)"))
+    Sem sufixo, o segundo item é ''
+    """
+    nome, sufixo = REGEX_SUFIXO_CASA.match(chave).groups()
+    return nome, sufixo or ''
+
+
+def distancia_maxima(nome):
+    """
+    Distância tolerada pelo tamanho do nome sem o sufixo: curtos só casam
+    exatamente (evita "Bet" virar "Bwin", "BetX" virar "Bet4", "Mr Bet" virar
+    "BrBet"), médios aceitam 1 erro e longos 2
+    """
+    if len(nome) <= 5:
+        return 0
+    if len(nome) <= 8:
+        return 1
+    return 2
+
+
+def _delecoes(chave, profundidade):
+    """
+    A própria chave e as variantes com até `profundidade` caracteres removidos
+    """
+    variantes = {chave}
+    fronteira = {chave}
+    for _ in range(profundidade):
+        fronteira = {palavra[:i] + palavra[i + 1:] for palavra in fronteira for i in range(len(palavra))}
+        variantes |= fronteira
+    return variantes
+
+
+def _montar_indice_aproximado():
+    global _NOMES_NORMALIZADOS, _DELECOES
+    nomes = {}
+    delecoes = {}
+    # Percorre em ordem de especificidade: a primeira casa de cada chave é a preferida
+    for posicao, casa in enumerate(_CASAS_ORDENADAS):
+        chave = normalizar_nome_casa(casa)
+        if chave in nomes:
+            continue
+        nomes[chave] = posicao
+        nome, sufixo = separar_sufixo(chave)
+        for variante in _delecoes(nome, max(1, distancia_maxima(nome))):
+            delecoes.setdefault(variante + sufixo, []).append(posicao)
+    _NOMES_NORMALIZADOS = nomes
+    _DELECOES = delecoes
+
+
+def distancia_edicao(a, b, limite):
+    """
+    Distância de Damerau-Levenshtein (transposições adjacentes contam 1) entre a e b
+    Retorna limite + 1 assim que a distância certamente passar do limite
+    """
+    if abs(len(a) - len(b)) > limite:
+        return limite + 1
+    anterior2 = None
+    anterior = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        atual = [i] + [0] * len(b)
+        menor = i
+        for j in range(1, len(b) + 1):
+            custo = a[i - 1] != b[j - 1]
+            valor = min(anterior[j] + 1, atual[j - 1] + 1, anterior[j - 1] + custo)
+            if (anterior2 is not None and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                valor = min(valor, anterior2[j - 2] + 1)
+            atual[j] = valor
+            menor = min(menor, valor)
+        if menor > limite:
+            return limite + 1
+        anterior2, anterior = anterior, atual
+    return anterior[-1]
+
+
+def preparar_indices():
+    """
+    Monta de uma vez o que as buscas montariam sob demanda (regex de verificação
+    de todas as casas e o índice aproximado); usado antes de um fork, para os
+    processos filhos compartilharem essas estruturas em vez de cada um montar a sua
+    """
+    for posicao, (tipo, dado, _) in enumerate(_VERIFICACOES):
+        if tipo == 'regex' and posicao not in _REGEX_COMPILADOS:
+            _REGEX_COMPILADOS[posicao] = re.compile(dado)
+    if _NOMES_NORMALIZADOS is None:
+        _montar_indice_aproximado()
+
+
+def resolver_casa_aproximada(nome):
+    """
+    Casa canônica do catálogo mais próxima do nome dentro da distância máxima
+    Retorna (casa, distância) ou (None, None); distância 0 = mesmo nome a menos
+    de maiúsculas/espaços. A distância só conta o nome: o sufixo entre
+    parênteses tem de ser o mesmo ("Stake (RO)" não vira "Stake (CO)"). Duas ou
+    mais casas empatadas na menor distância também dão (None, None): o nome
+    impresso fica como está em vez de ir para uma casa escolhida ao acaso.
+
+    Com deleções de até `limite` caracteres dos dois lados, todo nome do catálogo a
+    distância <= limite compartilha alguma variante com a consulta (duas trocas,
+    nome truncado em 2 caracteres etc. nos nomes longos)
+    """
+    if _NOMES_NORMALIZADOS is None:
+        _montar_indice_aproximado()
+
+    chave = normalizar_nome_casa(nome)
+    posicao = _NOMES_NORMALIZADOS.get(chave)
+    if posicao is not None:
+        return _CASAS_ORDENADAS[posicao], 0
+
+    nome, sufixo = separar_sufixo(chave)
+    limite = distancia_maxima(nome)
+    if not limite:
+        return None, None
+
+    candidatas = set()
+    for variante in _delecoes(nome, limite):
+        candidatas.update(_DELECOES.get(variante + sufixo, ()))
+
+    melhores = []
+    melhor_distancia = limite + 1
+    for posicao in sorted(candidatas):
+        nome_casa, _ = separar_sufixo(normalizar_nome_casa(_CASAS_ORDENADAS[posicao]))
+        distancia = distancia_edicao(nome, nome_casa, melhor_distancia)
+        if distancia < melhor_distancia:
+            melhores, melhor_distancia = [posicao], distancia
+        elif distancia == melhor_distancia <= limite:
+            melhores.append(posicao)
+    if len(melhores) != 1:
+        return None, None
+    return _CASAS_ORDENADAS[melhores[0]], melhor_distancia
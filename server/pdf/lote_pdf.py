@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Modo em lote do parser de PDFs (python3 parse_pdf.py --lote ...)
+
+Recebe diretórios, globs, listas de arquivos (@lista.txt) ou caminhos pelo
+stdin (-), distribui os PDFs por um ProcessPoolExecutor do tamanho da máquina e
+escreve uma linha NDJSON por PDF assim que ele termina (na ordem de conclusão;
+"index" é a posição do PDF na entrada):
+    {"file": "...", "index": 0, "ok": true, "result": {...}, "error": null, "ms": 85.3, "duplicateOf": null}
+
+Com "-" os caminhos são lidos do stdin conforme chegam e os resultados já saem
+enquanto a entrada continua aberta (uso em pipe por outro processo).
+
+PDF inexistente, ilegível ou que não é PDF vem com "ok": false e a mensagem em
+"error"; abortado por um teto de recursos (ver parse_pdf.LimiteExcedido) traz
+também "limitExceeded": {"limit": ..., "max": ..., "message": ...}.
+
+duplicateOf aponta o PDF já processado no lote com a mesma impressão semântica
+(result.fingerprint): a mesma surebet exportada duas vezes com outro nome.
+
+Com --saida o NDJSON vai para um arquivo que também serve de checkpoint:
+--retomar pula os PDFs que já têm linha "ok": true no arquivo e continua de onde
+parou; os que falharam são tentados de novo.
+
+Com --profile cada PDF roda sob o cProfile e o lote grava a soma de todos em
+<saida>.prof (ou lote.prof sem --saida), com o resumo no stderr.
+"""
+import argparse
+import contextlib
+import gc
+import glob
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import parse_pdf
+
+# Pedidos em voo por processo: mantém todos ocupados sem enfileirar o lote inteiro na memória
+PEDIDOS_POR_PROCESSO = 4
+
+
+def _caminhos_da_entrada(entrada):
+    if entrada == '-':
+        # Uma linha por vez: o lote começa sem esperar o fim do stdin
+        for linha in sys.stdin:
+            if linha.strip():
+                yield linha.strip()
+    elif entrada.startswith('@'):
+        with open(entrada[1:], encoding='utf-8') as f:
+            yield from (linha.strip() for linha in f if linha.strip())
+    elif os.path.isdir(entrada):
+        yield from sorted(glob.glob(os.path.join(entrada, '**', '*.pdf'), recursive=True))
+    elif glob.has_magic(entrada):
+        yield from sorted(glob.glob(entrada, recursive=True))
+    else:
+        yield entrada
+
+def expandir_entradas(entradas):
+    """
+    Converte diretórios (recursivo), globs, @listas, o stdin (-) e caminhos soltos
+    em PDFs sem repetições, gerados sob demanda
+    """
+    vistos = set()
+    for entrada in entradas:
+        for caminho in _caminhos_da_entrada(entrada):
+            if caminho not in vistos:
+                vistos.add(caminho)
+                yield caminho
+
+
+def ler_checkpoint(caminho_saida):
+    """
+    Lê os registros já processados com sucesso ("ok": true) de um NDJSON de saída
+    anterior: {arquivo: registro}
+    As linhas com erro saem do arquivo, para o PDF ser tentado de novo e ficar com
+    uma linha só; uma última linha incompleta (processo morto no meio da escrita)
+    também é descartada
+    """
+    if not os.path.exists(caminho_saida):
+        return {}
+
+    with open(caminho_saida, 'rb') as f:
+        conteudo = f.read()
+    fim_valido = conteudo.rfind(b'\n') + 1
+
+    concluidos = {}
+    mantidas = []
+    for linha in conteudo[:fim_valido].splitlines():
+        try:
+            registro = json.loads(linha)
+            if registro['ok']:
+                concluidos[registro['file']] = registro
+                mantidas.append(linha)
+        except (ValueError, KeyError, TypeError):
+            continue
+
+    restante = b''.join(linha + b'\n' for linha in mantidas)
+    if restante != conteudo:
+        with open(caminho_saida, 'wb') as f:
+            f.write(restante)
+    return concluidos
+
+
+def processar_arquivo(caminho, indice, com_tempos, com_perfil=False):
+    """
+    Executado nos processos filhos: nunca lança, o erro vai na própria linha
+    Com com_perfil as estatísticas do cProfile voltam em "_perfil" (fora do NDJSON)
+    """
+    inicio = time.perf_counter()
+    registro = {'file': caminho, 'index': indice, 'ok': True, 'result': None, 'error': None}
+    try:
+        with parse_pdf.perfilar() if com_perfil else contextlib.nullcontext() as perfil:
+            if com_tempos:
+                registro['result'], registro['timings'] = parse_pdf.extrair_dados_pdf_com_tempos(caminho, estrito=True)
+            else:
+                registro['result'] = parse_pdf.extrair_dados_pdf(caminho, estrito=True)
+    except parse_pdf.LimiteExcedido as e:
+        registro['ok'] = False
+        registro['error'] = str(e)
+        registro['limitExceeded'] = e.como_dict()
+    except Exception as e:
+        registro['ok'] = False
+        registro['error'] = str(e)
+    if com_perfil:
+        registro['_perfil'] = perfil['stats']
+    registro['ms'] = round((time.perf_counter() - inicio) * 1000, 3)
+    return registro
+
+
+def executar_lote(caminhos, saida, processos, com_tempos, caminho_perfil=None, anteriores=None):
+    """
+    Processa os PDFs em paralelo escrevendo cada resultado em `saida` na ordem de conclusão
+    Com caminho_perfil soma o perfil de cada PDF e grava o pstats no fim
+    anteriores (de ler_checkpoint) são pulados mantendo o "index" de cada PDF na entrada
+    e as impressões deles continuam valendo para duplicateOf
+    Uma thread lê a entrada e submete os PDFs (no máximo PEDIDOS_POR_PROCESSO por
+    processo em voo) enquanto esta escreve os resultados: uma entrada lenta
+    (stdin) não atrasa a saída dos que já terminaram
+    Retorna (total processado, total com erro)
+    """
+    concluidos = queue.Queue()
+    vagas = threading.BoundedSemaphore(processos * PEDIDOS_POR_PROCESSO)
+    processados = 0
+    erros = 0
+    vistos = {}  # fingerprint -> primeiro arquivo com essa surebet
+    anteriores = anteriores or {}
+    for registro in anteriores.values():
+        impressao = registro.get('result') and registro['result'].get('fingerprint')
+        if impressao:
+            vistos.setdefault(impressao, registro['file'])
+    perfil = None
+
+    def submeter(executor):
+        total = 0
+        try:
+            for indice, caminho in enumerate(caminhos):
+                if caminho in anteriores:
+                    continue
+                vagas.acquire()
+                executor.submit(processar_arquivo, caminho, indice, com_tempos, bool(caminho_perfil)).add_done_callback(concluidos.put)
+                total += 1
+        finally:
+            # Fim da entrada: avisa quantos resultados esperar
+            concluidos.put(total)
+
+    # Índices e backend montados antes do fork, compartilhados pelos processos (ver parse_pdf.extrair_lote)
+    parse_pdf.preparar_processo()
+    metodo = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+    gc.freeze()
+    try:
+        with ProcessPoolExecutor(max_workers=processos, mp_context=multiprocessing.get_context(metodo)) as executor:
+            threading.Thread(target=submeter, args=(executor,), daemon=True).start()
+            total = None
+            while total is None or processados < total:
+                item = concluidos.get()
+                if isinstance(item, int):
+                    total = item
+                    continue
+                vagas.release()
+
+                registro = item.result()
+                if caminho_perfil:
+                    perfil = parse_pdf.somar_perfil(perfil, registro.pop('_perfil'))
+                processados += 1
+                erros += not registro['ok']
+                impressao = registro['result'] and registro['result'].get('fingerprint')
+                registro['duplicateOf'] = vistos.setdefault(impressao, registro['file']) if impressao else None
+                if registro['duplicateOf'] == registro['file']:
+                    registro['duplicateOf'] = None
+                saida.write(json.dumps(registro, ensure_ascii=False) + '\n')
+                saida.flush()
+    finally:
+        gc.unfreeze()
+
+    if perfil is not None:
+        parse_pdf.salvar_perfil(perfil, caminho_perfil, processados)
+    return processados, erros
+
+
+def main_lote(argumentos):
+    parser = argparse.ArgumentParser(prog='parse_pdf.py --lote', description='Processa muitos PDFs em paralelo (NDJSON)')
+    parser.add_argument('entradas', nargs='+', help='diretórios, globs, PDFs, @lista.txt ou - (caminhos pelo stdin)')
+    parser.add_argument('--saida', help='arquivo NDJSON de saída (default: stdout)')
+    parser.add_argument('--retomar', action='store_true', help='pula os PDFs já processados com sucesso em --saida')
+    parser.add_argument('--processos', type=int, default=os.cpu_count() or 1, help='processos em paralelo (default: núcleos)')
+    parser.add_argument('--timings', action='store_true', help='inclui os tempos por estágio em cada linha')
+    parser.add_argument('--profile', action='store_true', help='soma o cProfile de todos os PDFs em <saida>.prof (ou lote.prof)')
+    args = parser.parse_args(argumentos)
+
+    if args.retomar and not args.saida:
+        parser.error('--retomar exige --saida')
+
+    caminhos = expandir_entradas(args.entradas)
+    concluidos = None
+    if args.retomar:
+        concluidos = ler_checkpoint(args.saida)
+        print(f"Retomando: {len(concluidos)} já processados", file=sys.stderr)
+
+    inicio = time.perf_counter()
+    com_tempos = args.timings or parse_pdf.TIMINGS_ATIVO
+    caminho_perfil = ((args.saida + '.prof') if args.saida else 'lote.prof') if args.profile or parse_pdf.PERFIL_ATIVO else None
+    if args.saida:
+        with open(args.saida, 'a' if args.retomar else 'w', encoding='utf-8') as saida:
+            processados, erros = executar_lote(caminhos, saida, max(1, args.processos), com_tempos, caminho_perfil, concluidos)
+    else:
+        processados, erros = executar_lote(caminhos, sys.stdout, max(1, args.processos), com_tempos, caminho_perfil)
+
+    duracao = time.perf_counter() - inicio
+    print(f"Lote concluído: {processados} PDFs, {erros} erros, {duracao:.1f}s "
+          f"({processados / duracao if duracao else 0:.1f} PDFs/s)", file=sys.stderr)
+    if erros:
+        sys.exit(1)
@@ -1,9 +1,103 @@
 #!/usr/bin/env python3
 import sys
+import io
+import os
 import json
-import pdfplumber
+import math
+import signal
+import threading
+import time
+import contextlib
+import functools
+import gc
+import hashlib
 import re
+import itertools
+import struct
+import types
+import unicodedata
 from datetime import datetime
+from importlib.util import find_spec
+from operator import itemgetter
+
+try:
+    import resource
+except ImportError:
+    # Windows: sem setrlimit, o governador de recursos fica desligado
+    resource = None
+from casas_apostas import (buscar_casa_conhecida, distancia_edicao, eh_inicio_de_casa,
+                           normalizar_nome_casa, preparar_indices, resolver_casa_aproximada,
+                           separar_sufixo)
+
+# === IMPORTAÇÕES SOB DEMANDA ===
+# pdfplumber/pdfminer (~165ms de import: importlib.metadata, charset_normalizer,
+# cryptography) e pypdfium2 (~35ms) só são importados quando um backend abre o
+# primeiro PDF; um processo que só usa o pdfium nunca carrega o pdfminer.
+# As classes que estendem as do pdfminer são montadas na mesma hora.
+
+@functools.lru_cache(maxsize=None)
+def _pdfminer():
+    import pdfplumber
+    from pdfminer.pdfinterp import PDFPageInterpreter
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.pdftypes import PDFStream, resolve1, stream_value
+    from pdfplumber.page import Page, PDFPageAggregatorWithMarkedContent
+    from pdfplumber.utils import extract_words
+    return types.SimpleNamespace(
+        pdfplumber=pdfplumber,
+        PDFPageInterpreter=PDFPageInterpreter,
+        PDFPage=PDFPage,
+        PDFStream=PDFStream,
+        resolve1=resolve1,
+        stream_value=stream_value,
+        Page=Page,
+        extract_words=extract_words,
+        InterpretadorSoTexto=type('InterpretadorSoTexto', (_FiltroRegiaoTexto, PDFPageInterpreter), {}),
+        AgregadorLimitado=type('AgregadorLimitado', (_NormalizadorIcones, _ContadorLimites, PDFPageAggregatorWithMarkedContent), {}),
+    )
+
+@functools.lru_cache(maxsize=None)
+def _pdfium():
+    import ctypes
+    import pypdfium2
+    import pypdfium2.raw as pdfium_c
+    return types.SimpleNamespace(ctypes=ctypes, pypdfium2=pypdfium2, c=pdfium_c)
+
+def carregar_backend(backend):
+    """
+    Importa já as bibliotecas do backend (worker aquecido, relatório de inicialização)
+    """
+    {'pdfplumber': _pdfminer, 'pdfium': _pdfium}[backend]()
+
+# Padrão de casa não catalogada: palavra capitalizada seguida de dados de aposta
+REGEX_CASA_DINAMICA = re.compile(r'^([A-Z][A-Za-z\s\(\)]{2,30})\s+[A-Za-z0-9()+\-≥≤\.]+\s+\d+\.\d+')
+
+REGEX_DECIMAL = re.compile(r'\d+\.\d+')
+REGEX_DECIMAL_LONGO = re.compile(r'\d+\.\d{2,}')
+REGEX_ODD_OU_VALOR = re.compile(r'\d+\.\d+|\d+\s+USD')
+REGEX_NUMERO_2_DIGITOS = re.compile(r'\d{2,}')
+REGEX_DATA_EVENTO = re.compile(r'\((\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})')
+REGEX_PORCENTAGEM_FINAL = re.compile(r'(\d+\.\d+)%\s*$')
+REGEX_SUFIXO_PAIS = re.compile(r'^\([A-Z]{2}\)$')
+REGEX_PALAVRA_TIPO = re.compile(r'\b(gol|time|cantos?|escanteios?|acima|abaixo)\b')
+REGEX_CONTINUACAO_TIPO = re.compile(r'\b(gol|time|cantos?|escanteios?|resultado|final|tempo|minuto|chute|corner|primeiro|segundo|1º|2º|over|under|acima|abaixo|casa|fora|empate|handicap)\b')
+
+PALAVRAS_ESPORTE = [
+    'futebol', 'football', 'soccer',
+    'basquete', 'basketball', 'basquetebol',
+    'tênis', 'tennis',
+    'hóquei', 'hockey', 'hoquei',
+    'beisebol', 'beisebal', 'baseball',
+    'voleibol', 'volleyball', 'vôlei', 'volei',
+    'handball', 'handebol',
+    'rugby',
+    'cricket',
+    'futsal'
+]
+PALAVRAS_SECAO = ['Aposta total', 'Mostrar', 'Use sua', 'Arredondar']
+# Marcadores que impedem a linha " / " de ser esporte/liga no fallback genérico
+MARCADORES_NAO_ESPORTE = ['Evento', 'ROI', '–', '%', 'USD', 'BRL', 'Chance', 'Aposta']
+SEPARADORES = {'〉', '○', '●', '\uf35d', 'new'}
 
 def preprocessar_linhas_quebradas(texto):
     """
@@ -41,7 +135,7 @@ def preprocessar_linhas_quebradas(texto):
             # - Tem palavras que podem ser casa/tipo
             # Verifica se próxima linha tem números significativos (odds/stakes)
             # Ignora números em texto como "1º", "2º", etc.
-            tem_odds_significativos = bool(re.search(r'\d+\.\d+|\d+\s+USD', proxima_linha))
+            tem_odds_significativos = bool(REGEX_ODD_OU_VALOR.search(proxima_linha))
             
             eh_continuacao = (proxima_linha and 
                             not tem_odds_significativos and  # Não é nova aposta
@@ -62,13 +156,1005 @@ def preprocessar_linhas_quebradas(texto):
     
     return '\n'.join(lines_processadas)
 
-def extrair_dados_pdf(caminho_pdf):
+# === INSTRUMENTAÇÃO OPCIONAL DE TEMPOS ===
+# Ativada por PARSE_PDF_TIMINGS=1 ou --timings; desligada, marcar_tempo devolve None
+# e registrar_tempo retorna imediatamente
+TIMINGS_ATIVO = os.environ.get('PARSE_PDF_TIMINGS') == '1'
+_tempos = None
+
+# === LOG ESTRUTURADO ===
+# Registros JSON (um por linha) no stderr, filtrados por nível; desligado por padrão
+# PARSE_PDF_LOG=debug|info|aviso|erro liga a partir do nível dado. Chamadas no laço
+# das apostas ficam atrás de LOG_DEBUG para não montar texto de debug à toa.
+NIVEIS_LOG = {'debug': 10, 'info': 20, 'aviso': 30, 'erro': 40}
+NIVEL_LOG = NIVEIS_LOG.get(os.environ.get('PARSE_PDF_LOG', '').lower(), 100)
+LOG_DEBUG = NIVEL_LOG <= NIVEIS_LOG['debug']
+
+def registrar_log(nivel, evento, **campos):
+    if NIVEIS_LOG[nivel] < NIVEL_LOG:
+        return
+    registro = {'ts': round(time.time(), 3), 'nivel': nivel, 'evento': evento, **campos}
+    sys.stderr.write(json.dumps(registro, ensure_ascii=False, separators=(',', ':')) + '\n')
+    sys.stderr.flush()
+
+def marcar_tempo():
+    if _tempos is None:
+        return None
+    return (time.perf_counter(), time.process_time())
+
+def registrar_tempo(estagio, inicio):
     """
-    Extrai dados estruturados de um PDF de surebet usando pdfplumber
-    Parser otimizado para 100% de precisão com todos os formatos de PDF
-    Suporta acentos, símbolos especiais (≥, ø, etc.), qualquer casa de apostas
+    Acumula tempo de parede e de CPU do estágio, no total e na página atual
+    """
+    if inicio is None:
+        return
+    wall_ms = (time.perf_counter() - inicio[0]) * 1000
+    cpu_ms = (time.process_time() - inicio[1]) * 1000
+    destinos = [_tempos['stages']]
+    if _tempos['pages']:
+        destinos.append(_tempos['pages'][-1]['stages'])
+    for destino in destinos:
+        acumulado = destino.setdefault(estagio, {'wallMs': 0.0, 'cpuMs': 0.0})
+        acumulado['wallMs'] += wall_ms
+        acumulado['cpuMs'] += cpu_ms
+
+def extrair_dados_pdf_com_tempos(caminho_pdf, backend=None, estrito=False):
+    """
+    Executa extrair_dados_pdf coletando tempos por estágio e por página
+    Retorna (dados, timings); "processar_aposta" é um subconjunto de "apostas"
+    detectarCasaMemo traz os acertos/falhas do memo de casas neste PDF e o
+    total de entradas do memo no processo
+    """
+    global _tempos
+    _tempos = {'stages': {}, 'pages': [], 'detectarCasaCalls': 0}
+    memo_antes = _detectar_casa_memo.cache_info()
+    inicio = (time.perf_counter(), time.process_time())
+    try:
+        dados = extrair_dados_pdf(caminho_pdf, backend, estrito)
+        tempos = _tempos
+    finally:
+        _tempos = None
+    
+    memo = _detectar_casa_memo.cache_info()
+    tempos['detectarCasaMemo'] = {
+        'hits': memo.hits - memo_antes.hits,
+        'misses': memo.misses - memo_antes.misses,
+        'entries': memo.currsize,
+    }
+    
+    tempos['totalMs'] = (time.perf_counter() - inicio[0]) * 1000
+    tempos['totalCpuMs'] = (time.process_time() - inicio[1]) * 1000
+    for grupo in [tempos['stages']] + [pagina['stages'] for pagina in tempos['pages']]:
+        for acumulado in grupo.values():
+            acumulado['wallMs'] = round(acumulado['wallMs'], 3)
+            acumulado['cpuMs'] = round(acumulado['cpuMs'], 3)
+    tempos['totalMs'] = round(tempos['totalMs'], 3)
+    tempos['totalCpuMs'] = round(tempos['totalCpuMs'], 3)
+    return dados, tempos
+
+def classificar_linhas(linhas):
+    """
+    Passada única sobre as linhas: marca o que cada linha é (cabeçalho do evento,
+    times/porcentagem, esporte/liga, início de casa, linha financeira, seção)
+    e guarda os números já extraídos, para as etapas seguintes só consultarem
+    """
+    classificadas = []
+    for linha in linhas:
+        lower = linha.lower()
+        decimais = REGEX_DECIMAL.findall(linha)
+        tem_barra = ' / ' in linha
+        classificadas.append({
+            'texto': linha,
+            'palavras': linha.split(),
+            'decimais': decimais,
+            'moeda': 'USD' if 'USD' in linha else ('BRL' if 'BRL' in linha else None),
+            'evento': 'Evento' in linha and '(' in linha,
+            'times': '–' in linha and '%' in linha and 'ROI' not in linha and 'Evento' not in linha,
+            'esporte_liga': tem_barra and any(sport in lower for sport in PALAVRAS_ESPORTE),
+            'barra_generica': (tem_barra and
+                               not any(marcador in linha for marcador in MARCADORES_NAO_ESPORTE) and
+                               not REGEX_DECIMAL_LONGO.search(linha)),  # Não tem odds (números com 2+ decimais)
+            'casa': detectar_casa_apostas(linha),
+            'financeiro': ('USD' in linha or 'BRL' in linha or '●' in linha or '○' in linha or bool(decimais)),
+            'secao': any(keyword in linha for keyword in PALAVRAS_SECAO),
+            'separador': linha in SEPARADORES,
+            'sufixo_pais': bool(REGEX_SUFIXO_PAIS.match(linha)),
+            'continuacao_tipo': bool(REGEX_CONTINUACAO_TIPO.search(lower)),
+        })
+    return classificadas
+
+# === EXTRAÇÃO RÁPIDA (SÓ A REGIÃO DE TEXTO DO CONTEÚDO) ===
+# No layout da calculadora de surebet a maior parte do content stream é
+# desenho vetorial (ícones, bordas, logos das casas): milhares de operadores
+# de caminho que o pdfminer tokeniza em Python e que o parser nunca usa, já que
+# só lê o texto. Os valores da tabela são desenhados no fim do stream, então
+# não dá para parar a interpretação antes; em vez disso os operadores de
+# caminho fora dos blocos BT/ET são removidos antes de interpretar.
+# PARSE_PDF_REGIAO=0 desliga e interpreta o conteúdo original.
+EXTRACAO_POR_REGIAO = os.environ.get('PARSE_PDF_REGIAO', '1') != '0'
+
+_NUMERO_PDF = rb'[-+]?(?:\d+\.?\d*|\.\d+)'
+# Construção de caminho (m l c v y re h), pintura (f F S s B b n) e recorte (W) com seus operandos
+REGEX_OPERADOR_CAMINHO = re.compile(
+    rb'(?<![^\s\])>])(?:' + _NUMERO_PDF + rb'\s+)*(?:re|[mlcvyh]|[fFSsBbnW]\*?)(?=[\s\[(<]|$)'
+)
+REGEX_BLOCO_TEXTO = re.compile(rb'(?<!\S)BT\b.*?(?<!\S)ET\b', re.S)
+REGEX_IMAGEM_INLINE = re.compile(rb'(?<!\S)BI(?=\s)')
+
+def filtrar_conteudo_texto(dados):
+    """
+    Remove os operadores de caminho fora dos blocos de texto de um content stream
+    Streams com imagem inline (dados binários) são devolvidos sem alteração
+    """
+    if REGEX_IMAGEM_INLINE.search(dados):
+        return dados
+    
+    partes = []
+    posicao = 0
+    for bloco in REGEX_BLOCO_TEXTO.finditer(dados):
+        partes.append(REGEX_OPERADOR_CAMINHO.sub(b'', dados[posicao:bloco.start()]))
+        partes.append(bloco.group())
+        posicao = bloco.end()
+    partes.append(REGEX_OPERADOR_CAMINHO.sub(b'', dados[posicao:]))
+    return b''.join(partes)
+
+class _FiltroRegiaoTexto:
+    """
+    Mistura para o PDFPageInterpreter do pdfminer (ver _pdfminer): executa os
+    content streams (página e form XObjects) já filtrados por filtrar_conteudo_texto
+    """
+    def execute(self, streams):
+        pdfminer = _pdfminer()
+        filtrados = []
+        for stream in streams:
+            original = pdfminer.stream_value(stream)
+            filtrado = pdfminer.PDFStream({}, filtrar_conteudo_texto(original.get_data()))
+            filtrado.set_objid(original.objid, original.genno)
+            filtrados.append(filtrado)
+        return super().execute(filtrados)
+
+# === LIMITES POR PÁGINA ===
+# Uma página da calculadora tem menos de mil caracteres e objetos de layout;
+# PDFs patológicos (milhões de glifos ou caminhos) levariam segundos e centenas
+# de MB para interpretar. A interpretação é interrompida ao passar do limite: na
+# 1ª página o job inteiro termina com o limite excedido, nas seguintes a página é
+# ignorada (PARSE_PDF_MAX_CARACTERES / PARSE_PDF_MAX_OBJETOS, 0 = sem limite)
+LIMITE_CARACTERES_PAGINA = int(os.environ.get('PARSE_PDF_MAX_CARACTERES', '20000'))
+LIMITE_OBJETOS_PAGINA = int(os.environ.get('PARSE_PDF_MAX_OBJETOS', '50000'))
+# Os dados da surebet estão sempre nas 2 primeiras páginas
+PAGINAS_ANALISADAS = 2
+
+class LimiteExcedido(Exception):
+    """
+    Job abortado por um limite de recursos: `limite` diz qual (cpu, tempo, memoria,
+    caracteres_pagina, objetos_pagina) e `maximo` o teto configurado
+    """
+    def __init__(self, limite, maximo, mensagem):
+        super().__init__(mensagem)
+        self.limite = limite
+        self.maximo = maximo
+    
+    def como_dict(self):
+        return {'limit': self.limite, 'max': self.maximo, 'message': str(self)}
+
+class LimitePaginaExcedido(LimiteExcedido):
+    pass
+
+# Ícones das fontes simbólicas (FontAwesome) com texto canônico nos dois backends.
+# A seta de expandir linha sai como U+F054 (área de uso privado, pelo ToUnicode)
+# no pdfium e, no pdfminer, como U+F054 ou U+232A conforme a fonte traga o
+# ToUnicode ou só o nome do glifo; as duas formas viram U+232A ('〉')
+ICONES_CANONICOS = {'\uf054': '\u232a'}
+
+class _NormalizadorIcones:
+    """
+    Mistura para o agregador de layout do pdfplumber (ver _pdfminer): troca o
+    texto dos ícones pelo canônico (ICONES_CANONICOS) no caractere recém-criado,
+    como o pdfplumber faz ao marcar o MCID
+    """
+    def render_char(self, *args, **kwargs):
+        avanco = super().render_char(*args, **kwargs)
+        caractere = self.cur_item._objs[-1]
+        caractere._text = ICONES_CANONICOS.get(caractere._text, caractere._text)
+        return avanco
+
+class _ContadorLimites:
+    """
+    Mistura para o agregador de layout do pdfplumber (ver _pdfminer): conta
+    caracteres e objetos (caracteres, caminhos e imagens) e aborta a
+    interpretação da página quando algum limite é excedido
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.caracteres = 0
+        self.objetos = 0
+    
+    def _contar_objeto(self):
+        self.objetos += 1
+        if LIMITE_OBJETOS_PAGINA and self.objetos > LIMITE_OBJETOS_PAGINA:
+            raise LimitePaginaExcedido('objetos_pagina', LIMITE_OBJETOS_PAGINA, f"mais de {LIMITE_OBJETOS_PAGINA} objetos")
+    
+    def render_char(self, *args, **kwargs):
+        self.caracteres += 1
+        if LIMITE_CARACTERES_PAGINA and self.caracteres > LIMITE_CARACTERES_PAGINA:
+            raise LimitePaginaExcedido('caracteres_pagina', LIMITE_CARACTERES_PAGINA, f"mais de {LIMITE_CARACTERES_PAGINA} caracteres")
+        self._contar_objeto()
+        return super().render_char(*args, **kwargs)
+    
+    def render_image(self, *args, **kwargs):
+        self._contar_objeto()
+        super().render_image(*args, **kwargs)
+    
+    def paint_path(self, *args, **kwargs):
+        self._contar_objeto()
+        super().paint_path(*args, **kwargs)
+
+def _interpretar_pagina(pagina, classe_interpretador):
+    """
+    Monta o layout da página com o interpretador dado e o agregador limitado
+    O pdfplumber monta chars/extract_text a partir de page.layout (_layout)
+    """
+    dispositivo = _pdfminer().AgregadorLimitado(pagina.pdf.rsrcmgr, pageno=pagina.page_number, laparams=pagina.pdf.laparams)
+    classe_interpretador(pagina.pdf.rsrcmgr, dispositivo).process_page(pagina.page_obj)
+    pagina._layout = dispositivo.get_result()
+
+def extrair_texto_pagina(pagina):
+    """
+    Extrai o texto da página interpretando só a região de texto do conteúdo
+    Volta para a interpretação completa se o conteúdo filtrado falhar
+    Lança LimitePaginaExcedido acima dos limites de caracteres/objetos
+    """
+    pdfminer = _pdfminer()
+    if EXTRACAO_POR_REGIAO:
+        try:
+            _interpretar_pagina(pagina, pdfminer.InterpretadorSoTexto)
+        except LimiteExcedido:
+            raise
+        except Exception:
+            _interpretar_pagina(pagina, pdfminer.PDFPageInterpreter)
+    else:
+        _interpretar_pagina(pagina, pdfminer.PDFPageInterpreter)
+    return pagina.extract_text()
+
+def paginas_sob_demanda(pdf, limite):
+    """
+    Páginas do PDF criadas uma a uma (pdf.pages monta todas as páginas do
+    arquivo de uma vez); cada página é liberada (close) assim que o consumidor
+    pede a próxima ou para de iterar
+    """
+    pdfminer = _pdfminer()
+    topo_documento = 0
+    for numero, objeto_pagina in enumerate(pdfminer.PDFPage.create_pages(pdf.doc), 1):
+        if numero > limite:
+            break
+        pagina = pdfminer.Page(pdf, objeto_pagina, page_number=numero, initial_doctop=topo_documento)
+        topo_documento += pagina.height
+        try:
+            yield pagina
+        finally:
+            with sem_interrupcao():
+                pagina.close()
+
+# === GOVERNADOR DE RECURSOS POR JOB ===
+# Tetos de CPU, tempo total e memória de cada PDF. Um PDF hostil não pode prender
+# o worker persistente: o job termina com LimiteExcedido (que diz qual limite) e o
+# processo segue atendendo os próximos pedidos, sem o Node precisar matá-lo.
+# - CPU: RLIMIT_CPU no consumo atual + o teto (o kernel manda SIGXCPU)
+# - memória: RLIMIT_AS no tamanho atual + 2x o teto (alocação falha com MemoryError)
+#   e uma thread vigia que confere o RSS
+# - tempo: a mesma thread vigia interrompe a thread principal com SIGUSR1
+# O job é interrompido uma vez só (o resto do caminho repassa o LimiteExcedido) e o
+# fechamento de páginas/documentos e a restauração dos limites rodam com os sinais
+# bloqueados (sem_interrupcao): a interrupção nunca cai no meio de uma limpeza
+# Os limites do processo voltam ao que eram no fim de cada job
+# (PARSE_PDF_MAX_CPU_S / PARSE_PDF_MAX_TEMPO_S / PARSE_PDF_MAX_MEMORIA_MB, 0 = sem limite)
+LIMITE_CPU_SEGUNDOS = float(os.environ.get('PARSE_PDF_MAX_CPU_S', '10'))
+LIMITE_TEMPO_SEGUNDOS = float(os.environ.get('PARSE_PDF_MAX_TEMPO_S', '20'))
+LIMITE_MEMORIA_MB = int(os.environ.get('PARSE_PDF_MAX_MEMORIA_MB', '512'))
+INTERVALO_VIGIA_SEGUNDOS = 0.05
+
+def _memoria_processo():
+    """
+    (tamanho virtual, residente) do processo em bytes; (0, 0) sem /proc
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            virtual, residente = f.read().split()[:2]
+    except OSError:
+        return 0, 0
+    return int(virtual) * resource.getpagesize(), int(residente) * resource.getpagesize()
+
+_SINAIS_GOVERNADOR = {signal.SIGUSR1, signal.SIGXCPU} if resource is not None else set()
+
+@contextlib.contextmanager
+def sem_interrupcao():
+    """
+    Adia os sinais do governador durante o bloco (só na thread principal, que os recebe)
+    """
+    if not _SINAIS_GOVERNADOR or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    anteriores = signal.pthread_sigmask(signal.SIG_BLOCK, _SINAIS_GOVERNADOR)
+    try:
+        yield
+    finally:
+        signal.pthread_sigmask(signal.SIG_SETMASK, anteriores)
+
+class _GovernadorRecursos:
+    """
+    Aplica os tetos a um job por vez (with governador.job(): ...). Só atua na thread
+    principal: é ela que recebe os sinais e que o vigia interrompe
+    """
+    def __init__(self):
+        self._pid = None
+        self._ativo = False
+        self._excedido = None
+        self._interrompido = False
+        self._inicio = 0.0
+        self._residente_inicial = 0
+        self._trabalhando = threading.Event()
+    
+    def _preparar(self):
+        """
+        Handlers de sinal e thread vigia, uma vez por processo (de novo nos filhos do fork)
+        """
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._trabalhando = threading.Event()
+        signal.signal(signal.SIGUSR1, self._interromper)
+        signal.signal(signal.SIGXCPU, self._interromper_cpu)
+        threading.Thread(target=self._vigiar, name='vigia-recursos', daemon=True).start()
+    
+    def _interromper(self, *_):
+        if not self._ativo or not self._excedido or self._interrompido:
+            return
+        if signal.SIGUSR1 in signal.pthread_sigmask(signal.SIG_BLOCK, []):
+            # O sinal chegou antes do bloqueio e o handler rodou dentro de uma limpeza:
+            # reenvia, fica pendente até sem_interrupcao desbloquear
+            signal.pthread_kill(threading.main_thread().ident, signal.SIGUSR1)
+            return
+        self._interrompido = True
+        raise self._excedido
+    
+    def _interromper_cpu(self, *_):
+        # O kernel repete o SIGXCPU a cada segundo acima do limite; só o primeiro conta
+        if self._ativo:
+            self._excedido = self._excedido or LimiteExcedido(
+                'cpu', LIMITE_CPU_SEGUNDOS, f"mais de {LIMITE_CPU_SEGUNDOS:g}s de CPU")
+            self._interromper()
+    
+    def _verificar(self):
+        if LIMITE_TEMPO_SEGUNDOS and time.perf_counter() - self._inicio > LIMITE_TEMPO_SEGUNDOS:
+            return LimiteExcedido('tempo', LIMITE_TEMPO_SEGUNDOS, f"mais de {LIMITE_TEMPO_SEGUNDOS:g}s de tempo total")
+        if LIMITE_MEMORIA_MB and _memoria_processo()[1] - self._residente_inicial > LIMITE_MEMORIA_MB << 20:
+            return LimiteExcedido('memoria', LIMITE_MEMORIA_MB, f"mais de {LIMITE_MEMORIA_MB}MB de memória")
+        return None
+    
+    def _vigiar(self):
+        """
+        Thread vigia: dorme entre jobs; durante um job confere tempo e RSS a cada
+        INTERVALO_VIGIA_SEGUNDOS e sinaliza a thread principal uma vez, no primeiro
+        limite excedido (se um except amplo engolir a exceção, job() relança no fim)
+        """
+        thread_principal = threading.main_thread().ident
+        while True:
+            self._trabalhando.wait()
+            while self._ativo:
+                if self._excedido is None:
+                    excedido = self._verificar()
+                    if excedido:
+                        self._excedido = excedido
+                        signal.pthread_kill(thread_principal, signal.SIGUSR1)
+                time.sleep(INTERVALO_VIGIA_SEGUNDOS)
+    
+    def _aplicar_rlimits(self):
+        """
+        Baixa os limites flexíveis de CPU e espaço de endereçamento para este job
+        Retorna os limites alterados com os valores anteriores, para restaurar depois
+        """
+        novos = {}
+        if LIMITE_CPU_SEGUNDOS:
+            uso = resource.getrusage(resource.RUSAGE_SELF)
+            novos[resource.RLIMIT_CPU] = math.ceil(uso.ru_utime + uso.ru_stime + LIMITE_CPU_SEGUNDOS)
+        virtual = _memoria_processo()[0]
+        if LIMITE_MEMORIA_MB and virtual:
+            novos[resource.RLIMIT_AS] = virtual + (2 * LIMITE_MEMORIA_MB << 20)
+        
+        anteriores = {}
+        for limite, flexivel in novos.items():
+            atual, rigido = resource.getrlimit(limite)
+            if rigido != resource.RLIM_INFINITY:
+                flexivel = min(flexivel, rigido)
+            if atual == resource.RLIM_INFINITY or flexivel < atual:
+                resource.setrlimit(limite, (flexivel, rigido))
+                anteriores[limite] = (atual, rigido)
+        return anteriores
+    
+    @contextlib.contextmanager
+    def job(self):
+        if (resource is None or self._ativo
+                or threading.current_thread() is not threading.main_thread()
+                or not (LIMITE_CPU_SEGUNDOS or LIMITE_TEMPO_SEGUNDOS or LIMITE_MEMORIA_MB)):
+            yield
+            return
+        
+        self._preparar()
+        anteriores = self._aplicar_rlimits()
+        self._excedido = None
+        self._interrompido = False
+        self._inicio = time.perf_counter()
+        self._residente_inicial = _memoria_processo()[1]
+        self._ativo = True
+        self._trabalhando.set()
+        try:
+            yield
+        except MemoryError:
+            raise LimiteExcedido('memoria', LIMITE_MEMORIA_MB, f"mais de {LIMITE_MEMORIA_MB}MB de memória") from None
+        finally:
+            # Desativa antes de qualquer chamada: um sinal pendente não interrompe mais nada
+            self._ativo = False
+            self._trabalhando.clear()
+            with sem_interrupcao():
+                for limite, valores in anteriores.items():
+                    resource.setrlimit(limite, valores)
+        if self._excedido:
+            # Limite excedido com a exceção engolida no caminho: o job não vale
+            raise self._excedido
+
+_governador = _GovernadorRecursos()
+
+# === BACKENDS DE EXTRAÇÃO ===
+# Um backend abre o PDF e entrega as páginas sob demanda, todas com a mesma interface:
+#   numero, largura, altura, fontes (nomes base), chars (dicts no formato do
+#   pdfplumber) e texto() (linhas como as do extract_text do pdfplumber)
+# "pdfium" (pypdfium2, opcional) lê caracteres e caixas em C e monta as linhas com o
+# mesmo agrupamento do pdfplumber (~10x mais rápido); "pdfplumber" (pdfminer em Python)
+# é o fallback. PARSE_PDF_BACKEND escolhe; por padrão pdfium quando instalado.
+
+# === PALAVRAS E LINHAS A PARTIR DOS CARACTERES ===
+# Mesmo resultado do extract_words/extract_text do pdfplumber com os parâmetros
+# padrão (tolerância de 3pt, texto horizontal da esquerda para a direita), sem
+# importar o pdfplumber; texto rotacionado usa o próprio pdfplumber
+TOLERANCIA_X = 3
+TOLERANCIA_Y = 3
+LIGATURAS = {'ﬀ': 'ff', 'ﬃ': 'ffi', 'ﬄ': 'ffl', 'ﬁ': 'fi', 'ﬂ': 'fl', 'ﬆ': 'st', 'ﬅ': 'st'}
+
+def _agrupar_por_topo(objetos):
+    """
+    Agrupa os objetos em linhas: topos ordenados a menos de TOLERANCIA_Y do
+    anterior ficam na mesma linha (mantém a ordem dos objetos dentro da linha)
+    """
+    linha_do_topo = {}
+    linha = -1
+    anterior = None
+    for topo in sorted({objeto['top'] for objeto in objetos}):
+        if anterior is None or topo > anterior + TOLERANCIA_Y:
+            linha += 1
+        linha_do_topo[topo] = linha
+        anterior = topo
+    chave = lambda objeto: linha_do_topo[objeto['top']]
+    return [list(grupo) for _, grupo in itertools.groupby(sorted(objetos, key=chave), key=chave)]
+
+def _montar_palavra(caracteres):
+    primeiro = caracteres[0]
+    x0 = min(c['x0'] for c in caracteres)
+    x1 = max(c['x1'] for c in caracteres)
+    topo = min(c['top'] for c in caracteres)
+    base = max(c['bottom'] for c in caracteres)
+    return {
+        'text': ''.join(LIGATURAS.get(c['text'], c['text']) for c in caracteres),
+        'x0': x0,
+        'x1': x1,
+        'top': topo,
+        'doctop': topo + primeiro['doctop'] - primeiro['top'],
+        'bottom': base,
+        'upright': primeiro['upright'],
+        'height': base - topo,
+        'width': x1 - x0,
+        'direction': 'ltr',
+    }
+
+def extrair_palavras(caracteres):
     """
-    dados = {
+    Palavras dos caracteres: uma palavra termina em espaço, em salto de mais de
+    TOLERANCIA_X depois do caractere anterior, em recuo ou em mudança de linha
+    """
+    if not all(c['upright'] for c in caracteres):
+        return _pdfminer().extract_words(caracteres)
+    
+    palavras = []
+    for linha in _agrupar_por_topo(caracteres):
+        atual = []
+        for caractere in sorted(linha, key=itemgetter('x0')):
+            texto = caractere['text']
+            if texto.isspace():
+                if atual:
+                    palavras.append(_montar_palavra(atual))
+                atual = []
+            elif not texto:
+                # Caractere sem texto vira palavra sozinho, como no pdfplumber
+                if atual:
+                    palavras.append(_montar_palavra(atual))
+                palavras.append(_montar_palavra([caractere]))
+                atual = []
+            elif atual and (caractere['x0'] < atual[-1]['x0'] or
+                            caractere['x0'] > atual[-1]['x1'] + TOLERANCIA_X or
+                            abs(caractere['top'] - atual[-1]['top']) > TOLERANCIA_Y):
+                palavras.append(_montar_palavra(atual))
+                atual = [caractere]
+            else:
+                atual.append(caractere)
+        if atual:
+            palavras.append(_montar_palavra(atual))
+    return palavras
+
+def extrair_texto_caracteres(caracteres):
+    """
+    Texto dos caracteres: palavras separadas por espaço, linhas por quebra de linha
+    """
+    if not caracteres:
+        return ''
+    return '\n'.join(' '.join(palavra['text'] for palavra in linha)
+                     for linha in _agrupar_por_topo(extrair_palavras(caracteres)))
+
+class _PaginaPdfplumber:
+    def __init__(self, pagina):
+        self.pagina = pagina
+        self.numero = pagina.page_number
+        self.largura = pagina.width
+        self.altura = pagina.height
+        self.limite_excedido = None
+        self._texto = None
+    
+    def texto(self):
+        if self._texto is None:
+            try:
+                self._texto = extrair_texto_pagina(self.pagina)
+            except LimitePaginaExcedido as e:
+                registrar_log('aviso', 'pagina_ignorada', pagina=self.numero, motivo=str(e))
+                self.limite_excedido = e
+                self._texto = ''
+        return self._texto
+    
+    @property
+    def chars(self):
+        return self.pagina.chars
+    
+    @property
+    def fontes(self):
+        """
+        Fontes declaradas nos recursos da página, sem o prefixo de subset "ABCDEF+"
+        """
+        resolve1 = _pdfminer().resolve1
+        fontes = set()
+        recursos_fonte = resolve1(self.pagina.page_obj.resources.get('Font')) or {}
+        for referencia in recursos_fonte.values():
+            nome_base = resolve1(referencia).get('BaseFont')
+            if nome_base is not None:
+                fontes.add(getattr(nome_base, 'name', str(nome_base)).split('+')[-1])
+        return fontes
+
+@contextlib.contextmanager
+def abrir_pdfplumber(entrada):
+    pdf = _pdfminer().pdfplumber.open(abrir_entrada_pdf(entrada))
+    paginas = paginas_sob_demanda(pdf, PAGINAS_ANALISADAS)
+    try:
+        yield (_PaginaPdfplumber(pagina) for pagina in paginas)
+    finally:
+        with sem_interrupcao():
+            paginas.close()
+            pdf.close()
+
+class _PaginaPdfium:
+    """
+    Página lida pelo pdfium: os caracteres são extraídos no primeiro acesso e a
+    página do pdfium é fechada logo em seguida
+    """
+    def __init__(self, documento, indice, topo_documento):
+        self._documento = documento
+        self._indice = indice
+        self._topo_documento = topo_documento
+        self._chars = None
+        self._fontes = set()
+        self._texto = None
+        self.limite_excedido = None
+        self.numero = indice + 1
+        self.largura, self.altura = documento.get_page_size(indice)
+    
+    def _carregar(self):
+        pdfium_c = _pdfium().c
+        pagina = self._documento[self._indice]
+        pagina_texto = None
+        try:
+            if LIMITE_OBJETOS_PAGINA and pdfium_c.FPDFPage_CountObjects(pagina.raw) > LIMITE_OBJETOS_PAGINA:
+                raise LimitePaginaExcedido('objetos_pagina', LIMITE_OBJETOS_PAGINA, f"mais de {LIMITE_OBJETOS_PAGINA} objetos")
+            pagina_texto = pagina.get_textpage()
+            total = pagina_texto.count_chars()
+            if LIMITE_CARACTERES_PAGINA and total > LIMITE_CARACTERES_PAGINA:
+                raise LimitePaginaExcedido('caracteres_pagina', LIMITE_CARACTERES_PAGINA, f"mais de {LIMITE_CARACTERES_PAGINA} caracteres")
+            self._chars = self._caracteres(pagina_texto, total)
+        except LimitePaginaExcedido as e:
+            registrar_log('aviso', 'pagina_ignorada', pagina=self.numero, motivo=str(e))
+            self.limite_excedido = e
+            self._chars = []
+        finally:
+            with sem_interrupcao():
+                if pagina_texto is not None:
+                    pagina_texto.close()
+                pagina.close()
+    
+    def _caracteres(self, pagina_texto, total):
+        """
+        Caracteres no formato do pdfplumber, com as caixas do pdfminer: a base da
+        caixa "loose" (descendente da fonte) e a altura do tamanho efetivo da fonte
+        (tamanho × escala da matriz do texto); y com origem no topo. Pula os
+        gerados pelo pdfium (espaços e quebras de linha inferidos)
+        
+        O pdfium também marca como gerados espaços que existem no PDF quando o glifo
+        do espaço não tem caixa; sem eles, palavras a menos de TOLERANCIA_X uma da
+        outra se juntariam ("28/09/2025,15:19"). Um espaço gerado entre dois
+        caracteres da mesma linha separados por no máximo TOLERANCIA_X vira um
+        espaço no vão, como o pdfminer entrega
+        """
+        pdfium_c = _pdfium().c
+        bruto = pagina_texto.raw
+        buffer_fonte = _pdfium().ctypes.create_string_buffer(128)
+        matriz = pdfium_c.FS_MATRIX()
+        caracteres = []
+        espaco_gerado = False
+        for indice in range(total):
+            if pdfium_c.FPDFText_IsGenerated(bruto, indice):
+                espaco_gerado = pdfium_c.FPDFText_GetUnicode(bruto, indice) == 32
+                continue
+            codigo = pdfium_c.FPDFText_GetUnicode(bruto, indice)
+            if codigo in (10, 13) or not codigo:
+                continue
+            x0, base, x1, topo = pagina_texto.get_charbox(indice, loose=True)
+            tamanho_nome = pdfium_c.FPDFText_GetFontInfo(bruto, indice, buffer_fonte, len(buffer_fonte), None)
+            fonte = buffer_fonte.value.decode('utf-8', 'replace') if tamanho_nome else ''
+            self._fontes.add(fonte.split('+')[-1])
+            pdfium_c.FPDFText_GetMatrix(bruto, indice, matriz)
+            tamanho = pdfium_c.FPDFText_GetFontSize(bruto, indice) * math.sqrt(abs(matriz.a * matriz.d - matriz.b * matriz.c))
+            fundo = self.altura - base
+            caractere = {
+                'text': ICONES_CANONICOS.get(chr(codigo), chr(codigo)),
+                'fontname': fonte,
+                'size': tamanho,
+                'x0': x0,
+                'x1': x1,
+                'top': fundo - tamanho,
+                'bottom': fundo,
+                'doctop': self._topo_documento + fundo - tamanho,
+                'upright': True,
+            }
+            if espaco_gerado and caracteres:
+                anterior = caracteres[-1]
+                if (0 <= caractere['x0'] - anterior['x1'] <= TOLERANCIA_X
+                        and abs(caractere['top'] - anterior['top']) <= TOLERANCIA_Y):
+                    caracteres.append({**anterior, 'text': ' ', 'x0': anterior['x1'], 'x1': caractere['x0']})
+            espaco_gerado = False
+            caracteres.append(caractere)
+        return caracteres
+    
+    @property
+    def chars(self):
+        if self._chars is None:
+            self._carregar()
+        return self._chars
+    
+    @property
+    def fontes(self):
+        if self._chars is None:
+            self._carregar()
+        return self._fontes
+    
+    def texto(self):
+        if self._texto is None:
+            self._texto = extrair_texto_caracteres(self.chars)
+        return self._texto
+
+@contextlib.contextmanager
+def abrir_pdfium(entrada):
+    documento = _pdfium().pypdfium2.PdfDocument(bytes(entrada) if isinstance(entrada, (bytearray, memoryview)) else entrada)
+    try:
+        def paginas():
+            topo_documento = 0
+            for indice in range(min(len(documento), PAGINAS_ANALISADAS)):
+                pagina = _PaginaPdfium(documento, indice, topo_documento)
+                topo_documento += pagina.altura
+                yield pagina
+        yield paginas()
+    finally:
+        with sem_interrupcao():
+            documento.close()
+
+BACKENDS = {'pdfplumber': abrir_pdfplumber}
+if find_spec('pypdfium2') is not None:
+    BACKENDS['pdfium'] = abrir_pdfium
+BACKEND_PADRAO = os.environ.get('PARSE_PDF_BACKEND') or ('pdfium' if 'pdfium' in BACKENDS else 'pdfplumber')
+if BACKEND_PADRAO not in BACKENDS:
+    BACKEND_PADRAO = 'pdfplumber'
+
+# === TABELA DE APOSTAS POR COLUNAS ===
+# Na calculadora cada aposta ocupa uma faixa de linhas e cada campo tem coluna
+# fixa, alinhada aos títulos "Chance Aposta D C Lucro": casa à esquerda de
+# "Chance", tipo de "Chance" até a odd, stake sob "Aposta" e lucro sob "Lucro".
+# Uma aposta começa na linha que tem valor na coluna de stake e vai até a
+# próxima (ou até "Aposta total"); nomes e tipos quebrados em várias linhas são
+# só as palavras da mesma coluna.
+TOLERANCIA_COLUNA = 4
+TOLERANCIA_LINHA = 4
+REGEX_NUMERO_TABELA = re.compile(r'^[-−]?\d+(?:\.\d+)?$')
+
+def _eh_icone(texto):
+    """
+    Ícones FontAwesome (área de uso privado), marcadores e selos sem valor para os campos
+    """
+    return texto in SEPARADORES or texto in ('●', '○', '\u232a') or all('\ue000' <= c <= '\uf8ff' for c in texto)
+
+def _numero_tabela(texto):
+    return float(texto.replace('−', '-')) if REGEX_NUMERO_TABELA.match(texto) else None
+
+def resolver_casa(casa):
+    """
+    Nome como está no catálogo ("SuperBet (BR)" -> "Super Bet (BR)", "Pinnac1e" -> "Pinnacle")
+    Retorna (casa, distância de edição até o nome impresso); casa desconhecida fica
+    como impressa, com distância None
+    """
+    encontrada, distancia = resolver_casa_aproximada(casa)
+    if encontrada:
+        return encontrada, distancia
+    
+    # Nome impresso com texto a mais em volta da casa: busca a casa contida nele,
+    # com o mesmo sufixo entre parênteses ("Stake (RO)" não vira "Stake")
+    nome, separador, sufixo = casa.partition(' (')
+    chave = normalizar_nome_casa(casa)
+    for candidata in (casa, nome.replace(' ', '') + separador + sufixo):
+        encontrada = buscar_casa_conhecida(candidata)
+        if encontrada:
+            chave_casa = normalizar_nome_casa(encontrada)
+            if separar_sufixo(chave)[1] != separar_sufixo(chave_casa)[1]:
+                continue
+            return encontrada, distancia_edicao(chave, chave_casa, max(len(chave), len(chave_casa)))
+    return casa, None
+
+def _agrupar_linhas(palavras):
+    """
+    Agrupa palavras em linhas visuais pelo topo (odds e ícones ficam ~1.5pt abaixo
+    do texto); cada palavra é comparada com a anterior, as linhas distam ~18pt
+    """
+    linhas = []
+    for palavra in sorted(palavras, key=lambda p: (p['top'], p['x0'])):
+        if linhas and palavra['top'] - linhas[-1][-1]['top'] <= TOLERANCIA_LINHA:
+            linhas[-1].append(palavra)
+        else:
+            linhas.append([palavra])
+    return [sorted(linha, key=lambda p: p['x0']) for linha in linhas]
+
+def extrair_apostas_por_colunas(pagina):
+    """
+    Monta as apostas da tabela da calculadora a partir das palavras da página
+    Retorna lista vazia se os títulos das colunas não forem encontrados
+    """
+    # Só os caracteres da faixa "Chance ... total:" viram palavras (regras e opções abaixo ficam de fora)
+    caracteres = pagina.chars
+    texto = ''.join(c['text'] for c in caracteres)
+    inicio = texto.find('Chance')
+    fim = texto.find('total:', inicio)
+    if inicio < 0 or fim < 0:
+        return []
+    # O texto de um caractere pode ter mais de uma letra (ligaturas, "(cid:N)" de glifos
+    # sem mapeamento no pdfminer): converte a posição no texto no índice do caractere
+    indice_caractere = [indice for indice, c in enumerate(caracteres) for _ in c['text']]
+    topo = caracteres[indice_caractere[inicio]]['top'] - 1
+    base = caracteres[indice_caractere[fim]]['bottom'] + 1
+    palavras = extrair_palavras([c for c in caracteres if topo <= c['top'] <= base])
+    
+    titulos = {}
+    for indice, palavra in enumerate(palavras[:-1]):
+        if palavra['text'] == 'Chance' and palavras[indice + 1]['text'] == 'Aposta':
+            titulos = {'tipo': palavra, 'stake': palavras[indice + 1]}
+            titulos['lucro'] = next((p for p in palavras[indice + 2:] if p['text'] == 'Lucro'), None)
+            break
+    fim_tabela = next((p for p in palavras if p['text'] == 'total:'), None)
+    if not titulos or not titulos['lucro'] or not fim_tabela:
+        return []
+    
+    x_tipo = titulos['tipo']['x0'] - TOLERANCIA_COLUNA
+    x_stake = titulos['stake']['x0'] - TOLERANCIA_COLUNA
+    x_lucro = titulos['lucro']['x0'] - TOLERANCIA_COLUNA
+    corpo = [p for p in palavras
+             if titulos['tipo']['bottom'] < p['top'] < fim_tabela['top'] - TOLERANCIA_LINHA
+             and not _eh_icone(p['text'])]
+    
+    apostas = []
+    atual = None
+    for linha in _agrupar_linhas(corpo):
+        stakes = [p for p in linha if x_stake <= p['x0'] < x_lucro and _numero_tabela(p['text']) is not None]
+        if stakes:
+            # Odd: último número entre o início do tipo e a coluna de stake
+            odds = [p for p in linha if x_tipo <= p['x0'] and p['x1'] <= x_stake and _numero_tabela(p['text']) is not None]
+            if not odds:
+                return []
+            lucros = [p for p in linha if p['x0'] >= x_lucro and _numero_tabela(p['text']) is not None]
+            atual = {
+                'casa': [],
+                'tipo': [],
+                'limite_tipo': odds[-1]['x0'],
+                'odd': _numero_tabela(odds[-1]['text']),
+                'stake': _numero_tabela(stakes[0]['text']),
+                'profit': _numero_tabela(lucros[-1]['text']) if lucros else None,
+            }
+            apostas.append(atual)
+        elif atual is None:
+            continue
+        
+        for palavra in linha:
+            if palavra['x1'] <= x_tipo + TOLERANCIA_COLUNA:
+                atual['casa'].append(palavra['text'])
+            elif palavra['x0'] >= x_tipo and palavra['x1'] <= atual['limite_tipo']:
+                atual['tipo'].append(palavra['text'])
+    
+    resultado = []
+    for aposta in apostas:
+        tipo = REGEX_TRACO_FINAL.sub('', ' '.join(aposta['tipo'])).strip()
+        casa = ' '.join(aposta['casa'])
+        casa, distancia = resolver_casa(casa) if casa else (None, None)
+        resultado.append({
+            'house': casa,
+            'houseMatchDistance': distancia,
+            'odd': aposta['odd'],
+            'type': tipo or None,
+            'stake': aposta['stake'],
+            'profit': aposta['profit'],
+        })
+    return [aposta for aposta in resultado if aposta['house'] and aposta['odd']]
+
+# === TEMPLATES CONHECIDOS ===
+# Cada template é identificado por uma impressão digital barata (tamanho da
+# página, fontes declaradas nos recursos e âncoras no texto da 1ª página) e
+# tem um parser dedicado; o parser genérico de extrair_dados_pdf é o fallback.
+# Para suportar um layout novo basta chamar registrar_template.
+TEMPLATES = []
+CONTADORES_TEMPLATE = {}
+
+def registrar_template(nome, parser, tamanhos=None, fontes=(), ancoras=()):
+    """
+    Registra um template: parser(primeira_pagina, texto_primeira_pagina, dados)
+    preenche dados e retorna True, ou retorna False para cair no parser genérico
+    tamanhos: (largura, altura) em pontos arredondados; None aceita qualquer um
+    """
+    TEMPLATES.append({
+        'nome': nome,
+        'parser': parser,
+        'tamanhos': set(tamanhos) if tamanhos else None,
+        'fontes': frozenset(fontes),
+        'ancoras': list(ancoras),
+    })
+
+def contar_template(nome, template_recusado=None):
+    """
+    Contadores de uso por template (expostos também nos timings)
+    """
+    CONTADORES_TEMPLATE[nome] = CONTADORES_TEMPLATE.get(nome, 0) + 1
+    if template_recusado:
+        chave = f"{template_recusado}:fallback"
+        CONTADORES_TEMPLATE[chave] = CONTADORES_TEMPLATE.get(chave, 0) + 1
+    if _tempos is not None:
+        _tempos['template'] = nome
+
+def _executar_template(template, pagina, texto, dados):
+    """
+    Roda o parser do template; uma exceção nele conta como recusa (False) e o PDF
+    segue para o parser genérico em vez de sair com os dados pela metade
+    """
+    try:
+        return template['parser'](pagina, texto, dados)
+    except LimiteExcedido:
+        raise
+    except Exception as e:
+        registrar_log('aviso', 'erro_template', template=template['nome'], erro=f"{type(e).__name__}: {e}")
+        return False
+
+def impressao_digital_pdf(pagina):
+    """
+    Tamanho da 1ª página e nomes base das fontes dela (sem o prefixo de subset "ABCDEF+")
+    """
+    return {
+        'tamanho': (round(pagina.largura), round(pagina.altura)),
+        'fontes': pagina.fontes,
+    }
+
+def identificar_template(primeira_pagina, texto_primeira_pagina):
+    """
+    Retorna o primeiro template registrado compatível com o PDF, ou None
+    """
+    try:
+        impressao = impressao_digital_pdf(primeira_pagina)
+    except Exception:
+        return None
+    
+    for template in TEMPLATES:
+        if template['tamanhos'] is not None and impressao['tamanho'] not in template['tamanhos']:
+            continue
+        if not template['fontes'] <= impressao['fontes']:
+            continue
+        if all(ancora in texto_primeira_pagina for ancora in template['ancoras']):
+            return template
+    return None
+
+def parser_calculadora_surebet(pagina, texto, dados):
+    """
+    Calculadora do surebet.com impressa pelo navegador (Chrome/Skia em A4,
+    Firefox/cairo e Safari/Quartz em Letter). O cabeçalho vem sempre na mesma
+    ordem (Evento, times e %, ROI, esporte / liga, "Chance Aposta") e a tabela
+    de apostas fica entre "Chance Aposta" e "Aposta total", na 1ª página e é
+    lida pela posição das palavras (extrair_apostas_por_colunas)
+    """
+    t = marcar_tempo()
+    linhas = [linha.strip() for linha in preprocessar_linhas_quebradas(texto).split('\n') if linha.strip()]
+    indice_evento = next((i for i, linha in enumerate(linhas) if 'Evento' in linha and '(' in linha), -1)
+    indice_tabela = next((i for i, linha in enumerate(linhas) if linha.startswith('Chance Aposta')), -1)
+    indice_total = next((i for i in range(indice_tabela + 1, len(linhas)) if 'Aposta total' in linhas[i]), -1)
+    registrar_tempo('preprocessar', t)
+    if indice_evento < 0 or indice_tabela < indice_evento + 3 or indice_total < 0:
+        return False
+    
+    t = marcar_tempo()
+    match_data = REGEX_DATA_EVENTO.search(linhas[indice_evento])
+    if match_data:
+        try:
+            dados['date'] = datetime.strptime(match_data.group(1).strip(), '%Y-%m-%d %H:%M').strftime('%Y-%m-%dT%H:%M')
+        except ValueError:
+            pass
+    
+    linha_times = linhas[indice_evento + 1]
+    match_percent = REGEX_PORCENTAGEM_FINAL.search(linha_times)
+    if '–' not in linha_times or not match_percent:
+        return False
+    dados['profitPercentage'] = float(match_percent.group(1))
+    times = linha_times[:match_percent.start()].split('–')
+    dados['teamA'] = times[0].strip()
+    dados['teamB'] = times[1].strip()
+    
+    partes = linhas[indice_tabela - 1].split(' / ')
+    if len(partes) < 2:
+        return False
+    dados['sport'] = partes[0].strip()
+    dados['league'] = ' / '.join(partes[1:]).strip()
+    registrar_tempo('cabecalho', t)
+    
+    t = marcar_tempo()
+    apostas = extrair_apostas_por_colunas(pagina)
+    registrar_tempo('apostas', t)
+    if len(apostas) < 2:
+        return False
+    
+    preencher_apostas(dados, apostas)
+    return True
+
+registrar_template(
+    'calculadora_surebet',
+    parser_calculadora_surebet,
+    tamanhos=[(595, 842), (612, 792)],
+    fontes=['FontAwesome6Pro-Solid'],
+    ancoras=['Chance Aposta', 'Aposta total'],
+)
+
+def abrir_entrada_pdf(caminho_pdf):
+    """
+    Aceita caminho ou os bytes do PDF; bytes são lidos direto da memória (sem arquivo temporário)
+    """
+    if isinstance(caminho_pdf, (bytes, bytearray, memoryview)):
+        return io.BytesIO(caminho_pdf)
+    return caminho_pdf
+
+def criar_dados_vazios():
+    """
+    Resultado com todos os campos vazios (formato devolvido ao servidor)
+    """
+    return {
         'date': None,
         'sport': None,
         'league': None,
@@ -76,6 +1162,7 @@ def extrair_dados_pdf(caminho_pdf):
         'teamB': None,
         'bet1': {
             'house': None,
+            'houseMatchDistance': None,
             'odd': None,
             'type': None,
             'stake': None,
@@ -83,6 +1170,7 @@ def extrair_dados_pdf(caminho_pdf):
         },
         'bet2': {
             'house': None,
+            'houseMatchDistance': None,
             'odd': None,
             'type': None,
             'stake': None,
@@ -90,32 +1178,108 @@ def extrair_dados_pdf(caminho_pdf):
         },
         'bet3': {
             'house': None,
+            'houseMatchDistance': None,
             'odd': None,
             'type': None,
             'stake': None,
             'profit': None
         },
-        'profitPercentage': None
+        'profitPercentage': None,
+        'fingerprint': None
     }
+
+def extrair_dados_pdf(caminho_pdf, backend=None, estrito=False):
+    """
+    Extrai dados estruturados de um PDF de surebet (backend de BACKENDS; padrão BACKEND_PADRAO)
+    Parser otimizado para 100% de precisão com todos os formatos de PDF
+    Suporta acentos, símbolos especiais (≥, ø, etc.), qualquer casa de apostas
+    Aceita o caminho do arquivo ou os bytes do PDF já em memória
+    Se o backend rápido não achar as duas casas, refaz com o pdfplumber
+    Lança LimiteExcedido se o PDF passar dos tetos de CPU, tempo, memória ou da 1ª página
+    Sem estrito, um erro ao abrir ou interpretar o PDF só vai para o log e volta o
+    resultado vazio; com estrito (lotes) o erro do pdfplumber é lançado
+    """
+    backend = backend or BACKEND_PADRAO
+    with _governador.job():
+        try:
+            dados = _extrair_dados_pdf(caminho_pdf, backend, estrito)
+        except LimiteExcedido:
+            raise
+        except Exception:
+            # Estrito: o backend rápido falhou, o pdfplumber abaixo dá a palavra final
+            if backend == 'pdfplumber':
+                raise
+            dados = criar_dados_vazios()
+        if backend != 'pdfplumber' and not (dados['bet1']['house'] and dados['bet2']['house']):
+            registrar_log('info', 'fallback_backend', backend=backend)
+            backend = 'pdfplumber'
+            dados = _extrair_dados_pdf(caminho_pdf, backend, estrito)
+    if _tempos is not None:
+        _tempos['backend'] = backend
+    return dados
+
+def _extrair_dados_pdf(caminho_pdf, backend, estrito=False):
+    dados = criar_dados_vazios()
     
     try:
-        with pdfplumber.open(caminho_pdf) as pdf:
-            for pagina in pdf.pages[:2]:  # Processa até 2 páginas
-                texto = pagina.extract_text()
+        t = marcar_tempo()
+        # Páginas criadas sob demanda: a 2ª só é aberta se a 1ª não trouxe tudo
+        with BACKENDS[backend](caminho_pdf) as paginas:
+            registrar_tempo('abrir', t)
+            
+            # === IDENTIFICAÇÃO DO TEMPLATE ===
+            # A primeira página é extraída uma vez só e reaproveitada pelo parser genérico
+            if _tempos is not None:
+                _tempos['pages'].append({'page': 1, 'stages': {}})
+            t = marcar_tempo()
+            primeira_pagina = next(paginas, None)
+            texto_primeira_pagina = primeira_pagina.texto() if primeira_pagina else ''
+            registrar_tempo('extract_text', t)
+            if primeira_pagina and primeira_pagina.limite_excedido:
+                # Sem a 1ª página não há surebet: o job termina com o limite excedido
+                raise primeira_pagina.limite_excedido
+            
+            t = marcar_tempo()
+            template = identificar_template(primeira_pagina, texto_primeira_pagina) if texto_primeira_pagina else None
+            registrar_tempo('template', t)
+            
+            if template and _executar_template(template, primeira_pagina, texto_primeira_pagina, dados):
+                contar_template(template['nome'])
+                dados['fingerprint'] = impressao_semantica(dados)
+                return dados
+            
+            # Template desconhecido, fora do padrão esperado ou com erro: parser genérico do zero
+            contar_template('generico', template['nome'] if template else None)
+            dados = criar_dados_vazios()
+            
+            for numero_pagina, pagina in enumerate(itertools.chain([primeira_pagina], paginas), 1):
+                if numero_pagina == 1:
+                    texto = texto_primeira_pagina
+                else:
+                    if _tempos is not None:
+                        _tempos['pages'].append({'page': numero_pagina, 'stages': {}})
+                    t = marcar_tempo()
+                    texto = pagina.texto()
+                    registrar_tempo('extract_text', t)
                 if not texto:
                     continue
                 
                 # Pré-processa para juntar linhas quebradas (como BravoBet + (BR))
+                t = marcar_tempo()
                 texto_preprocessado = preprocessar_linhas_quebradas(texto)
                 
                 # Divide em linhas e limpa
                 linhas = [linha.strip() for linha in texto_preprocessado.split('\n') if linha.strip()]
                 
+                # Classifica cada linha uma única vez; as etapas abaixo só leem as marcações
+                info_linhas = classificar_linhas(linhas)
+                registrar_tempo('preprocessar', t)
                 
+                t = marcar_tempo()
                 # === EXTRAÇÃO DE DATA/HORA ===
-                for linha in linhas:
-                    if 'Evento' in linha and '(' in linha:
-                        match_data = re.search(r'\((\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})', linha)
+                for info in info_linhas:
+                    if info['evento']:
+                        match_data = REGEX_DATA_EVENTO.search(info['texto'])
                         if match_data:
                             try:
                                 data_str = match_data.group(1).strip()
@@ -126,10 +1290,11 @@ def extrair_dados_pdf(caminho_pdf):
                         break
                 
                 # === EXTRAÇÃO DE TIMES E PORCENTAGEM ===
-                for linha in linhas:
-                    if '–' in linha and '%' in linha and 'ROI' not in linha and 'Evento' not in linha:
+                for info in info_linhas:
+                    if info['times']:
+                        linha = info['texto']
                         # Remove porcentagem para extrair times
-                        match_percent = re.search(r'(\d+\.\d+)%\s*$', linha)
+                        match_percent = REGEX_PORCENTAGEM_FINAL.search(linha)
                         if match_percent:
                             dados['profitPercentage'] = float(match_percent.group(1))
                             linha_times = linha[:match_percent.start()].strip()
@@ -147,30 +1312,20 @@ def extrair_dados_pdf(caminho_pdf):
                 # === EXTRAÇÃO DE ESPORTE E LIGA ===
                 # Encontra índice da linha de times para usar como âncora
                 indice_times = -1
-                for i, linha in enumerate(linhas):
-                    if dados['teamA'] and dados['teamA'] in linha and dados['teamB'] and dados['teamB'] in linha:
-                        indice_times = i
-                        break
+                if dados['teamA'] and dados['teamB']:
+                    for i, linha in enumerate(linhas):
+                        if dados['teamA'] in linha and dados['teamB'] in linha:
+                            indice_times = i
+                            break
                 
                 # Primeiro tenta com palavras-chave conhecidas (deve estar próximo aos times)
-                for i, linha in enumerate(linhas):
+                for i, info in enumerate(info_linhas):
                     # Se tem índice de times, esporte deve estar próximo (±5 linhas)
                     if indice_times >= 0 and abs(i - indice_times) > 5:
                         continue
                     
-                    if ' / ' in linha and any(sport in linha.lower() for sport in [
-                        'futebol', 'football', 'soccer',
-                        'basquete', 'basketball', 'basquetebol',
-                        'tênis', 'tennis',
-                        'hóquei', 'hockey', 'hoquei',
-                        'beisebol', 'beisebal', 'baseball',
-                        'voleibol', 'volleyball', 'vôlei', 'volei',
-                        'handball', 'handebol',
-                        'rugby',
-                        'cricket',
-                        'futsal'
-                    ]):
-                        partes = linha.split(' / ')
+                    if info['esporte_liga']:
+                        partes = info['texto'].split(' / ')
                         if len(partes) >= 2:
                             dados['sport'] = partes[0].strip()
                             dados['league'] = ' / '.join(partes[1:]).strip()
@@ -180,21 +1335,11 @@ def extrair_dados_pdf(caminho_pdf):
                 if not dados['sport'] and dados['teamA'] and indice_times >= 0:
                     # Procura APENAS nas linhas imediatamente após os times (máximo +3 linhas)
                     for i in range(indice_times + 1, min(indice_times + 4, len(linhas))):
-                        linha = linhas[i]
+                        info = info_linhas[i]
                         
-                        # Deve ter " / " e NÃO ter marcadores de outras seções
-                        if (' / ' in linha and 
-                            'Evento' not in linha and 
-                            'ROI' not in linha and
-                            '–' not in linha and      # Não é linha de times
-                            '%' not in linha and      # Não tem porcentagem
-                            'USD' not in linha and    # Não é linha de aposta
-                            'BRL' not in linha and
-                            'Chance' not in linha and # Não é header de tabela
-                            'Aposta' not in linha and
-                            not re.search(r'\d+\.\d{2,}', linha)):  # Não tem odds (números com 2+ decimais)
-                            
-                            partes = linha.split(' / ')
+                        # Deve ter " / " e NÃO ter marcadores de outras seções/tabela de apostas
+                        if info['barra_generica']:
+                            partes = info['texto'].split(' / ')
                             if len(partes) >= 2:
                                 # Valida que a primeira parte parece um esporte
                                 possivel_esporte = partes[0].strip()
@@ -203,175 +1348,19 @@ def extrair_dados_pdf(caminho_pdf):
                                 # Esporte deve ser curto e não conter números grandes
                                 if (len(possivel_esporte) < 30 and 
                                     possivel_esporte and 
-                                    not re.search(r'\d{2,}', possivel_esporte)):  # Sem números de 2+ dígitos
+                                    not REGEX_NUMERO_2_DIGITOS.search(possivel_esporte)):  # Sem números de 2+ dígitos
                                     dados['sport'] = possivel_esporte
                                     dados['league'] = possivel_liga
                                     break
+                registrar_tempo('cabecalho', t)
                 
                 # === EXTRAÇÃO DE APOSTAS ===
-                apostas_encontradas = []
-                
-                # Processa linha por linha procurando apostas
-                i = 0
-                while i < len(linhas):
-                    linha = linhas[i]
-                    
-                    # Detecta casa de apostas dinamicamente
-                    casa_encontrada = detectar_casa_apostas(linha)
-                    
-                    if casa_encontrada:
-                        # Coleta linhas da aposta (pode estar dividida em múltiplas linhas)
-                        texto_aposta = linha
-                        j = i + 1
-                        
-                        # PRIMEIRO: Coleta fragmentos do nome da casa (linhas curtas sem números/símbolos)
-                        # Exemplo: "Marjo" -> "Sports" -> "(BR)"
-                        fragmentos_casa = []
-                        linhas_usadas_fragmentos = set()  # Rastreia linhas totalmente usadas
-                        linhas_parcialmente_usadas = {}  # {index_linha: resto_da_linha}
-                        while j < len(linhas) and j < i + 4:  # Máximo 3 linhas para completar casa
-                            proxima_linha = linhas[j].strip()
-                            
-                            # Para se for linha vazia, de separação ou símbolos
-                            if not proxima_linha or proxima_linha in ['〉', '○', '●', '\uf35d', 'new']:
-                                j += 1
-                                continue
-                            
-                            # Se tem dados financeiros/símbolos, não é fragmento da casa
-                            if any(s in proxima_linha for s in ['USD', 'BRL', '●', '○', '\uf35d']) or re.search(r'\d+\.\d+', proxima_linha):
-                                break
-                            
-                            # Se é linha muito curta (< 30 chars), pode ser fragmento da casa
-                            # Exemplos: "Sports", "(BR)", "Sports escanteios"
-                            if len(proxima_linha) < 30:
-                                nova_casa = detectar_casa_apostas(proxima_linha)
-                                
-                                # Fragmento válido se: não é casa nova
-                                if not nova_casa:
-                                    # Aceita (BR), (CO), etc
-                                    if re.match(r'^\([A-Z]{2}\)$', proxima_linha):
-                                        fragmentos_casa.append(proxima_linha)
-                                        linhas_usadas_fragmentos.add(j)
-                                        j += 1
-                                    # Aceita palavras simples como "Sports", "Bet", etc (parte do nome da casa)
-                                    elif len(proxima_linha.split()) == 1 and proxima_linha[0].isupper():
-                                        fragmentos_casa.append(proxima_linha)
-                                        linhas_usadas_fragmentos.add(j)
-                                        j += 1
-                                    # Se tem múltiplas palavras, pega só a PRIMEIRA se for capitalizada
-                                    # Ex: "Sports escanteios" -> pega "Sports", resto vai para tipo
-                                    elif proxima_linha[0].isupper():
-                                        palavras = proxima_linha.split()
-                                        if palavras[0][0].isupper() and not re.search(r'\b(gol|time|cantos?|escanteios?|acima|abaixo)\b', palavras[0].lower()):
-                                            fragmentos_casa.append(palavras[0])
-                                            # Salva o resto da linha para adicionar ao tipo depois
-                                            resto = ' '.join(palavras[1:])
-                                            if resto:
-                                                linhas_parcialmente_usadas[j] = resto
-                                            linhas_usadas_fragmentos.add(j)
-                                            j += 1
-                                        else:
-                                            break
-                                    else:
-                                        break
-                                else:
-                                    break
-                            else:
-                                break
-                        
-                        # Atualiza nome da casa com fragmentos coletados
-                        if fragmentos_casa:
-                            casa_encontrada = casa_encontrada + ' ' + ' '.join(fragmentos_casa)
-                        
-                        # Correção especial para casas conhecidas fragmentadas
-                        # Se detectou "Marjo" mas não tem "Sports" no nome, verifica se está no texto
-                        if casa_encontrada.startswith('Marjo') and 'Sports' not in casa_encontrada:
-                            # Procura "Sports" nas linhas já coletadas (i até j)
-                            for k in range(i, min(j, len(linhas))):
-                                if 'Sports' in linhas[k]:
-                                    casa_encontrada = 'Marjo Sports (BR)'
-                                    break
-                        
-                        # DEPOIS: Coleta linhas com dados financeiros e continuação do tipo
-                        while j < len(linhas) and j < i + 8:  # Máximo total 8 linhas
-                            proxima_linha = linhas[j]
-                            
-                            # Trata linhas usadas como fragmentos da casa
-                            if j in linhas_usadas_fragmentos:
-                                # Se foi parcialmente usada, adiciona o resto ao texto
-                                if j in linhas_parcialmente_usadas:
-                                    texto_aposta += ' ' + linhas_parcialmente_usadas[j]
-                                j += 1
-                                continue
-                            
-                            # Para se encontrar outra casa de apostas diferente
-                            # PRIMEIRO: Detecta se a linha é uma palavra capitalizada curta (potencial início de casa)
-                            # Usa detectar_casa_apostas para validar se é prefixo de casa conhecida
-                            palavras_linha = proxima_linha.strip().split()
-                            if palavras_linha:
-                                primeira_palavra = palavras_linha[0]
-                                
-                                # Se é palavra capitalizada curta (3-15 chars) SEM números/odds
-                                if (len(primeira_palavra) >= 3 and 
-                                    len(primeira_palavra) <= 15 and 
-                                    primeira_palavra[0].isupper() and
-                                    not re.search(r'\d+\.\d+', proxima_linha)):  # Não tem odds
-                                    
-                                    # Tenta detectar a palavra como possível casa
-                                    possivel_casa = detectar_casa_apostas(primeira_palavra)
-                                    if possivel_casa:
-                                        # É uma palavra que inicia uma casa conhecida
-                                        # Compara com casa atual para ver se é diferente
-                                        casa_atual_base = casa_encontrada.split()[0] if casa_encontrada else ""
-                                        if casa_atual_base.lower() != primeira_palavra.lower():
-                                            # É uma casa NOVA diferente - para imediatamente!
-                                            print(f"DEBUG: Detectada NOVA CASA! casaAtual={casa_atual_base} novaDetectada={primeira_palavra} linha={proxima_linha[:50]}", file=sys.stderr)
-                                            break
-                            
-                            # SEGUNDO: Tenta detecção normal de casa
-                            casa_na_proxima = detectar_casa_apostas(proxima_linha)
-                            if casa_na_proxima:
-                                # Para se for uma casa DIFERENTE da atual
-                                casa_atual_base = casa_encontrada.split()[0] if casa_encontrada else ""
-                                casa_proxima_base = casa_na_proxima.split()[0] if casa_na_proxima else ""
-                                
-                                # Se são casas diferentes, para imediatamente
-                                if casa_atual_base.lower() != casa_proxima_base.lower():
-                                    break
-                                
-                            # Para se encontrar "Aposta total" ou outras seções
-                            if any(keyword in proxima_linha for keyword in ['Aposta total', 'Mostrar', 'Use sua', 'Arredondar']):
-                                break
-                            
-                            # Adiciona linha se contém dados relevantes OU se é continuação de tipo de aposta
-                            tem_dados_financeiros = any(keyword in proxima_linha for keyword in ['USD', 'BRL', '●', '○']) or re.search(r'\d+\.\d+', proxima_linha)
-                            eh_continuacao_tipo = bool(re.search(r'\b(gol|time|cantos?|escanteios?|resultado|final|tempo|minuto|chute|corner|primeiro|segundo|1º|2º|over|under|acima|abaixo|casa|fora|empate|handicap)\b', proxima_linha.lower()))
-                            eh_linha_curta = len(proxima_linha.split()) <= 6
-                            
-                            if tem_dados_financeiros or (eh_continuacao_tipo and eh_linha_curta):
-                                texto_aposta += ' ' + proxima_linha
-                                j += 1
-                            else:
-                                break
-                        
-                        # Processa o texto coletado da aposta
-                        aposta = processar_aposta_completa(texto_aposta, casa_encontrada)
-                        if aposta and aposta['house'] and aposta['odd']:
-                            apostas_encontradas.append(aposta)
-                        
-                        i = j  # Pula para depois desta aposta
-                    else:
-                        i += 1
+                t_apostas = marcar_tempo()
+                apostas_encontradas = extrair_apostas(linhas, info_linhas)
+                registrar_tempo('apostas', t_apostas)
                 
                 # Mapeia apostas para bet1, bet2 e bet3 (se houver)
-                if len(apostas_encontradas) >= 1:
-                    dados['bet1'].update(apostas_encontradas[0])
-                
-                if len(apostas_encontradas) >= 2:
-                    dados['bet2'].update(apostas_encontradas[1])
-                
-                if len(apostas_encontradas) >= 3:
-                    dados['bet3'].update(apostas_encontradas[2])
+                preencher_apostas(dados, apostas_encontradas)
                 
                 # Se encontrou dados suficientes, para
                 # Para apostas duplas: bet1 e bet2 devem ter house (e menos de 3 apostas detectadas)
@@ -384,214 +1373,294 @@ def extrair_dados_pdf(caminho_pdf):
                     if bets_detected < 3 or dados['bet3']['house']:
                         break
     
+    except LimiteExcedido:
+        raise
     except Exception as e:
-        print(f"Erro ao processar PDF: {str(e)}", file=sys.stderr)
+        registrar_log('erro', 'erro_processar_pdf', erro=str(e))
+        if estrito:
+            raise
     
+    dados['fingerprint'] = impressao_semantica(dados)
     return dados
 
-def detectar_casa_apostas(linha):
+# === LOTE EM PROCESSOS FILHOS ===
+# extrair_lote monta o catálogo, os índices de casas e as bibliotecas do backend uma
+# vez no processo pai e só então cria os filhos com fork: essas estruturas ficam
+# compartilhadas por cópia-na-escrita e a memória por filho não cresce com o número
+# de núcleos. gc.freeze() tira os objetos já criados das coletas do GC, que senão
+# escreveriam nos cabeçalhos deles (e copiariam as páginas) em cada filho.
+# Sem fork (Windows/macOS) cada filho importa o módulo e monta os seus.
+
+def preparar_processo(backend=None):
     """
-    Detecta casas de apostas usando lista completa do sistema (1005+ casas)
-    Suporta todas as variantes incluindo casas com parênteses como KTO (BR), Blaze (BR)
-    Detecta também fragmentos iniciais de casas compostas (ex: "Cloud" -> CloudBet)
+    Monta tudo que a extração usa sob demanda, antes de criar processos filhos
     """
-    # Lista completa de todas as casas de apostas do sistema
-    casas_sistema = [
-        '10Bet', '10Bet (SE)', '10Bet (ZA)', '10Bet (UK)', '10Bet (MX)', '888Games', '10Cric', '188Bet',
-        '188Bet (PT)', '188Bet (Sbk)', '188Bet (ZH)', 'HGA030 (Crown)', 'HGA035 (Crown)', '18Bet', 'BabiBet',
-        'Hollywoodbets (UK)', 'Premium Tradings', 'RoyalistPlay', 'RoyalistPlay (Bet)', '1Bet (CO)', '21Red',
-        'Bet-Bra SB (BR)', 'BetOBet', 'BetOBet (CC)', 'Dazzlehand', 'FoggyBet', 'OneCasino', 'Scarawins',
-        '1Win (Original)', '1xBet', '1xBet (AG)', '1xBet (BO)', '1xBet (MD)', '1xBet (NG)', '1xstavka (RU)',
-        'Betandyou', 'Linebet', 'MegaPari', 'Oppa88', 'Pari-pesa', 'Paripesa', 'Paripesa (Asia)', 'Paripesa (Biz)',
-        'Paripesa (Com)', 'Paripesa (Cool)', 'Paripesa (ME)', 'Paripesa (Net)', 'Paripesa (NG)', 'Paripesa (PT)',
-        'Paripesa (Site)', 'Paripesaut', 'SapphireBet', '1xBet (ES)', '1xBet (IT)', 'Fastbet (IT)', '22Bet',
-        '22Bet (CM)', '22Bet (NG)', '22win88', 'Bestwinzz', '32Red', 'Unibet (EE)', 'Unibet (IE)', 'Unibet (UK)',
-        '3et', '888sport', '888sport (DE)', '888sport (DK)', '888sport (ES)', '888sport (RO)', 'MrGreen',
-        'MrGreen (DK)', 'MrGreen (SE)', '888sport (IT)', 'AccessBet', 'AdjaraBet', 'Admiral (AT)', 'Admiral (DE)',
-        'AdmiralBet (ES)', 'AdmiralCasino (UK)', 'Swisslos (CH)', 'AdmiralBet (IT)', 'Afribet (NG)', 'Betfred (ZA)',
-        'AI Sports', 'AirBet (IT)', 'AndromedaBet (IT)', 'BetItaly (IT)', 'Akbets', 'AlfaBet (BR)', 'Aposta1 (BR)',
-        'Apostaganha (BR)', 'ArtlineBet', 'AsianOdds', 'B1Bet (BR)', 'Bahigo', 'Kakeyo', 'BaltBet (RU)',
-        'BandBet (BR)', 'BangBet', 'Betsure', 'BantuBet (AO)', 'Bet2U2', 'BetBaba (NG)', 'Bet-at-home',
-        'Bet-at-home (DE)', 'Bet-Bra (BR)', 'Bet25 (DK)', 'Bet3000 (DE)', 'Bet365 (Fast)', '28365365', '365-808',
-        '365sb', '365sport365', '878365', 'Allsport365', 'Bet365 (AU)', 'Bet365 (BR)', 'Bet365 (DE)', 'Bet365 (ES)',
-        'Bet365 (GR)', 'Bet365 (IT)', 'Bet365 (NL)', 'Game-365 (CN)', 'Bet365 (Full)', 'Bet4 (BR)', 'Bet4',
-        'Bet4 (PE)', 'Bet7', 'Bet7k (BR)', 'B2XBET (BR)', 'BetBet (BR)', 'Cassino (BR)', 'Donald (BR)', 'Vera (BR)',
-        'Bet9ja', 'Betadonis', 'Betaland (IT)', 'Betano', 'Betano (CZ)', 'Betano (DE)', 'Betano (MX)', 'Betano (NG)',
-        'Betano (RO)', 'Betano (BR)', 'Betano (PT)', 'Betao (BR)', 'BravoBet (BR)', 'Maxima (BR)', 'R7Bet (BR)',
-        'XpBet (BR)', 'BetBoom (BR)', 'BetBoom', 'BetBoom (RU)', 'Betboro', 'Betboro (GH)', 'Betcity',
-        'Betcity (BY)', 'Betcity (Net)', 'Betcity (RU)', 'Formula55 (TJ)', 'Betcity (NL)', 'SpeedyBet', 'BetClic',
-        'BetClic (FR)', 'BetClic (IT)', 'BetClic (PL)', 'BetClic (PT)', 'Betcris', 'Betcris (DO)', 'Betcris (MX)',
-        'Betcris (PL)', 'BetDaq', 'BetDaSorte (BR)', 'Afun (BR)', 'BetDSI (EU)', 'BetEsporte (BR)', 'LanceDeSorte (BR)',
-        'Betfair', 'Betfair (AU)', 'Betfair (BR)', 'Betfair (RO)', 'SatSport', 'Sharpxch', 'Tradexbr',
-        'Betfair (ES)', 'Betfair (IT)', 'Betfair (MBR)', 'Betfair SB', 'Betfair SB (ES)', 'Betfair SB (RO)',
-        'Betfarm', 'Betfirst (BE)', 'Betflip', 'Casobet (Sport)', 'Fairspin', 'Tether', 'Betfred', 'BetiBet',
-        'Betika (KE)', 'BetInAsia (Black)', 'Betinia', 'CampoBet', 'Lottoland (UK)', 'BetKing', 'Betlive',
-        'Betmaster', 'BetMomo', 'Betnacional (BR)', 'Betnation (NL)', 'BetOnline (AG)', 'BetOnline (Classic)',
-        'LowVig (AG)', 'SportsBetting (AG)', 'TigerGaming', 'BetPawa (NG)', 'BetPawa (CM)', 'BetPawa (GH)',
-        'BetPawa (KE)', 'BetPawa (RW)', 'BetPawa (TZ)', 'BetPawa (UG)', 'BetPawa (ZM)', 'BetPix365 (BR)',
-        'Vaidebet', 'BetRebels', '21Bets', '7bet (LT)', 'All British Casino', 'ApuestaTotal', 'Bankonbet',
-        'BaumBet (RO)', 'Bet593 (EC)', 'Betaki (BR)', 'Betanoshops (NG)', 'Betinia (DK)', 'Betinia (SE)',
-        'BetNFlix', 'Bettarget (UK)', 'CampeonBet', 'Casinado', 'CasinoAtlanticCity', 'Casinoly', 'Cazimbo',
-        'DoradoBet', 'Ecuabet', 'ElaBet (GR)', 'EsportivaBet (BR)', 'EstrelaBet (BR)', 'EvoBet', 'FezBet',
-        'FrankSports (RO)', 'GastonRed', 'Golden Palace (BE)', 'Greatwin', 'Jogodeouro (BR)', 'Juegaenlineachile (CL)',
-        'JupiCasino', 'Karamba', 'Karamba (UK)', 'Lapilanders', 'LotoGreen (BR)', 'Lottland (IE)', 'Lottoland',
-        'Lottoland (AT)', 'MalinaCasino', 'Mcgames (BR)', 'Merkurxtip (CZ)', 'Metgol (BR)', 'MiСasino',
-        'MrBit (BG)', 'MrBit (RO)', 'MultiBet (BR)', 'NinjaCasino', 'Novajackpot', 'Playdoit (MX)', 'PowBet',
-        'Rabona', 'RabonaBet', 'RtBet', 'SlotV (RO)', 'SONSofSLOTS', 'Spinanga', 'Sportaza', 'StarCasinoSport (BE)',
-        'Supacasi', 'SvenBet', 'Svenplay', 'ToonieBet (CA)', 'Vavada', 'Vegas (HU)', 'Wazamba', 'Winpot (MX)',
-        'Betrivers (CA)', 'Betrivers (AZ)', 'Betsafe', 'Bethard', 'Betsafe (EE)', 'Betsafe (LV)', 'Betsafe (SE)',
-        'Betsson', 'Bets10', 'Betsson (AR)', 'Betsson (BR)', 'Betsson (CO)', 'Betsson (SE)', 'Inkabet (PE)',
-        'Betsson (ES)', 'Betpark (BR)', 'SupremaBet (BR)', 'Betsson (FR)', 'Betsson (GE)', 'Betsson (GR)',
-        'Betsmith', 'Betsson (IT)', 'Betsul (BR)', 'Betuk (UK)', 'Betus (PA)', 'BetVictor', 'Parimatch (UK)',
-        'Puntit (IN)', 'BetWarrior', 'BetWarrior (BR)', 'BetWarrior (Caba)', 'BetWarrior (MZA)', 'BetWarrior (PBA)',
-        'BetWarrior Apuestas (AR)', 'LeoVegas (IT)', 'Svenska Spel (SE)', 'BetWay', 'BetWay (DE)', 'BetWay (ES)',
-        'BetWay (MX)', 'BetWay (IT)', 'Betwgb', 'AdmiralBet (ME)', 'AdmiralBet (RS)', 'AdmiralBet (UG)', 'BetX (CZ)',
-        'Betxchange', 'Bingoal (BE)', 'BallyBet', 'BetPlay (CO)', 'Bingoal (NL)', 'Desert Diamond', 'Expekt (SE)',
-        'Blaze', '4RaBet', '4RaBet (Play)', '500Casino', 'Africa365', 'BC.Game', 'BetFury', 'Betonred',
-        'Betonred (NG)', 'BetPlay', 'BetTilt', 'Betvip', 'Betvip (BR)', 'BilBet', 'Bitz', 'Blaze (BR)',
-        'BloodMoon (CO)', 'BlueChip', 'Bons', 'CasinoX', 'Casinozer', 'Casinozer (EU)', 'CsGo500', 'Fortunejack',
-        'HugeWin', 'JetBet (BR)', 'JonBet (BR)', 'Joycasino', 'Lucky Block', 'Lucky Block (Top)', 'Opabet',
-        'PinBet', 'Pokerdom', 'PuskasBet (BR)', 'Rainbet', 'RajaBets', 'Razed', 'Riobet', 'Rivalry', 'Rollbit',
-        'RooBet', 'Slots Safari (CO)', 'Solcasino', 'TrBET', 'Yonibet', 'Yonibet (EU)', 'BoaBet', 'Bodog (EU)',
-        'Bovada (LV)', 'BolsaDeAposta (BR)', 'BolsaDeAposta TB (BR)', 'BookMaker (EU)', 'JustBet (CO)',
-        'BookmakerXyz', 'BoyleSports', 'Brazino 777', 'Brazino 777 (BY)', 'Brazino 777 (IO)', 'Wazobet',
-        'BrBet (BR)', 'BresBet', 'Bumbet', 'Bwin', 'Betboo (BR)', 'Betmgm (CA)', 'Betmgm (MA)', 'Betmgm (NY)',
-        'Bwin (BE)', 'Bwin (DE)', 'Bwin (DK)', 'Bwin (ES)', 'Bwin (GR)', 'Bwin (IT)', 'Gamebookers',
-        'Giocodigitale (IT)', 'Ladbrokes (DE)', 'Oddset (DE)', 'Partypoker', 'Sportingbet', 'Sportingbet (BR)',
-        'Sportingbet (DE)', 'Sportingbet (GR)', 'Sportingbet (ZA)', 'Vistabet (GR)', 'Bwin (FR)', 'Bwin (PT)',
-        'Caliente (MX)', 'Betcha (PA)', 'Marca Apuestas (ES)', 'Wplay (CO)', 'CampoBet (DK)', 'Casa Pariurilor (RO)',
-        'Fortuna (RO)', 'CasaDeApostas (BR)', 'Betmais', 'CasinoPortugal (PT)', 'CBet', 'CBet (LT)', 'Circus (BE)',
-        'Circus (NL)', 'CloudBet', 'Codere (ES)', 'Codere (AR)', 'Codere (MX)', 'Comeon', 'Casinostugan',
-        'Comeon (PL)', 'Hajper', 'Lyllo Casino', 'MobileBet', 'Nopeampi', 'Pzbuk (PL)', 'Saga Kingdom',
-        'Snabbare', 'SunMaker (DE)', 'Comeon (NL)', 'CoolBet', 'CoolBet (CL)', 'CoolBet (PE)', 'Coral (UK)',
-        'Crocobet', 'CrystalBet (GE)', 'DafaBet (ES)', 'DafaBet (Sports)', 'Amperjai', 'Nextbet', 'DafaBet OW (Saba)',
-        '12Bet (Saba)', '12Bet (Saba-ID)', '12Bet (Saba-MY)', 'CMD368 (Saba)', 'M88 (Saba)', 'W88Live (Saba)',
-        'Danskespil (DK)', 'DaznBet (ES)', 'DaznBet (UK)', 'DomusBet (IT)', 'DoxxBet (SK)', 'Draftkings',
-        'Draftking (CT)', 'DragonBet (UK)', 'DripCasino', 'Duelbits', 'Easybet (ZA)', 'Ebingo (ES)', 'BetaBet',
-        'BetaBet (Net)', 'Betcoin (AG)', 'ShansBet', 'EDSBet', 'Efbet (ES)', 'Efbet (BG)', 'Efbet (IT)',
-        'Efbet (RO)', 'Efbet (GR)', 'Efbet (Net)', 'EGB', 'EGB SPORT', 'EpicBet', 'Eplay24 (IT)',
-        'BegameStar (IT)', 'Betwin360 (IT)', 'SportItaliaBet (IT)', 'EsporteNetBet (BR)', 'BetsBola',
-        'EsporteNetSP (BR)', 'EsporteNetVip (BR)', 'EsporteNetVip', 'EsportesDaSorte (BR)', 'EstorilSolCasinos (PT)',
-        'Etipos (SK)', 'Etopaz (AZ)', 'Etoto (PL)', 'EuroBet (IT)', 'EveryGame (EU)', 'ExclusiveBet', 'Betfinal',
-        'IZIbet', 'MrXBet', 'ShangriLa', 'UniClub (LT)', 'Expekt (DK)', 'LeoVegas (DK)', 'F12Bet (BR)',
-        'SPIN (BR)', 'Fanatics', 'FanDuel', 'Betfair SB (BR)', 'FanDuel (CT)', 'Fastbet', 'CopyBet (CY)',
-        'FavBet', 'FavBet (UA)', 'FB Sports', 'Fonbet', 'BeteryBet (IN)', 'Bettery (RU)', 'Fonbet (GR)',
-        'Fonbet (KZ)', 'Fonbet (Mobile)', 'Pari (RU)', 'Football (NG)', 'Fortuna (CZ)', 'Fortuna (PL)',
-        'Fortuna (SK)', 'FulltBet (BR)', 'GaleraBet (BR)', '888Casino (Arabic)', 'Gamdom', 'GazzaBet (IT)',
-        'Germania (HR)', 'GGBet', 'Freeggbet', 'Vulkan', 'Goalbet', 'GoldBetShop (IT)', 'BetFlag (IT)',
-        'GoldBet (IT)', 'IntralotShop (IT)', 'Lottomatica (IT)', 'PlanetWin365 (IT)', 'GoldenPark (ES)',
-        'CasinoBarcelona (ES)', 'Solcasino (ES)', 'GoldenPark (PT)', 'GoldenVegas (BE)', 'GrandGame (BY)',
-        'HiperBet (BR)', 'HKJC', 'HoliganBet (TR)', 'JojoBet', 'Holland Casino (NL)', 'Hollywoodbets',
-        'Hollywoodbets (MZ)', 'iForBet (PL)', 'Ilotbet', 'Interwetten', 'Interwetten (ES)', 'Interwetten (GR)',
-        'IviBet', '20Bet', 'Jacks (NL)', 'Expekt', 'JetCasino', 'Flagman', 'FreshCasino', 'Rox (Sport)',
-        'Jokerbet (ES)', 'JSB', 'Boltbet (GH)', 'Primabet (GM)', 'TicTacBets (ZA)', 'JugaBet (CL)',
-        'Parimatch (TJ)', 'KingsBet (CZ)', 'KirolBet (ES)', 'Apuestasvalor (ES)', 'Aupabet (ES)', 'Juegging (ES)',
-        'Kwiff', 'Betkwiff', 'Ladbrokes', 'Ladbrokes (BE)', 'LeaderBet', 'Lebull (PT)', 'Leon', 'Leon (RU)',
-        'Twin', 'LeoVegas', 'Betmgm (BR)', 'Williamhill (SE)', 'LeoVegas (ES)', 'LigaStavok (RU)',
-        'LivescoreBet (NG)', 'SunBet (ZA)', 'LivescoreBet (UK)', 'LivescoreBet (IE)', 'VirginBet', 'LsBet',
-        'KikoBet', 'Mundoapostas', 'ReloadBet', 'SlottoJAM', 'TornadoBet', 'Luckia (ES)', 'Luckia (CO)',
-        'Luckia (MX)', 'LvBet', 'LvBet (LV)', 'LvBet (PL)', 'Mansion (M88-BTI)', 'Marathon', 'Marathon (BY)',
-        'Marathon (RU)', 'MBet', 'MarathonBet (DK)', 'MarathonBet (ES)', 'MarathonBet (IT)', 'MarjoSports (BR)', 'Marjo Sports (BR)', 'Marjo',
-        'Matchbook', 'Maxbet (RS)', 'Maxbet (BA)', 'MaxLine (BY)', 'Mcbookie', 'StarSports', 'MelBet',
-        'Betwinner', 'DBbet', 'MelBet (BI)', 'MelBet (KE)', 'MelBet (MN)', 'Meridian', 'Meridian (CY)',
-        'Meridian (BE)', 'Meridian (BA)', 'Meridian (ME)', 'Meridian (RS)', 'Meridian (PE)', 'JogaBets (MZ)',
-        'Meridian (BR)', 'MerkurBets', 'Betcenter (BE)', 'Cashpoint (DK)', 'MerkurBets (DE)', 'Miseojeu+',
-        'Misli (AZ)', 'MostBet', 'Mozzart', 'Mozzart (BA)', 'Mozzart (NG)', 'Mozzart (RO)', 'MSport (GH)',
-        'MSport (NG)', 'Mystake', '31Bet', '9dBet (BR)', 'Betfast', 'Betfast (BR)', 'Donbet', 'Donbet (Win)',
-        'Faz1Bet (BR)', 'Freshbet', 'Goldenbet', 'Jackbit', 'Mystake (Bet)', 'Rolletto', 'TivoBet (BR)',
-        'Velobet (Win)', 'Wjcasino (BR)', 'N1Bet', '12Play', 'CelsiusCasino', 'Coins Game', 'Wild', 'YBets',
-        'NaijaBet', 'NairaBet', 'Napoleon (BE)', 'Neobet', 'Neobet (CA)', 'Neobet (DE)', 'Neobet (ZA)',
-        'Nesine (TR)', 'Bilyoner', 'Misli (Com)', 'Oley', 'NetBet', 'Bet777 (BE)', 'Bet777 (ES)', 'NetBet (GR)',
-        'NetBet (BR)', 'NetBet (FR)', 'NetBet (IT)', 'DaznBet (IT)', 'OriginalBet (IT)', 'Plexbet (IT)',
-        'NetBet (RO)', 'Nike (SK)', 'NitroBetting (EU)', 'Norsk Tipping (NO)', 'Novibet (BR)', 'Novibet (GR)',
-        'Novibet (IE)', 'Olimp', 'Olimp (Bet)', 'Olimpbet (KZ)', 'Olimpkz', 'OlimpoBet (PE)', 'OlyBet (ES)',
-        'OlyBet (EU)', 'OlyBet (FR)', 'FeelingBet (FR)', 'Genybet (FR)', 'OlyBet (LT)', 'Onabet (BR)',
-        'Esporte365 (BR)', 'LuckBet (BR)', 'Luvabet (BR)', 'Optibet (LT)', 'Optibet (LV)', 'Optibet (EE)',
-        'OrbitX', 'OrbiteX', 'Paddy Power', 'PameStoixima (GR)', 'Parasino', 'ApxBet', 'Betonngliga',
-        'BigBet (BR)', 'LiderBet (BR)', 'RealsBet (BR)', 'Parimatch (KZ)', 'BuddyBet (UA)', 'Gra (Live)',
-        'ParionsSport (FR)', 'Paston (ES)', 'Br4bet (BR)', 'SorteOnline (BR)', 'Pin-up', 'BetPlays',
-        'Pin-up (RU)', 'BaseBet', 'Casino Spinamba', 'Lucky Bird Casino', 'MarsBet', 'Pin-up (EN)',
-        'Slottica', 'Slotty Way', 'Winmasters', 'Winmasters (CY)', 'Winmasters (GR)', 'Winmasters (RO)',
-        'Pinnacle', 'P4578 (Asian)', 'P4578 (EU)', 'Pin135 (EU)', 'Pinnacle (Bet)', 'Pinnacle (BR)',
-        'Pinnacle (SE)', 'Pinnacle888 (Asian)', 'Pinnacle888 (EU)', 'Piwi247 (SB)', 'PS3838 (Broker)',
-        'Start975 (Asian)', 'Start975 (EU)', 'Piwi247', 'PixBet (BR)', 'FlaBet (BR)', 'Pixbet285',
-        'Placard (PT)', 'Playbonds', 'PlayNow', 'PMU (FR)', 'PointsBet (AU)', 'PokerStars', 'PokerStars (DK)',
-        'PokerStars (RO)', 'PokerStars (FR)', 'PokerStars (UK)', 'PokerStars (CA)', 'PokerStars (ES)',
-        'PokerStars (SE)', 'PremierBet (MW)', 'MercuryBet', 'PremierBet (AO)', 'PremierBet (CD)',
-        'PremierBet (CG)', 'PremierBet (CM)', 'PremierBet (MZ)', 'PremierBet (SN)', 'PremierBet (TD)',
-        'PremierBet (TZ)', 'QQ101 (BTI)', '10Bet (KR)', '12Bet (BTI-ID)', 'Fun88 (IN)', 'QQ101 (IM Sports)',
-        'RayBet', 'Reidopitaco (BR)', 'RetaBet (ES)', 'RetaBet (ES-AN)', 'RetaBet (PE)', 'RicoBet (BR)',
-        'BetGorillas (BR)', 'KingpandaBet (BR)', 'Rivalo (BR)', 'Rivalo (CO)', 'RuBet', 'Rushbet (CO)',
-        'GoldenBull (SE)', 'Rushbet (MX)', 'Sazka (CZ)', 'Sbobet', 'Pic5678', 'SbobetAsia', 'SboTop',
-        'Sbobet (Esport)', '12Bet (Esport)', 'BTC365 (Esport)', 'VKGame', 'SeuBet (BR)', '747 Live',
-        'Shuffle', 'Sisal (IT)', 'PokerStars (IT)', 'SkyBet', 'Smarkets', 'Snai (IT)', 'SoccaBet',
-        'SolisBet', 'Solverde (PT)', 'SorteNaBet (BR)', 'Bateu (BR)', 'Betfusion (BR)', 'BullsBet (BR)',
-        'SportBet (IT)', 'BetX (IT)', 'StarGame (IT)', 'SportingWin', 'Sportium (CO)', 'Sportium (ES)',
-        'Sportmarket', 'SportsBet', 'SportsBet (AU)', 'SportyBet', 'SportyBet (BR)', 'Stake', 'Stake (BR)',
-        'KTO (BR)', 'Stake (CO)', 'Frumzi', 'FunBet', 'LibraBet', 'MafiaCasino', 'StoneVegas', 'StanleyBet (BE)',
-        'StanleyBet (IT)', 'StanleyBet (RO)', 'Admiral (RO)', 'StarCasino (NL)', 'Stoiximan (GR)',
-        'Stoiximan (CY)', 'Stoiximan (GR)', 'STS (PL)', 'SuperBet (BR)', 'Super Bet (BR)', 'SuperBet (PL)', 'SuperBet (RO)',
-        'SuperBet (RS)', 'Surebet247', 'SX Bet', 'SynotTip (LV)', 'SynotTip (CZ)', 'SynotTip (SK)', 'Tab (AU)',
-        'TeApuesto (PE)', 'TempoBet', 'Tennisi', 'Tennisi (Bet)', 'Tennisi (KZ)', 'ThunderPickIo (NO)',
-        'Tipico', 'Tipico (DE)', 'Tipp3 (AT)', 'TippmixPro (HU)', 'Tipsport (CZ)', 'Chance (CZ)',
-        'Tipsport (SK)', 'Tipwin (DE)', 'Tipwin', 'Tipwin (DK)', 'Tipwin (SE)', 'TonyBet', 'Vave',
-        'TonyBet (ES)', 'TonyBet (NL)', 'Topsport (LT)', 'Toto (NL)', 'TotoGaming (AM)', '1Win (Provider)',
-        'Cannonbet', 'CaptainsBet (KE)', 'MelBet (NG)', 'MelBet (RU)', 'Sol.Casino', 'Tinbet (PE)',
-        'Winspirit', 'Ubet (CY)', 'Ubet (KZ)', 'Betera (BY)', 'Unibet (DK)', 'Unibet (BE)', 'Unibet (FI)',
-        'Unibet (SE)', 'Unibet (FR)', 'Unibet (RO)', 'ATG (SE)', 'Betmgm (NL)', 'Betmgm (SE)', 'Betmgm (UK)',
-        'Casumo', 'Casumo (ES)', 'GrosvenorCasinos', 'No Account Bet (SE)', 'Paf', 'Paf (ES)', 'Paf (SE)',
-        'PafBet (LV)', 'Scoore (BE)', 'Unibet (AU)', 'Unibet (IT)', 'Unibet (MT)', 'Unibet (NL)', 'VBet',
-        'Bets60', 'H2bet (BR)', 'Hash636', 'Uabet', 'VBet (AM)', 'VBet (BR)', '7Games (BR)', 'Seguro (BR)',
-        'VBet (FR)', 'VBet (LAT)', 'VBet (NL)', 'VBet (UK)', 'Veikkaus (FI)', 'Versus (ES)', 'Vivasorte (BR)',
-        '4Play (BR)', '4Win (BR)', 'Ginga (BR)', 'QG (BR)', 'Zeroum (BR)', 'Vulkan Bet', 'W88Es', 'Wildz',
-        'William Hill', 'Williamhill (ES)', 'Williamhill (IT)', 'Winamax (ES)', 'Winamax (DE)', 'Winamax (FR)',
-        'WinBet (BG)', 'WinBet (RO)', 'Winline (RU)', 'WolfBet', 'WonderBet (CO)', 'WWin', 'YaassCasino (ES)',
-        'Yabo888', 'Yajuego (CO)', 'YSB', 'Zamba (CO)', 'ZeBet', 'ZeBet (BE)', 'ZeBet (ES)', 'ZeBet (NL)',
-        'Zenit', 'Zenit (Win)'
-    ]
+    preparar_indices()
+    carregar_backend(backend or BACKEND_PADRAO)
+
+def _extrair_isolado(backend, caminho):
+    """
+    Um PDF do lote: nunca lança, o erro volta no próprio registro
+    """
+    try:
+        return {'file': caminho, 'ok': True, 'result': extrair_dados_pdf(caminho, backend, estrito=True), 'error': None}
+    except LimiteExcedido as e:
+        return {'file': caminho, 'ok': False, 'result': None, 'error': str(e), 'limitExceeded': e.como_dict()}
+    except Exception as e:
+        return {'file': caminho, 'ok': False, 'result': None, 'error': str(e)}
+
+def extrair_lote(caminhos, workers=None, backend=None):
+    """
+    Extrai vários PDFs em paralelo, em `workers` processos filhos (default: núcleos)
+    Retorna um registro por PDF, na ordem de `caminhos`:
+        {'file': ..., 'ok': True, 'result': {...}, 'error': None}
+    Um PDF com erro (inexistente, ilegível, que não é PDF, limite excedido) só
+    afeta o próprio registro (ok False e a mensagem em error)
+    """
+    import multiprocessing
+    caminhos = list(caminhos)
+    backend = backend or BACKEND_PADRAO
+    workers = max(1, min(workers or os.cpu_count() or 1, len(caminhos)))
+    tarefa = functools.partial(_extrair_isolado, backend)
+    preparar_processo(backend)
+    if workers == 1:
+        return [tarefa(caminho) for caminho in caminhos]
     
-    linha_lower = linha.lower()
+    metodo = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+    gc.freeze()
+    try:
+        with multiprocessing.get_context(metodo).Pool(workers) as pool:
+            return pool.map(tarefa, caminhos)
+    finally:
+        gc.unfreeze()
+
+def _normalizar_texto(texto):
+    """
+    Minúsculas, sem acentos e com espaços simples ("Botoșani  FC" -> "botosani fc")
+    """
+    sem_acentos = ''.join(c for c in unicodedata.normalize('NFKD', texto) if not unicodedata.combining(c))
+    return ' '.join(sem_acentos.lower().split())
+
+def impressao_semantica(dados):
+    """
+    Identifica a surebet pelo conteúdo (data do evento, times, casas, odds e stakes),
+    não pelos bytes: o mesmo PDF exportado duas vezes tem a mesma impressão
+    Retorna None se faltarem os campos mínimos (sem eles tudo pareceria duplicado)
+    """
+    apostas = [dados[chave] for chave in ('bet1', 'bet2', 'bet3') if dados[chave]['house'] and dados[chave]['odd']]
+    if not dados['date'] or not dados['teamA'] or not dados['teamB'] or len(apostas) < 2:
+        return None
     
-    # Detecta casas de apostas no texto
-    # Ordena casas por especificidade (mais específicas primeiro)
-    casas_ordenadas = sorted(casas_sistema, key=lambda x: (-len(x), '(' not in x))
+    # Ordenados para não depender da ordem de times/apostas no PDF
+    chave = [
+        dados['date'],
+        sorted(_normalizar_texto(time) for time in (dados['teamA'], dados['teamB'])),
+        sorted([normalizar_nome_casa(aposta['house']), f"{aposta['odd']:.2f}", f"{aposta['stake'] or 0:.2f}"]
+               for aposta in apostas),
+    ]
+    return hashlib.sha256(json.dumps(chave, ensure_ascii=False).encode('utf-8')).hexdigest()[:32]
+
+def preencher_apostas(dados, apostas):
+    """
+    Copia até 3 apostas encontradas para bet1, bet2 e bet3
+    """
+    for chave, aposta in zip(('bet1', 'bet2', 'bet3'), apostas):
+        dados[chave].update(aposta)
+
+def extrair_apostas(linhas, info_linhas):
+    """
+    Percorre as linhas já classificadas procurando as apostas (casa + tipo + odd + stake + lucro)
+    Retorna as apostas na ordem em que aparecem na tabela
+    """
+    apostas_encontradas = []
     
-    casas_encontradas = []
-    for casa in casas_ordenadas:
-        casa_lower_normalized = casa.lower()
+    # Processa linha por linha procurando apostas
+    i = 0
+    while i < len(linhas):
+        linha = linhas[i]
+        
+        # Casa de apostas detectada na classificação
+        casa_encontrada = info_linhas[i]['casa']
         
-        # Para casas com parênteses, busca de forma mais flexível
-        if '(' in casa_lower_normalized:
-            # Quebra a casa em nome base + sufixo
-            if ' (' in casa_lower_normalized:
-                nome_base, sufixo = casa_lower_normalized.split(' (', 1)
-                sufixo = '(' + sufixo  # Re-adiciona o parêntese
+        if casa_encontrada:
+            # Coleta linhas da aposta (pode estar dividida em múltiplas linhas)
+            texto_aposta = linha
+            j = i + 1
+            
+            # PRIMEIRO: Coleta fragmentos do nome da casa (linhas curtas sem números/símbolos)
+            # Exemplo: "Marjo" -> "Sports" -> "(BR)"
+            fragmentos_casa = []
+            linhas_usadas_fragmentos = set()  # Rastreia linhas totalmente usadas
+            linhas_parcialmente_usadas = {}  # {index_linha: resto_da_linha}
+            while j < len(linhas) and j < i + 4:  # Máximo 3 linhas para completar casa
+                info = info_linhas[j]
+                proxima_linha = info['texto']
                 
-                # Verifica se os componentes do nome base e sufixo existem na linha
-                # Permite que estejam separados (ex: "Super...Bet (BR)")
-                palavras_base = nome_base.split()
-                todas_palavras_presentes = all(palavra in linha_lower for palavra in palavras_base)
-                sufixo_presente = sufixo in linha_lower
+                # Para se for linha vazia, de separação ou símbolos
+                if info['separador']:
+                    j += 1
+                    continue
                 
-                if todas_palavras_presentes and sufixo_presente:
-                    # Verifica ordem aproximada: primeira palavra antes do sufixo
-                    pos_primeira = linha_lower.find(palavras_base[0])
-                    pos_sufixo = linha_lower.find(sufixo)
-                    if pos_primeira < pos_sufixo:
-                        return casa
-            else:
-                # Se não tem espaço antes do parêntese, usa busca simples
-                if casa_lower_normalized in linha_lower:
-                    return casa
+                # Se tem dados financeiros/símbolos, não é fragmento da casa
+                if info['financeiro'] or '\uf35d' in proxima_linha:
+                    break
+                
+                # Se é linha muito curta (< 30 chars), pode ser fragmento da casa
+                # Exemplos: "Sports", "(BR)", "Sports escanteios"
+                if len(proxima_linha) < 30:
+                    nova_casa = info['casa']
+                    
+                    # Fragmento válido se: não é casa nova
+                    if not nova_casa:
+                        # Aceita (BR), (CO), etc
+                        if info['sufixo_pais']:
+                            fragmentos_casa.append(proxima_linha)
+                            linhas_usadas_fragmentos.add(j)
+                            j += 1
+                        # Aceita palavras simples como "Sports", "Bet", etc (parte do nome da casa)
+                        elif len(info['palavras']) == 1 and proxima_linha[0].isupper():
+                            fragmentos_casa.append(proxima_linha)
+                            linhas_usadas_fragmentos.add(j)
+                            j += 1
+                        # Se tem múltiplas palavras, pega só a PRIMEIRA se for capitalizada
+                        # Ex: "Sports escanteios" -> pega "Sports", resto vai para tipo
+                        elif proxima_linha[0].isupper():
+                            palavras = info['palavras']
+                            if palavras[0][0].isupper() and not REGEX_PALAVRA_TIPO.search(palavras[0].lower()):
+                                fragmentos_casa.append(palavras[0])
+                                # Salva o resto da linha para adicionar ao tipo depois
+                                resto = ' '.join(palavras[1:])
+                                if resto:
+                                    linhas_parcialmente_usadas[j] = resto
+                                linhas_usadas_fragmentos.add(j)
+                                j += 1
+                            else:
+                                break
+                        else:
+                            break
+                    else:
+                        break
+                else:
+                    break
+            
+            # Atualiza nome da casa com fragmentos coletados
+            if fragmentos_casa:
+                casa_encontrada = casa_encontrada + ' ' + ' '.join(fragmentos_casa)
+            
+            # Correção especial para casas conhecidas fragmentadas
+            # Se detectou "Marjo" mas não tem "Sports" no nome, verifica se está no texto
+            if casa_encontrada.startswith('Marjo') and 'Sports' not in casa_encontrada:
+                # Procura "Sports" nas linhas já coletadas (i até j)
+                for k in range(i, min(j, len(linhas))):
+                    if 'Sports' in linhas[k]:
+                        casa_encontrada = 'Marjo Sports (BR)'
+                        break
+            
+            casa_atual_base = casa_encontrada.split()[0] if casa_encontrada else ""
+            
+            # DEPOIS: Coleta linhas com dados financeiros e continuação do tipo
+            while j < len(linhas) and j < i + 8:  # Máximo total 8 linhas
+                info = info_linhas[j]
+                proxima_linha = info['texto']
+                
+                # Trata linhas usadas como fragmentos da casa
+                if j in linhas_usadas_fragmentos:
+                    # Se foi parcialmente usada, adiciona o resto ao texto
+                    if j in linhas_parcialmente_usadas:
+                        texto_aposta += ' ' + linhas_parcialmente_usadas[j]
+                    j += 1
+                    continue
+                
+                # Para se encontrar outra casa de apostas diferente
+                # PRIMEIRO: Detecta se a linha é uma palavra capitalizada curta (potencial início de casa)
+                # Usa detectar_casa_apostas para validar se é prefixo de casa conhecida
+                palavras_linha = info['palavras']
+                if palavras_linha:
+                    primeira_palavra = palavras_linha[0]
+                    
+                    # Se é palavra capitalizada curta (3-15 chars) SEM números/odds
+                    if (len(primeira_palavra) >= 3 and 
+                        len(primeira_palavra) <= 15 and 
+                        primeira_palavra[0].isupper() and
+                        not info['decimais']):  # Não tem odds
+                        
+                        # Tenta detectar a palavra como possível casa
+                        possivel_casa = detectar_casa_apostas(primeira_palavra)
+                        if possivel_casa:
+                            # É uma palavra que inicia uma casa conhecida
+                            # Compara com casa atual para ver se é diferente
+                            if casa_atual_base.lower() != primeira_palavra.lower():
+                                # É uma casa NOVA diferente - para imediatamente!
+                                if LOG_DEBUG:
+                                    registrar_log('debug', 'nova_casa', casa_atual=casa_atual_base,
+                                                  nova=primeira_palavra, linha=proxima_linha[:50])
+                                break
+                
+                # SEGUNDO: Tenta detecção normal de casa
+                casa_na_proxima = info['casa']
+                if casa_na_proxima:
+                    # Para se for uma casa DIFERENTE da atual
+                    casa_proxima_base = casa_na_proxima.split()[0]
+                    
+                    # Se são casas diferentes, para imediatamente
+                    if casa_atual_base.lower() != casa_proxima_base.lower():
+                        break
+                    
+                # Para se encontrar "Aposta total" ou outras seções
+                if info['secao']:
+                    break
+                
+                # Adiciona linha se contém dados relevantes OU se é continuação de tipo de aposta
+                eh_linha_curta = len(palavras_linha) <= 6
+                
+                if info['financeiro'] or (info['continuacao_tipo'] and eh_linha_curta):
+                    texto_aposta += ' ' + proxima_linha
+                    j += 1
+                else:
+                    break
+            
+            # Processa o texto coletado da aposta
+            t = marcar_tempo()
+            aposta = processar_aposta_completa(texto_aposta, casa_encontrada)
+            registrar_tempo('processar_aposta', t)
+            if aposta and aposta['house'] and aposta['odd']:
+                aposta['house'], aposta['houseMatchDistance'] = resolver_casa(aposta['house'])
+                apostas_encontradas.append(aposta)
+            
+            i = j  # Pula para depois desta aposta
         else:
-            # Para casas sem parênteses, usa word boundaries para precisão
-            casa_pattern = re.escape(casa_lower_normalized).replace(r'\ ', r'\s*')
-            if re.search(r'\b' + casa_pattern + r'\b', linha_lower):
-                return casa
+            i += 1
+    
+    return apostas_encontradas
+
+# === MEMO DA DETECÇÃO DE CASAS ===
+# O laço das apostas consulta as mesmas strings curtas ("Betano", "(BR)", "Sports")
+# muitas vezes por PDF e milhares de vezes num lote; a detecção só depende do texto
+# e do catálogo, então um LRU por processo (compartilhado entre PDFs no worker e no
+# lote) resolve as repetições com uma consulta de dicionário.
+# PARSE_PDF_MEMO_CASAS define o tamanho (0 desliga)
+TAMANHO_MEMO_CASAS = int(os.environ.get('PARSE_PDF_MEMO_CASAS', '4096'))
+
+def detectar_casa_apostas(linha):
+    """
+    Detecta casas de apostas usando o catálogo do sistema (casas_apostas.txt, 1000+ casas)
+    Suporta todas as variantes incluindo casas com parênteses como KTO (BR), Blaze (BR)
+    Detecta também fragmentos iniciais de casas compostas (ex: "Cloud" -> CloudBet)
+    """
+    if _tempos is not None:
+        _tempos['detectarCasaCalls'] += 1
+    return _detectar_casa_memo(linha)
+
+@functools.lru_cache(maxsize=TAMANHO_MEMO_CASAS)
+def _detectar_casa_memo(linha):
+    # Busca a casa mais específica do catálogo usando o índice pré-compilado
+    casa = buscar_casa_conhecida(linha)
+    if casa:
+        return casa
     
     # Se não encontrou casa conhecida, tenta detecção dinâmica 
     # Busca por padrão: palavra capitalizada seguida de dados de aposta
-    match = re.search(r'^([A-Z][A-Za-z\s\(\)]{2,30})\s+[A-Za-z0-9()+\-≥≤\.]+\s+\d+\.\d+', linha)
+    match = REGEX_CASA_DINAMICA.search(linha)
     if match:
         casa_candidata = match.group(1).strip()
         # Valida se parece ser nome de casa de apostas
@@ -606,180 +1675,173 @@ def detectar_casa_apostas(linha):
         # Se é uma palavra capitalizada curta (3-15 chars), verifica se é início de casa conhecida
         if len(primeira_palavra) >= 3 and len(primeira_palavra) <= 15 and primeira_palavra[0].isupper():
             # Verifica se essa palavra é o início de alguma casa na lista
-            for casa in casas_sistema:
-                casa_limpa = casa.split('(')[0].strip()  # Remove sufixos como (BR), (CO)
-                # Se a casa começa com essa palavra, retorna como fragmento detectado
-                if casa_limpa.lower().startswith(primeira_palavra.lower()):
-                    return primeira_palavra
+            if eh_inicio_de_casa(primeira_palavra):
+                return primeira_palavra
     
     # Fallback: palavras individuais capitalizadas (como "Marjo", "Sports")
     # Retorna None para permitir junção posterior
     return None
 
+# === TOKENS DE UMA APOSTA ===
+# Números (com ou sem casas decimais), moedas e símbolos de marcação, com posição
+REGEX_TOKEN_APOSTA = re.compile(r'(\d+(?:\.\d+)?)|(USD|BRL)|([●○\uf35d])')
+TOKEN_NUMERO, TOKEN_MOEDA, TOKEN_SIMBOLO = 1, 2, 3
+REGEX_NUMERO_PALAVRA = re.compile(r'^-?\d+\.?\d*$')
+REGEX_SUFIXO_CASA = re.compile(r'\s*\([A-Z]{2}\)\s*')
+REGEX_SIMBOLOS_TIPO = re.compile(r'[●○\uf35d\u232A]')
+REGEX_ESPACOS = re.compile(r'\s+')
+REGEX_TRACO_FINAL = re.compile(r'[-–]\s*$')
+
+# Palavras-chave que indicam que o próximo número faz parte do tipo de aposta
+PALAVRAS_CHAVE_TIPO = ('acima', 'abaixo', 'total', 'over', 'under', 'mais', 'menos',
+                       'primeiro', 'segundo', 'tempo', 'extra', '1º', '2º')
+
+# Palavras removidas do tipo apenas para casas conhecidas (evita remover "Bet" genérico)
+CASAS_CONHECIDAS_TIPO = [
+    ('estrela', ['EstrelaBet', 'Estrela']),
+    ('pinnacle', ['Pinnacle']),
+    ('marjo', ['MarjoSports', 'Marjo', 'Sports']),  # Sports só se for MarjoSports
+    ('super', ['SuperBet', 'Super']),
+    ('stake', ['Stake']),
+    ('kto', ['KTO']),
+    ('blaze', ['Blaze']),
+    ('multibet', ['MultiBet', 'Multi']),
+    ('bravo', ['BravoBet', 'Bravo']),
+    ('betfast', ['Betfast']),
+    ('betano', ['Betano']),
+]
+_REGEX_PALAVRAS_CASA = [
+    (chave, [re.compile(r'\b' + re.escape(palavra) + r'\b', re.IGNORECASE) for palavra in palavras])
+    for chave, palavras in CASAS_CONHECIDAS_TIPO
+]
+_REGEX_NOME_CASA = {}
+
+def tokenizar_aposta(texto):
+    """
+    Passada única pelo texto da aposta: lista de (tipo, início, fim, valor)
+    valor é o float para números (None se não tiver casa decimal) e o texto para moedas/símbolos
+    """
+    tokens = []
+    for match in REGEX_TOKEN_APOSTA.finditer(texto):
+        numero, moeda, simbolo = match.groups()
+        if numero is not None:
+            tokens.append((TOKEN_NUMERO, match.start(), match.end(), float(numero) if '.' in numero else None))
+        elif moeda is not None:
+            tokens.append((TOKEN_MOEDA, match.start(), match.end(), moeda))
+        else:
+            tokens.append((TOKEN_SIMBOLO, match.start(), match.end(), simbolo))
+    return tokens
+
 def processar_aposta_completa(texto_aposta, casa_aposta):
     """
     Processa o texto completo de uma aposta para extrair todos os campos
     Garante 100% de precisão na extração
     """
-    # === IDENTIFICAÇÃO DE SÍMBOLOS E DIVISÃO ===
-    # Busca símbolos na ordem: ●, ○, depois \uf35d (unicode F35D)
-    simbolo_match = re.search(r'[●○\uf35d]', texto_aposta)
+    tokens = tokenizar_aposta(texto_aposta)
+    decimais = [token for token in tokens if token[0] == TOKEN_NUMERO and token[3] is not None]
     
-    if simbolo_match:
-        parte_antes_simbolo = texto_aposta[:simbolo_match.start()].strip()
-        parte_depois_simbolo = texto_aposta[simbolo_match.end():].strip()
-    else:
-        # Se não tem símbolo, usa moeda como divisor
-        moeda_match = re.search(r'(USD|BRL)', texto_aposta)
-        if moeda_match:
-            parte_antes_simbolo = texto_aposta[:moeda_match.start()].strip()
-            parte_depois_simbolo = texto_aposta[moeda_match.start():].strip()
-        else:
-            parte_antes_simbolo = texto_aposta
-            parte_depois_simbolo = ""
+    # === IDENTIFICAÇÃO DE SÍMBOLOS E DIVISÃO ===
+    # Divide no primeiro símbolo (●, ○, \uf35d); sem símbolo, na primeira moeda
+    divisao = next((token[1] for token in tokens if token[0] == TOKEN_SIMBOLO), None)
+    if divisao is None:
+        divisao = next((token[1] for token in tokens if token[0] == TOKEN_MOEDA), len(texto_aposta))
     
     # === EXTRAÇÃO DE ODD ===
-    # A odd geralmente é o último número decimal antes do símbolo/stake
-    # e está no range típico de 1.0 a 50.0
-    numeros_antes = re.findall(r'\d+\.\d+', parte_antes_simbolo)
+    # A odd é o último decimal antes do símbolo/stake no range típico de 1.0 a 50.0
+    # Buscar do FIM evita pegar números que fazem parte do tipo (ex: "Acima 1.5")
     odd = None
-    
+    numeros_antes = [token[3] for token in decimais if token[2] <= divisao]
     if numeros_antes:
-        # Busca do FIM para o início (último número válido antes do símbolo é a odd)
-        # Isso evita pegar números que fazem parte do tipo (ex: "Acima 1.5")
-        for num_str in reversed(numeros_antes):
-            num = float(num_str)
-            if 1.0 <= num <= 50.0:
-                odd = num
-                break
-        
+        odd = next((num for num in reversed(numeros_antes) if 1.0 <= num <= 50.0), None)
         if not odd:  # Fallback
-            odd = float(numeros_antes[-1])
+            odd = numeros_antes[-1]
     
     # === EXTRAÇÃO DE STAKE E PROFIT ===
+    # Stake: primeiro número seguido de espaço + USD/BRL
     stake = None
-    profit = None
-    
-    # Busca padrões baseados em moeda para garantir precisão
-    # Padrão: NUMBER USD/BRL -> stake
-    stake_matches = re.findall(r'(\d+\.?\d*)\s+(USD|BRL)', texto_aposta)
-    if stake_matches:
-        stake = float(stake_matches[0][0])
-    
-    # Profit é o último número após stake (geralmente < 1000 para lucros individuais)
-    # Extração mais robusta: procura o último número DEPOIS do stake
-    todos_numeros = re.findall(r'\d+\.\d+', texto_aposta)
+    for anterior, token in zip(tokens, tokens[1:]):
+        if (anterior[0] == TOKEN_NUMERO and token[0] == TOKEN_MOEDA and
+                anterior[2] < token[1] and texto_aposta[anterior[2]:token[1]].isspace()):
+            stake = float(texto_aposta[anterior[1]:anterior[2]])
+            break
     
-    # Primeiro tenta buscar especificamente após stake (mais preciso)
+    # Profit: último decimal depois da primeira ocorrência do stake no texto
+    profit = None
     if stake:
-        # Encontra posição do stake no texto
-        stake_str = str(stake).replace('.', r'\.')
-        stake_pattern = re.search(stake_str, texto_aposta)
-        if stake_pattern:
-            texto_pos_stake = texto_aposta[stake_pattern.end():]
-            numeros_pos_stake = re.findall(r'\d+\.\d+', texto_pos_stake)
-            if numeros_pos_stake:
-                # Pega o último número após o stake (profit geralmente vem por último)
-                profit = float(numeros_pos_stake[-1])
-    
-    # Fallback: busca último número pequeno (< 1000) que não seja stake nem odd
+        fim_stake = texto_aposta.find(str(stake))
+        if fim_stake >= 0:
+            fim_stake += len(str(stake))
+            for token in reversed(decimais):
+                if token[1] >= fim_stake:
+                    profit = token[3]
+                    break
+                if token[2] > fim_stake:
+                    # Stake termina no meio deste número: vale o que sobra dele, se ainda for decimal
+                    resto = texto_aposta[fim_stake:token[2]]
+                    if REGEX_DECIMAL.fullmatch(resto):
+                        profit = float(resto)
+                    break
+    
+    # Fallback: último número pequeno (< 1000) que não seja stake nem odd
     if not profit:
-        for num_str in reversed(todos_numeros):
-            num = float(num_str)
-            if num != stake and num != odd and num < 1000:
-                profit = num
+        for token in reversed(decimais):
+            if token[3] != stake and token[3] != odd and token[3] < 1000:
+                profit = token[3]
                 break
     
     # === EXTRAÇÃO DO TIPO DE APOSTA ===
     # Extrai tipo de TODA a linha, não apenas da parte antes de USD
     # O tipo pode estar dividido: parte antes USD + parte depois USD
-    tipo_completo = texto_aposta.replace(casa_aposta, '', 1).strip()
-    tipo_completo = re.sub(r'\(BR\)', '', tipo_completo).strip()
+    tipo_completo = texto_aposta.replace(casa_aposta, '', 1).strip().replace('(BR)', '').strip()
     
     # Remove números financeiros (odd, stake, profit) e moedas do tipo completo
     palavras = tipo_completo.split()
     palavras_filtradas = []
-    
-    # Palavras-chave que indicam que o próximo número faz parte do tipo de aposta
-    palavras_chave_tipo = ['acima', 'abaixo', 'total', 'over', 'under', 'mais', 'menos', 
-                           'primeiro', 'segundo', 'tempo', 'extra', '1º', '2º']
-    
     for i, palavra in enumerate(palavras):
-        # Remove moedas
-        if palavra in ['USD', 'BRL']:
+        if palavra == 'USD' or palavra == 'BRL':
             continue
         
-        # Verifica se a palavra anterior é uma palavra-chave de tipo de aposta
-        palavra_anterior_eh_chave = False
-        if i > 0:
-            palavra_anterior_lower = palavras[i-1].lower().replace('≥', '').replace('≤', '').strip()
-            palavra_anterior_eh_chave = any(chave in palavra_anterior_lower for chave in palavras_chave_tipo)
-        
-        # Verifica se é número
-        if re.match(r'^-?\d+\.?\d*$', palavra):
-            num = float(palavra)
-            
+        if REGEX_NUMERO_PALAVRA.match(palavra):
             # SEMPRE preserva números que vêm depois de palavras-chave (ex: "Acima 27.5")
-            if palavra_anterior_eh_chave:
-                palavras_filtradas.append(palavra)
-                continue
-            
-            # Remove se for odd, stake ou profit (com tolerância)
-            if (odd and abs(num - odd) < 0.01):
-                continue
-            if (stake and abs(num - stake) < 0.01):
-                continue
-            if (profit and abs(num - profit) < 0.01):
-                continue
+            if i > 0:
+                palavra_anterior = palavras[i - 1].lower().replace('≥', '').replace('≤', '').strip()
+                if any(chave in palavra_anterior for chave in PALAVRAS_CHAVE_TIPO):
+                    palavras_filtradas.append(palavra)
+                    continue
             
-            # Remove se for negativo (profit negativo)
-            if num < 0:
+            # Remove se for odd, stake ou profit (com tolerância) ou negativo (profit negativo)
+            num = float(palavra)
+            if ((odd and abs(num - odd) < 0.01) or
+                    (stake and abs(num - stake) < 0.01) or
+                    (profit and abs(num - profit) < 0.01) or
+                    num < 0):
                 continue
         
         palavras_filtradas.append(palavra)
     
-    tipo_aposta = ' '.join(palavras_filtradas)
-    
-    # Limpeza final de símbolos e formatação
-    tipo_aposta = re.sub(r'[●○]', '', tipo_aposta)  # Remove símbolos circulares
-    tipo_aposta = re.sub(r'\uf35d', '', tipo_aposta)  # Remove unicode F35D
-    tipo_aposta = tipo_aposta.replace('\u232A', '')  # Remove U+232A (〉)
-    tipo_aposta = re.sub(r'\s+', ' ', tipo_aposta).strip()  # Limpa espaços
-    tipo_aposta = re.sub(r'[-–]\s*$', '', tipo_aposta).strip()  # Remove traços finais
-    
-    # Remove o nome da casa de apostas do tipo de aposta
-    casa_sem_parenteses = re.sub(r'\s*\([A-Z]{2}\)\s*', '', casa_aposta).strip()
-    
-    # PRIMEIRO: Tenta remover o nome completo da casa como frase única
-    tipo_aposta = re.sub(r'\b' + re.escape(casa_sem_parenteses) + r'\b', '', tipo_aposta, flags=re.IGNORECASE)
-    
-    # SEGUNDO: Remove palavras individuais apenas para casas conhecidas (evita remover "Bet" genérico)
-    # Lista de casas conhecidas onde podemos remover palavras específicas
-    casas_conhecidas = {
-        'estrela': ['EstrelaBet', 'Estrela'],
-        'pinnacle': ['Pinnacle'],
-        'marjo': ['MarjoSports', 'Marjo', 'Sports'],  # Sports só se for MarjoSports
-        'super': ['SuperBet', 'Super'],
-        'stake': ['Stake'],
-        'kto': ['KTO'],
-        'blaze': ['Blaze'],
-        'multibet': ['MultiBet', 'Multi'],
-        'bravo': ['BravoBet', 'Bravo'],
-        'betfast': ['Betfast'],
-        'betano': ['Betano']
-    }
+    # Limpeza final de símbolos (●, ○, \uf35d, 〉), espaços e traços finais
+    tipo_aposta = REGEX_SIMBOLOS_TIPO.sub('', ' '.join(palavras_filtradas))
+    tipo_aposta = REGEX_ESPACOS.sub(' ', tipo_aposta).strip()
+    tipo_aposta = REGEX_TRACO_FINAL.sub('', tipo_aposta).strip()
     
-    casa_lower = casa_sem_parenteses.lower()
+    # Remove o nome da casa de apostas do tipo de aposta: primeiro o nome completo como frase única
+    casa_sem_parenteses = REGEX_SUFIXO_CASA.sub('', casa_aposta).strip()
+    regex_casa = _REGEX_NOME_CASA.get(casa_sem_parenteses)
+    if regex_casa is None:
+        regex_casa = re.compile(r'\b' + re.escape(casa_sem_parenteses) + r'\b', re.IGNORECASE)
+        _REGEX_NOME_CASA[casa_sem_parenteses] = regex_casa
+    tipo_aposta = regex_casa.sub('', tipo_aposta)
     
-    # Remove palavras específicas apenas para casas conhecidas
-    for chave, palavras in casas_conhecidas.items():
+    # Depois palavras individuais, só para casas conhecidas
+    casa_lower = casa_sem_parenteses.lower()
+    for chave, regexes in _REGEX_PALAVRAS_CASA:
         if chave in casa_lower:
-            for palavra in palavras:
-                tipo_aposta = re.sub(r'\b' + re.escape(palavra) + r'\b', '', tipo_aposta, flags=re.IGNORECASE)
+            for regex in regexes:
+                tipo_aposta = regex.sub('', tipo_aposta)
             break  # Para após encontrar a casa
     
     # Limpa espaços extras resultantes da remoção
-    tipo_aposta = re.sub(r'\s+', ' ', tipo_aposta).strip()
+    tipo_aposta = REGEX_ESPACOS.sub(' ', tipo_aposta).strip()
     
     return {
         'house': casa_aposta,
@@ -789,18 +1851,285 @@ def processar_aposta_completa(texto_aposta, casa_aposta):
         'profit': profit
     }
 
+# === PROTOCOLO DO WORKER ===
+# Cada mensagem é um quadro: cabeçalho de 8 bytes (tamanho do JSON e tamanho
+# dos dados binários, uint32 big-endian), o JSON compacto e os dados. O pedido
+# leva os bytes do PDF como dados (sem base64); a resposta só tem o JSON.
+CABECALHO_QUADRO = struct.Struct('>II')
+
+def _ler_exato(entrada, tamanho):
+    """
+    Lê exatamente `tamanho` bytes; None se o stream terminar antes
+    """
+    partes = []
+    faltando = tamanho
+    while faltando:
+        parte = entrada.read(faltando)
+        if not parte:
+            return None
+        partes.append(parte)
+        faltando -= len(parte)
+    return b''.join(partes)
+
+def ler_quadro(entrada):
+    """
+    Próximo quadro do stream: (mensagem, dados) ou None no fim do stream
+    """
+    cabecalho = _ler_exato(entrada, CABECALHO_QUADRO.size)
+    if cabecalho is None:
+        return None
+    tamanho_json, tamanho_dados = CABECALHO_QUADRO.unpack(cabecalho)
+    corpo = _ler_exato(entrada, tamanho_json)
+    dados = _ler_exato(entrada, tamanho_dados) if tamanho_dados else b''
+    if corpo is None or dados is None:
+        return None
+    return json.loads(corpo), dados
+
+def escrever_quadro(saida, mensagem, dados=b''):
+    corpo = json.dumps(mensagem, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    saida.write(CABECALHO_QUADRO.pack(len(corpo), len(dados)) + corpo + dados)
+    saida.flush()
+
+def executar_worker(fd_resposta=None):
+    """
+    Modo worker persistente: lê pedidos em quadros do stdin e escreve um quadro
+    de resposta por pedido no fd dado (o Node usa o fd 3, longe de prints soltos
+    no stdout), reaproveitando o interpretador e os imports entre PDFs
+    Pedido: {"id": ...} + bytes do PDF, ou {"id": ..., "path": "/tmp/x.pdf"} sem dados
+    Resposta: {"id": ..., "ok": true, "result": {...}} ou {"id": ..., "ok": false, "error": "..."}
+    Com tempos ativados a resposta de sucesso traz também "timings"
+    PDF abortado pelo governador de recursos: a resposta de erro traz também
+    "limitExceeded": {"limit": ..., "max": ..., "message": ...} e o worker continua
+    """
+    # O worker fica aquecido: as bibliotecas do backend carregam antes do primeiro pedido
+    carregar_backend(BACKEND_PADRAO)
+    entrada = sys.stdin.buffer
+    saida = os.fdopen(fd_resposta, 'wb') if fd_resposta is not None else sys.stdout.buffer
+    while True:
+        quadro = ler_quadro(entrada)
+        if quadro is None:
+            break
+        pedido, pdf = quadro
+        
+        id_pedido = pedido.get('id')
+        try:
+            entrada_pdf = pdf if pdf else pedido['path']
+            if TIMINGS_ATIVO:
+                dados, tempos = extrair_dados_pdf_com_tempos(entrada_pdf)
+                resposta = {'id': id_pedido, 'ok': True, 'result': dados, 'timings': tempos}
+            else:
+                dados = extrair_dados_pdf(entrada_pdf)
+                resposta = {'id': id_pedido, 'ok': True, 'result': dados}
+        except LimiteExcedido as e:
+            registrar_log('aviso', 'limite_excedido', id=id_pedido, limite=e.limite, maximo=e.maximo)
+            resposta = {'id': id_pedido, 'ok': False, 'error': str(e), 'limitExceeded': e.como_dict()}
+        except Exception as e:
+            registrar_log('erro', 'erro_worker', id=id_pedido, erro=str(e))
+            resposta = {'id': id_pedido, 'ok': False, 'error': str(e)}
+        
+        escrever_quadro(saida, resposta)
+
+# === RELATÓRIO DE INICIALIZAÇÃO ===
+# --startup-report [backend]: roda um processo novo com "python -X importtime", importa o
+# parser e as bibliotecas do backend e mostra quanto cada pacote custou na partida
+
+def relatorio_inicializacao(backend=None, maximo=15):
+    import subprocess
+    backend = backend or BACKEND_PADRAO
+    codigo = f"import parse_pdf; parse_pdf.carregar_backend({backend!r})"
+    inicio = time.perf_counter()
+    processo = subprocess.run([sys.executable, '-X', 'importtime', '-c', codigo],
+                              cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True)
+    total_ms = (time.perf_counter() - inicio) * 1000
+    if processo.returncode != 0:
+        print(processo.stderr, file=sys.stderr)
+        sys.exit(1)
+    
+    # Linhas "import time: <próprio µs> | <acumulado µs> | <módulo>", os dependentes antes
+    # de quem os importou e o nível pela indentação; guarda os de topo e os do 1º nível
+    por_pacote = {}
+    dependencias = {}
+    pendentes = []
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith('import time:') or 'cumulative' in linha:
+            continue
+        _, acumulado, modulo = linha[len('import time:'):].split('|')
+        modulo = modulo[1:]
+        ms = int(acumulado) / 1000
+        if modulo.startswith('   '):
+            continue
+        if modulo.startswith('  '):
+            pendentes.append((modulo.strip(), ms))
+            continue
+        pacote = modulo.strip().split('.')[0]
+        por_pacote[pacote] = por_pacote.get(pacote, 0) + ms
+        dependencias.setdefault(pacote, []).extend(pendentes)
+        pendentes = []
+    importacoes_ms = sum(por_pacote.values())
+    
+    print(f"backend: {backend}")
+    print(f"{'processo (partida + imports)':<40}{total_ms:9.1f}ms")
+    print(f"{'imports':<40}{importacoes_ms:9.1f}ms")
+    for pacote, ms in sorted(por_pacote.items(), key=lambda item: -item[1])[:maximo]:
+        print(f"  {pacote:<38}{ms:9.1f}ms")
+        for modulo, ms_modulo in sorted(dependencias[pacote], key=lambda item: -item[1]):
+            if ms_modulo >= 1:
+                print(f"    {modulo:<36}{ms_modulo:9.1f}ms")
+
+# === PERFIL DA EXTRAÇÃO (cProfile) ===
+# --profile ou PARSE_PDF_PROFILE=1: a extração roda sob o cProfile e as estatísticas
+# vão para um arquivo pstats ao lado do resultado (<pdf>.prof; no --lote, <saida>.prof
+# ou lote.prof com a soma dos PDFs de todos os processos). Bibliotecas do backend e
+# índices de casas são carregados antes, fora do perfil: ele mostra só o custo do PDF.
+# O arquivo abre com python -m pstats, snakeviz ou gprof2dot; o resumo sai no stderr.
+PERFIL_ATIVO = os.environ.get('PARSE_PDF_PROFILE') == '1'
+_DIRETORIO_PARSER = os.path.dirname(os.path.abspath(__file__))
+
+class _PerfilColetado:
+    """
+    Estatísticas brutas já coletadas (talvez em outro processo) no formato que o pstats carrega
+    """
+    def __init__(self, stats):
+        self.stats = stats
+    
+    def create_stats(self):
+        pass
+
+@contextlib.contextmanager
+def perfilar():
+    """
+    Executa o bloco sob o cProfile; no fim, mesmo se o bloco lançar, o dict
+    devolvido recebe em 'stats' as estatísticas brutas (serializáveis entre processos)
+    """
+    import cProfile
+    perfil = cProfile.Profile()
+    coletado = {}
+    perfil.enable()
+    try:
+        yield coletado
+    finally:
+        perfil.disable()
+        perfil.create_stats()
+        coletado['stats'] = perfil.stats
+
+@contextlib.contextmanager
+def perfil_em_arquivo(caminho_saida):
+    """
+    Perfil de um PDF só: executa o bloco sob o cProfile e grava o pstats em caminho_saida
+    """
+    preparar_processo()
+    try:
+        with perfilar() as coletado:
+            yield
+    finally:
+        salvar_perfil(somar_perfil(None, coletado['stats']), caminho_saida, 1)
+
+def somar_perfil(agregado, stats):
+    """
+    Soma as estatísticas brutas de um job ao pstats.Stats agregado (None no primeiro)
+    """
+    import pstats
+    if agregado is None:
+        return pstats.Stats(_PerfilColetado(stats), stream=sys.stderr)
+    agregado.add(_PerfilColetado(stats))
+    return agregado
+
+def _pacote_da_funcao(arquivo, funcao):
+    """
+    Pacote de uma entrada do pstats: o de site-packages, o módulo do parser ou o da
+    biblioteca padrão; funções em C ("~") pelo tipo/módulo do nome ("re.Pattern", "_sre")
+    """
+    if arquivo == '~':
+        # Métodos de tipos embutidos ("of 'dict' objects") ficam em builtins
+        modulo = re.search(r"of '(\w+)\.[\w.]+'|method (\w+)\.", funcao)
+        pacote = (modulo.group(1) or modulo.group(2)) if modulo else 'builtins'
+    elif arquivo.startswith('<frozen '):
+        pacote = arquivo[len('<frozen '):-1]
+    elif 'site-packages' in arquivo:
+        pacote = arquivo.split('site-packages', 1)[1].lstrip(os.sep).split(os.sep)[0]
+    elif os.path.dirname(os.path.abspath(arquivo)) == _DIRETORIO_PARSER:
+        pacote = os.path.basename(arquivo)
+    else:
+        pacote = os.path.basename(os.path.dirname(arquivo))
+        if pacote.startswith('python3') or not pacote:
+            pacote = os.path.basename(arquivo)
+    pacote = pacote.split('.')[0]
+    return 're' if pacote in ('_sre', 'sre_compile', 'sre_parse') else pacote
+
+def salvar_perfil(agregado, caminho_saida, total_pdfs, maximo=20):
+    """
+    Grava o pstats agregado e mostra no stderr o tempo próprio por pacote e as
+    funções mais caras (tempo próprio e acumulado, em ms)
+    """
+    agregado.dump_stats(caminho_saida)
+    por_pacote = {}
+    for (arquivo, _, funcao), (_, chamadas, proprio, _, _) in agregado.stats.items():
+        pacote = _pacote_da_funcao(arquivo, funcao)
+        por_pacote[pacote] = por_pacote.get(pacote, 0) + proprio
+    total = sum(por_pacote.values()) or 1
+    
+    print(f"perfil: {caminho_saida} ({total_pdfs} PDFs, {total * 1000:.1f}ms)", file=sys.stderr)
+    print("tempo próprio por pacote:", file=sys.stderr)
+    for pacote, proprio in sorted(por_pacote.items(), key=lambda item: -item[1])[:maximo // 2]:
+        print(f"  {pacote:<30}{proprio * 1000:10.1f}ms {proprio / total:6.1%}", file=sys.stderr)
+    print(f"funções mais caras:{'chamadas':>24}{'próprio':>12}{'acumulado':>12}", file=sys.stderr)
+    funcoes = sorted(agregado.stats.items(), key=lambda item: -item[1][2])[:maximo]
+    for (arquivo, linha, funcao), (_, chamadas, proprio, acumulado, _) in funcoes:
+        nome = f"{os.path.basename(arquivo)}:{linha}({funcao})" if arquivo != '~' else funcao
+        print(f"  {nome[:40]:<40}{chamadas:>10}{proprio * 1000:10.1f}ms{acumulado * 1000:10.1f}ms", file=sys.stderr)
+
 def main():
-    if len(sys.argv) != 2:
-        print("Uso: python parse_pdf.py <caminho_do_pdf>", file=sys.stderr)
+    global TIMINGS_ATIVO, PERFIL_ATIVO
+    argumentos = sys.argv[1:]
+    if '--timings' in argumentos:
+        argumentos.remove('--timings')
+        TIMINGS_ATIVO = True
+    if '--profile' in argumentos:
+        argumentos.remove('--profile')
+        PERFIL_ATIVO = True
+    
+    if argumentos and argumentos[0] == '--worker':
+        # --worker [--fd-resposta N]
+        if argumentos[1:2] == ['--fd-resposta'] and len(argumentos) == 3:
+            executar_worker(int(argumentos[2]))
+            return
+        if len(argumentos) == 1:
+            executar_worker()
+            return
+    
+    if argumentos and argumentos[0] == '--startup-report' and len(argumentos) <= 2:
+        if argumentos[1:] and argumentos[1] not in BACKENDS:
+            print(f"Backend desconhecido: {argumentos[1]}", file=sys.stderr)
+            sys.exit(1)
+        relatorio_inicializacao(argumentos[1] if len(argumentos) == 2 else None)
+        return
+    
+    if argumentos and argumentos[0] == '--lote':
+        from lote_pdf import main_lote
+        main_lote(argumentos[1:] + (['--timings'] if TIMINGS_ATIVO else []) + (['--profile'] if PERFIL_ATIVO else []))
+        return
+    
+    if len(argumentos) != 1:
+        print("Uso: python parse_pdf.py [--timings] [--profile] <caminho_do_pdf> | - | --worker [--fd-resposta N] | --lote <entradas...> | --startup-report [backend]", file=sys.stderr)
         sys.exit(1)
     
-    caminho_pdf = sys.argv[1]
+    # "-" lê os bytes do PDF direto do stdin
+    caminho_pdf = sys.stdin.buffer.read() if argumentos[0] == '-' else argumentos[0]
     
+    caminho_perfil = 'stdin.prof' if argumentos[0] == '-' else argumentos[0] + '.prof'
     try:
-        dados = extrair_dados_pdf(caminho_pdf)
+        with perfil_em_arquivo(caminho_perfil) if PERFIL_ATIVO else contextlib.nullcontext():
+            if TIMINGS_ATIVO:
+                dados, tempos = extrair_dados_pdf_com_tempos(caminho_pdf)
+                dados['timings'] = tempos
+            else:
+                dados = extrair_dados_pdf(caminho_pdf)
         # Imprime JSON para stdout para o Node.js capturar
         print(json.dumps(dados, ensure_ascii=False, indent=None))
     except Exception as e:
+        if isinstance(e, LimiteExcedido):
+            registrar_log('aviso', 'limite_excedido', limite=e.limite, maximo=e.maximo)
         print(f"Erro fatal: {str(e)}", file=sys.stderr)
         # Retorna estrutura vazia mas válida em caso de erro
         dados_vazio = {
@@ -5,7 +5,10 @@ import { db } from "./db";
 import { bets } from "@shared/schema";
 import { eq } from "drizzle-orm";
 import { PdfPlumberService } from "./pdf-plumber-service";
-import { insertAccountHolderSchema, insertBettingHouseSchema, insertSurebetSetSchema, insertBetSchema, insertUserSchema } from "@shared/schema";
+import { PdfJobScheduler, QueueFullError, type JobOutcome } from "./pdf-job-scheduler";
+import { PdfDuplicateIndex } from "./pdf-duplicate-index";
+import { PdfLimitExceededError } from "./pdf-worker-pool";
+import { insertAccountHolderSchema, insertBettingHouseSchema, insertSurebetSetSchema, insertBetSchema, insertUserSchema, type OCRResult } from "@shared/schema";
 import { z } from "zod";
 import multer from "multer";
 import { setupAuth, hashPassword } from "./auth";
@@ -25,6 +28,51 @@ const upload = multer({
 });
 
 const pdfPlumberService = new PdfPlumberService();
+const pdfJobScheduler = new PdfJobScheduler({
+  concurrency: pdfPlumberService.concurrency,
+  maxQueued: process.env.PDF_QUEUE_LIMIT ? parseInt(process.env.PDF_QUEUE_LIMIT, 10) : undefined
+});
+// Mesma surebet em PDFs diferentes (bytes diferentes, mesmo conteúdo)
+const pdfDuplicateIndex = new PdfDuplicateIndex({
+  ttlMs: process.env.PDF_DUPLICATE_TTL_MS ? parseInt(process.env.PDF_DUPLICATE_TTL_MS, 10) : undefined,
+  filePath: process.env.PDF_DUPLICATE_INDEX_FILE || undefined
+});
+
+// Resultado de um arquivo do lote (sucesso ou erro), já marcado se for duplicata
+function batchFileResult(userId: string, batchId: string, file: Express.Multer.File, outcome: JobOutcome<OCRResult>) {
+  if (outcome.success) {
+    // Na ordem de chegada: o primeiro PDF de cada surebet fica como original
+    const fingerprint = outcome.value.fingerprint;
+    return {
+      fileName: file.originalname,
+      success: true,
+      data: outcome.value,
+      duplicateOf: fingerprint ? pdfDuplicateIndex.check(userId, fingerprint, file.originalname, batchId) : null
+    };
+  }
+  console.error(`Error processing ${file.originalname}:`, outcome.error);
+  return {
+    fileName: file.originalname,
+    success: false,
+    error: outcome.error.message || "Unknown error",
+    ...(outcome.error instanceof PdfLimitExceededError ? { limitExceeded: limitExceededInfo(outcome.error) } : {}),
+    duplicateOf: null
+  };
+}
+
+// Qual teto do parser o PDF estourou (cpu, tempo, memoria, caracteres_pagina, objetos_pagina)
+function limitExceededInfo(error: PdfLimitExceededError) {
+  return { limit: error.limit, max: error.max };
+}
+
+// Responde 429 quando a fila de PDFs está cheia
+function sendQueueFull(res: any, error: QueueFullError) {
+  res.set('Retry-After', '5');
+  res.status(429).json({
+    error: "PDF queue is full, try again shortly",
+    message: error.message
+  });
+}
 
 export async function registerRoutes(app: Express): Promise<Server> {
   // Setup authentication
@@ -259,7 +307,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
   app.post("/api/surebet-sets", requireAuth, async (req, res) => {
     try {
-      const { surebetSet, bets: setBets } = req.body;
+      const { surebetSet, bets: setBets, source } = req.body;
       
       // Validate number of bets (supports 2 or 3 bets)
       if (!Array.isArray(setBets) || setBets.length < 2 || setBets.length > 3) {
@@ -283,6 +331,11 @@ export async function registerRoutes(app: Express): Promise<Server> {
         const createdBet = await storage.createBet(validatedBet);
         createdBets.push(createdBet);
       }
+
+      // Surebet vinda de um PDF: entra no histórico de duplicatas só depois de gravada
+      if (typeof source?.fingerprint === 'string' && typeof source?.fileName === 'string') {
+        pdfDuplicateIndex.record(req.user!.id, source.fingerprint, source.fileName);
+      }
       
       res.json({
         surebetSet: createdSet,
@@ -475,18 +528,43 @@ export async function registerRoutes(app: Express): Promise<Server> {
       const customPrompt = req.body.prompt || null;
       console.log(`AI OCR disabled; using pdfplumber for PDF processing`);
       
-      const ocrResult = await pdfPlumberService.processDocument(
-        req.file.buffer,
-        req.file.originalname,
-        req.file.mimetype,
-        customPrompt
-      );
+      const file = req.file;
+      const batch = pdfJobScheduler.submitBatch(req.user!.id, [{
+        label: file.originalname,
+        run: () => pdfPlumberService.processDocument(
+          file.buffer,
+          file.originalname,
+          file.mimetype,
+          customPrompt
+        )
+      }]);
+      const [outcome] = await batch.done;
+      if (!outcome.success) {
+        throw outcome.error;
+      }
+      const ocrResult = outcome.value;
+      const duplicateOf = ocrResult.fingerprint
+        ? pdfDuplicateIndex.check(req.user!.id, ocrResult.fingerprint, file.originalname, batch.id)
+        : null;
       
       res.json({
         success: true,
-        data: ocrResult
+        data: ocrResult,
+        duplicateOf
       });
     } catch (error) {
+      if (error instanceof QueueFullError) {
+        sendQueueFull(res, error);
+        return;
+      }
+      if (error instanceof PdfLimitExceededError) {
+        res.status(422).json({
+          error: "PDF exceeds processing limits",
+          message: error.message,
+          limitExceeded: limitExceededInfo(error)
+        });
+        return;
+      }
       console.error("pdfplumber processing error:", error);
       res.status(400).json({ 
         error: "Failed to process OCR",
@@ -507,40 +585,35 @@ export async function registerRoutes(app: Express): Promise<Server> {
 
       console.log(`Batch processing ${files.length} PDF(s)...`);
 
-      const results = await Promise.all(
-        files.map(async (file) => {
-          try {
-            const ocrResult = await pdfPlumberService.processDocument(
-              file.buffer,
-              file.originalname,
-              file.mimetype,
-              undefined
-            );
-
-            return {
-              fileName: file.originalname,
-              success: true,
-              data: ocrResult
-            };
-          } catch (error) {
-            console.error(`Error processing ${file.originalname}:`, error);
-            return {
-              fileName: file.originalname,
-              success: false,
-              error: error instanceof Error ? error.message : "Unknown error"
-            };
-          }
-        })
-      );
+      // Client pode informar o batchId para acompanhar o progresso enquanto espera
+      const batchId = typeof req.body.batchId === 'string' && req.body.batchId ? req.body.batchId : undefined;
+      const batch = pdfJobScheduler.submitBatch(req.user!.id, files.map(file => ({
+        label: file.originalname,
+        run: () => pdfPlumberService.processDocument(
+          file.buffer,
+          file.originalname,
+          file.mimetype,
+          undefined
+        )
+      })), batchId);
+
+      const outcomes = await batch.done;
+      const results = outcomes.map((outcome, index) => batchFileResult(req.user!.id, batch.id, files[index], outcome));
 
       const successCount = results.filter(r => r.success).length;
-      console.log(`Batch processing complete: ${successCount}/${files.length} successful`);
+      const duplicateCount = results.filter(r => r.duplicateOf).length;
+      console.log(`Batch processing complete: ${successCount}/${files.length} successful, ${duplicateCount} duplicate(s)`);
 
       res.json({
         success: true,
+        batchId: batch.id,
         results
       });
     } catch (error) {
+      if (error instanceof QueueFullError) {
+        sendQueueFull(res, error);
+        return;
+      }
       console.error("Batch processing error:", error);
       res.status(500).json({
         error: "Failed to process batch",
@@ -549,6 +622,103 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
 
+  // Streaming batch OCR: one NDJSON event per file as soon as its parser job finishes
+  //   {"type":"batch","batchId","total","queuedAhead"}
+  //   {"type":"result","index","completed","total","queueWaitMs","parseMs",fileName,success,data|error,duplicateOf}
+  //   {"type":"done","batchId","total","successCount"}
+  app.post("/api/ocr/process-batch-stream", requireAuth, upload.array('files', 50), async (req, res) => {
+    const files = req.files as Express.Multer.File[];
+    if (!files || files.length === 0) {
+      res.status(400).json({ error: "No files provided" });
+      return;
+    }
+
+    let batch;
+    const queuedAhead = pdfJobScheduler.queuedJobs;
+    try {
+      batch = pdfJobScheduler.submitBatch(req.user!.id, files.map(file => ({
+        label: file.originalname,
+        run: () => pdfPlumberService.processDocument(
+          file.buffer,
+          file.originalname,
+          file.mimetype,
+          undefined
+        )
+      })));
+    } catch (error) {
+      if (error instanceof QueueFullError) {
+        sendQueueFull(res, error);
+        return;
+      }
+      console.error("Batch streaming error:", error);
+      res.status(500).json({
+        error: "Failed to process batch",
+        message: error instanceof Error ? error.message : "Unknown error"
+      });
+      return;
+    }
+
+    res.status(200);
+    res.setHeader('Content-Type', 'application/x-ndjson; charset=utf-8');
+    res.setHeader('Cache-Control', 'no-cache');
+    res.setHeader('X-Accel-Buffering', 'no');
+    res.flushHeaders();
+
+    // Cliente desconectado: os jobs terminam normalmente, só não há mais para quem escrever
+    let closed = false;
+    res.on('close', () => { closed = true; });
+    const send = (event: Record<string, unknown>) => {
+      if (!closed) {
+        res.write(JSON.stringify(event) + '\n');
+      }
+    };
+
+    const batchId = batch.id;
+    send({ type: 'batch', batchId, total: files.length, queuedAhead });
+
+    let completed = 0;
+    let successCount = 0;
+    await Promise.all(batch.outcomes.map(async (pending, index) => {
+      const outcome = await pending;
+      const job = pdfJobScheduler.getBatchProgress(batchId)?.jobs[index];
+      const result = batchFileResult(req.user!.id, batchId, files[index], outcome);
+      completed++;
+      successCount += result.success ? 1 : 0;
+      send({
+        type: 'result',
+        index,
+        completed,
+        total: files.length,
+        queueWaitMs: job?.startedAt ? job.startedAt - job.queuedAt : null,
+        parseMs: job?.startedAt && job.finishedAt ? job.finishedAt - job.startedAt : null,
+        ...result
+      });
+    }));
+
+    console.log(`Batch streaming complete: ${successCount}/${files.length} successful`);
+    send({ type: 'done', batchId, total: files.length, successCount });
+    res.end();
+  });
+
+  // Progress of a batch submitted to /api/ocr/process-batch
+  app.get("/api/ocr/batches/:id", requireAuth, async (req, res) => {
+    const progress = pdfJobScheduler.getBatchProgress(req.params.id);
+    if (!progress || progress.userId !== req.user!.id) {
+      res.status(404).json({ error: "Batch not found" });
+      return;
+    }
+    res.json(progress);
+  });
+
+  // Parser stage timing histograms (requires PARSE_PDF_TIMINGS=1)
+  app.get("/api/ocr/timings", requireAdmin, async (req, res) => {
+    res.json({
+      histograms: pdfPlumberService.getTimingHistograms(),
+      templates: pdfPlumberService.getTemplateHits(),
+      houseMemo: pdfPlumberService.getHouseMemoStats()
+    });
+  });
+
   const httpServer = createServer(app);
   return httpServer;
 }
\ No newline at end of file
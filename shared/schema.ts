@@ -126,6 +126,7 @@ export type SurebetSetWithBets = SurebetSet & {
 
 // OCR extraction result type - allows null values for missing data (no fallbacks)
 // Supports 2 or 3 bets per surebet
+// houseMatchDistance: edit distance between the printed house name and the catalog name (null = not in catalog)
 export type OCRResult = {
   date: string | null;
   sport: string | null;
@@ -134,6 +135,7 @@ export type OCRResult = {
   teamB: string | null;
   bet1: {
     house: string | null;
+    houseMatchDistance?: number | null;
     odd: number | null;
     type: string | null;
     stake: number | null;
@@ -142,6 +144,7 @@ export type OCRResult = {
   };
   bet2: {
     house: string | null;
+    houseMatchDistance?: number | null;
     odd: number | null;
     type: string | null;
     stake: number | null;
@@ -150,6 +153,7 @@ export type OCRResult = {
   };
   bet3?: {
     house: string | null;
+    houseMatchDistance?: number | null;
     odd: number | null;
     type: string | null;
     stake: number | null;
@@ -157,4 +161,6 @@ export type OCRResult = {
     accountHolder?: string;
   };
   profitPercentage: number | null;
+  // Semantic fingerprint (event date, teams, houses, odds, stakes) used to spot the same surebet in different PDFs
+  fingerprint?: string | null;
 };
\ No newline at end of file